@@ -0,0 +1,57 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_batch.py::Test_batchFitting::test_pool
+import pytest
+import os
+import numpy as np
+
+import pyCGM2
+from pyCGM2.Lib.CGM import batch
+from pyCGM2.Tools import btkTools
+from pyCGM2.Utils import files
+
+DATA_PATH = pyCGM2.TEST_DATA_PATH + "GaitModels\CGM1\\fullBody-native-Options\\"
+OUT_PATH = pyCGM2.TEST_DATA_PATH_OUT + "GaitModels\CGM1\\fullBody-native-Options\\"
+
+
+def _fitting(model,DATA_PATH,reconstructFilenameLabelled,offset,failure=False):
+    # fitting function of a module, so that worker processes can import it
+    if failure:
+        raise Exception("[pyCGM2] fitting failure of the test")
+
+    acq = btkTools.smartReader(str(DATA_PATH + reconstructFilenameLabelled))
+    values = np.zeros((acq.GetPointFrameNumber(),3))
+    values[:,0] = model["value"] + offset
+    btkTools.smartAppendPoint(acq,"batchTest",values)
+    return acq
+
+def _checkBatch(processes):
+    files.createDir(OUT_PATH)
+    suffix = "batch%i"%(processes)
+    for filename in ["static-%s.c3d"%(suffix),"gait1-%s.c3d"%(suffix)]:
+        if os.path.isfile(OUT_PATH + filename):
+            os.remove(OUT_PATH + filename)
+
+    trials = [batch.trial("static.c3d",1.0),
+              batch.trial("gait2.c3d",2.0,failure=True),
+              batch.trial("gait1.c3d",3.0)]
+
+    outputs,errors = batch.fitting(_fitting,{"value":10.0},DATA_PATH,trials,
+                                   OUT_PATH=OUT_PATH,outputSuffix=suffix,processes=processes)
+
+    # the failing trial doesn t stop the batch
+    assert outputs == ["static-%s.c3d"%(suffix),"gait1-%s.c3d"%(suffix)]
+    assert list(errors.keys()) == ["gait2.c3d"]
+    assert "fitting failure of the test" in errors["gait2.c3d"]
+
+    for filename,value in zip(outputs,[11.0,13.0]):
+        acq = btkTools.smartReader(str(OUT_PATH + filename))
+        np.testing.assert_equal(acq.GetPoint("batchTest").GetValues()[:,0],value)
+
+
+class Test_batchFitting:
+
+    def test_sequential(self):
+        _checkBatch(1)
+
+    def test_pool(self):
+        _checkBatch(2)
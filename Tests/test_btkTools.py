@@ -10,6 +10,7 @@ from pyCGM2.Eclipse import vskTools,eclipse
 from pyCGM2 import enums
 
 import pytest
+import numpy as np
 from pyCGM2.Tools import btkTools
 from pyCGM2.Utils import utils
 from pyCGM2 import btk
@@ -74,6 +75,81 @@ class Test_Btk:
         btkTools.smartGetMetadata(acq,"SUBJECTS","USED")
         btkTools.smartSetMetadata(acq,"SUBJECTS","USED",0,"Hän")
 
+    def test_markerBlock(self):
+        filename = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hånnibøl_c3d\\gait1.c3d"
+        acq= btkTools.smartReader(filename, translators=None)
+
+        markers = btkTools.MarkerBlock(acq,["LASI","RASI"])
+        np.testing.assert_equal(markers.getValues("LASI"),acq.GetPoint(utils.str("LASI")).GetValues())
+        np.testing.assert_equal(markers.getFrame(["LASI","RASI"],10)[1,:],acq.GetPoint(utils.str("RASI")).GetValues()[10,:])
+        assert markers.getVisibleMarkersAtFrame(["LASI","RASI"],0) == btkTools.getVisibleMarkersAtFrame(acq,["LASI","RASI"],0)
+
+        # lazy loading
+        np.testing.assert_equal(markers.getValues("LKNE"),acq.GetPoint(utils.str("LKNE")).GetValues())
+
+        # write-back
+        values = markers.getValues("LASI")*2.0
+        markers.setValues("LASI",values)
+        markers.setValues("LASI2",values,desc="toto")
+        assert not btkTools.isPointExist(acq,"LASI2")
+        markers.writeBack()
+        np.testing.assert_equal(acq.GetPoint(utils.str("LASI")).GetValues(),values)
+        np.testing.assert_equal(acq.GetPoint(utils.str("LASI2")).GetValues(),values)
+        assert markers.m_dirty == set()
+
+    def test_validityMask(self):
+        filename = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hånnibøl_c3d\\gait1.c3d"
+        acq= btkTools.smartReader(filename, translators=None)
+
+        labels = ["LASI","RASI","LKNE"]
+        mask = btkTools.getValidityMask(acq,labels)
+
+        flag,vff,vlf = mask.findValidFrames()
+        assert len(flag) == acq.GetPointFrameNumber()
+        assert flag[vff] == 1 and flag[vlf] == 1
+        assert sum(flag[:vff]) == 0 and sum(flag[vlf+1:]) == 0
+        for i in [vff,vlf]:
+            assert mask.getVisibleMarkersAtFrame(i) == btkTools.getVisibleMarkersAtFrame(acq,labels,i)
+
+        np.testing.assert_equal(mask.getMask(["RASI"])[:,0], acq.GetPoint(utils.str("RASI")).GetResiduals()[:,0]>=0)
+        np.testing.assert_equal(btkTools.MarkerBlock(acq).getValidityMask(labels).getMask(),mask.getMask())
+
+    def test_acquisitionIndex(self):
+        filename = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hånnibøl_c3d\\gait1.c3d"
+        acq= btkTools.smartReader(filename, translators=None)
+
+        index = btkTools.AcquisitionIndex(acq)
+        assert index.isPointExist("LASI") == btkTools.isPointExist(acq,"LASI")
+        assert not index.isPointExist("TOTO")
+        np.testing.assert_equal(index.getPoint("LASI").GetValues(),acq.GetPoint(utils.str("LASI")).GetValues())
+
+        values = acq.GetPoint(utils.str("LASI")).GetValues()
+        index.appendPoints([("LASI2",values,btk.btkPoint.Marker,""),
+                            ("LASI3",values*2.0,btk.btkPoint.Marker,"toto")])
+        assert index.isPointExist("LASI3") and btkTools.isPointExist(acq,"LASI3")
+        np.testing.assert_equal(acq.GetPoint(utils.str("LASI3")).GetValues(),values*2.0)
+
+        index.removePoint("LASI2")
+        assert not index.isPointExist("LASI2") and not btkTools.isPointExist(acq,"LASI2")
+
+        # one index per acquisition
+        assert btkTools.AcquisitionIndex(acq).m_labels is index.m_labels
+        btkTools.smartAppendPoint(acq,"LASI4",values)
+        assert index.isPointExist("LASI4")
+
+        # direct btk modifications
+        newPoint = btk.btkPoint(utils.str("LASI5"),acq.GetPointFrameNumber())
+        acq.AppendPoint(newPoint)
+        assert btkTools.isPointExist(acq,"LASI5")
+        acq.RemovePoint(utils.str("LASI4"))
+        assert not btkTools.isPointExist(acq,"LASI4")
+        acq.GetPoint(utils.str("LASI5")).SetLabel(utils.str("LASI6"))
+        assert not btkTools.isPointExist(acq,"LASI5")
+        assert btkTools.isPointExist(acq,"LASI6")
+
+        btkTools.smartAppendAnalog(acq,"Hän-emg2",acq.GetAnalog(0).GetValues())
+        assert btkTools.isAnalogExist(acq,"Hän-emg2") and not btkTools.isAnalogExist(acq,"TOTO")
+
     def test_btkReader_forcePlateType5(self):
         filename = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\forcePlateType5\\hugGait.c3d"
         acq= btkTools.smartReader(filename, translators=None)
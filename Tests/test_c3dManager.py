@@ -0,0 +1,68 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_c3dManager.py::Test_trialCache::test_sharedTrials
+from __future__ import unicode_literals
+import pytest
+import os
+import shutil
+
+import pyCGM2
+from pyCGM2.Processing import c3dManager
+from pyCGM2.Tools import trialTools
+from pyCGM2.Utils import files
+
+DATA_PATH = pyCGM2.TEST_DATA_PATH+"GaitData\CGM1-NormalGaitData-Events\Hånnibøl Lecter\\"
+STATIC_PATH = pyCGM2.TEST_DATA_PATH + "GaitModels\CGM1\\fullBody-native-Options\\"
+OUT_PATH = pyCGM2.TEST_DATA_PATH_OUT+"LowLevel\\trialCache\\"
+
+
+class Test_trialCache:
+
+    def test_sharedTrials(self):
+        filenames = ["gait Trial 01.c3d","gait Trial 02.c3d"]
+
+        cmf = c3dManager.C3dManagerFilter(c3dManager.UniqueC3dSetProcedure(DATA_PATH,filenames))
+        cmf.enableEmg(False)
+        trialManager = cmf.generate()
+
+        # each c3d is read once, its trial is shared between the trial sets
+        assert trialManager.kinetic["Filenames"] != []
+        for trial,filename in zip(trialManager.kinematic["Trials"],trialManager.kinematic["Filenames"]):
+            assert trial is trialManager.spatioTemporal["Trials"][trialManager.spatioTemporal["Filenames"].index(filename)]
+            if filename in trialManager.kinetic["Filenames"]:
+                assert trial is trialManager.kinetic["Trials"][trialManager.kinetic["Filenames"].index(filename)]
+
+    def test_modifiedFile(self):
+        files.createDir(OUT_PATH)
+        shutil.copyfile(DATA_PATH+"gait Trial 01.c3d",OUT_PATH+"gait Trial 01.c3d")
+
+        cache = c3dManager.TrialCache()
+        trial = cache.getTrial(OUT_PATH,"gait Trial 01.c3d")
+        assert cache.getTrial(OUT_PATH,"gait Trial 01.c3d") is trial
+
+        # a new modification time, the file is read again
+        mtime = os.path.getmtime(OUT_PATH+"gait Trial 01.c3d")
+        os.utime(OUT_PATH+"gait Trial 01.c3d",(mtime+10,mtime+10))
+        trial2 = cache.getTrial(OUT_PATH,"gait Trial 01.c3d")
+        assert trial2 is not trial
+        assert cache.getTrial(OUT_PATH,"gait Trial 01.c3d") is trial2
+
+    def test_kineticDetection_eachTrial(self):
+        # a static trial without kinetic first, then a gait trial with kinetic
+        cache = c3dManager.TrialCache()
+        trials = [cache.getTrial(STATIC_PATH,"static.c3d"),
+                  cache.getTrial(DATA_PATH,"gait Trial 01.c3d")]
+        filenames = ["static.c3d","gait Trial 01.c3d"]
+        assert not trialTools.isKineticFlag(trials[0])[0]
+        assert trialTools.isKineticFlag(trials[1])[0]
+
+        kineticTrials,kineticFilenames,flag = trialTools.automaticKineticDetection(None,filenames,trials = trials)
+        assert flag
+        assert kineticFilenames == ["gait Trial 01.c3d"]
+        assert len(kineticTrials) == 1
+        assert kineticTrials[0] is trials[1]
+
+        # same detection as the one reading the files
+        kineticTrials,kineticFilenames,flag = cache.automaticKineticDetection(DATA_PATH,["gait Trial 01.c3d","gait Trial 02.c3d"])
+        assert kineticFilenames == trialTools.automaticKineticDetection(DATA_PATH,["gait Trial 01.c3d","gait Trial 02.c3d"])[1]
+        for trial,filename in zip(kineticTrials,kineticFilenames):
+            assert trial is cache.getTrial(DATA_PATH,filename)
@@ -215,6 +215,43 @@ class TestDifferentStaticDynamicMarkerSet:
 
         assert model.m_bodypart  == enums.BodyPart.UpperLimb
 
+    def test_CGM1_FullBody_noOptions_uncorrectPelvisMarker_savedModel(self):
+        DATA_PATH = pyCGM2.TEST_DATA_PATH + "Scenarii\\different static and dynamic marker set\CGM1-fullBody\\"
+        staticFilename = "static.c3d"
+
+        markerDiameter=14
+        leftFlatFoot = False
+        rightFlatFoot = False
+        headStraight = False
+        pointSuffix = "test"
+
+        vsk = vskTools.Vsk(DATA_PATH + "New Subject.vsk")
+        required_mp,optional_mp = vskTools.getFromVskSubjectMp(vsk, resetFlag=True)
+
+        model,finalAcqStatic = cgm1.calibrate(DATA_PATH,
+            staticFilename,
+            None,
+            required_mp,
+            optional_mp,
+            leftFlatFoot,
+            rightFlatFoot,
+            headStraight,
+            markerDiameter,
+            pointSuffix)
+
+        # the saved model has no motion data ( ex: TopLumbar5 trajectory)
+        files.saveModel(model,DATA_PATH,"testSavedModel")
+        model = files.loadModel(DATA_PATH,"testSavedModel")
+
+        acqGait = cgm1.fitting(model,DATA_PATH, "gait1_noLASI.c3d",
+            None,
+            markerDiameter,
+            pointSuffix,
+            None,
+            enums.MomentProjection.Proximal)
+
+        assert model.m_bodypart  == enums.BodyPart.UpperLimb
+
 
     def test_CGM24_FullBody_noOptions_uncorrectUpperLimbMarker(self):
         DATA_PATH = pyCGM2.TEST_DATA_PATH + "Scenarii\\different static and dynamic marker set\\CGM24-fullBody\\"
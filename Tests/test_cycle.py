@@ -0,0 +1,62 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_cycle.py::Test_trialContext::test_gaitCycles
+from __future__ import unicode_literals
+import pytest
+import numpy as np
+
+import pyCGM2
+from pyCGM2 import ma
+from pyCGM2.Processing import cycle
+from pyCGM2.Tools import trialTools
+from pyCGM2.Utils import utils
+
+DATA_PATH = pyCGM2.TEST_DATA_PATH+"GaitData\CGM1-NormalGaitData-Events\Hånnibøl Lecter\\"
+
+STP_LABELS = ["duration","cadence","stanceDuration","stepDuration","swingDuration","simpleStanceDuration",
+              "stancePhase","swingPhase","stepPhase","simpleStance",
+              "strideLength","strideWidth","stepLength","speed"]
+
+
+def _gaitCyclesWithoutContext(trial):
+    # cycles at the foot strikes read from the trial, each cycle extracts its own trial data
+    gaitCycles=list()
+    for context in ["Left","Right"]:
+        fs_times = [ev.time() for ev in trial.findChild(ma.T_Node,utils.str("SortedEvents")).findChildren(ma.T_Event,utils.str("Foot Strike"),[["context",utils.str(context)]])]
+        for i in range(0, len(fs_times)-1):
+            gaitCycles.append(cycle.GaitCycle(trial, fs_times[i],fs_times[i+1],context))
+    return gaitCycles
+
+def _events(cycleInstance,context):
+    return [(ev.name(),ev.context(),ev.time()) for ev in cycleInstance.getEvents(context=context).findChildren(ma.T_Event)]
+
+
+class Test_trialContext:
+
+    def test_gaitCycles(self):
+
+        for filename in ["gait Trial 01.c3d","gait Trial 02.c3d"]:
+            trial = trialTools.smartTrialReader(DATA_PATH,filename)
+
+            cycles = cycle.construcGaitCycle(trial)
+            cyclesWithoutContext = _gaitCyclesWithoutContext(trial)
+
+            assert len(cycles) != 0
+            assert len(cycles) == len(cyclesWithoutContext)
+            # a single context shared by the cycles of the trial
+            assert len(set([id(it.m_trialContext) for it in cycles])) == 1
+
+            for cycle1,cycle2 in zip(cycles,cyclesWithoutContext):
+                assert (cycle1.context,cycle1.begin,cycle1.end,cycle1.firstFrame) == (cycle2.context,cycle2.begin,cycle2.end,cycle2.firstFrame)
+                assert (cycle1.m_oppositeFO,cycle1.m_oppositeFS,cycle1.m_contraFO) == (cycle2.m_oppositeFO,cycle2.m_oppositeFS,cycle2.m_contraFO)
+
+                for label in STP_LABELS:
+                    np.testing.assert_equal(cycle1.getSpatioTemporalParameter(label),cycle2.getSpatioTemporalParameter(label))
+
+                for context in ["All","Left"]:
+                    assert _events(cycle1,context) == _events(cycle2,context)
+
+                # point data, also compared with the time sequence read from the trial
+                for label in ["LHEE","RHEE","LTOE","RTOE","LASI"]:
+                    data = trial.findChild(ma.T_TimeSequence,utils.str(label)).data()[cycle1.begin-cycle1.firstFrame:cycle1.end-cycle1.firstFrame+1,0:3]
+                    np.testing.assert_equal(cycle1.getPointTimeSequenceData(label),data)
+                    np.testing.assert_equal(cycle2.getPointTimeSequenceData(label),data)
@@ -0,0 +1,90 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_events.py::Test_zeni::test_zeniFiles
+import pytest
+import os
+import numpy as np
+
+import pyCGM2
+from pyCGM2 import btk
+from pyCGM2.Events import events
+from pyCGM2.Lib import eventDetector
+from pyCGM2.Tools import btkTools
+from pyCGM2.Utils import files
+
+DATA_PATH = pyCGM2.TEST_DATA_PATH + "GaitModels\CGM1\\fullBody-native-Options\\"
+OUT_PATH = pyCGM2.TEST_DATA_PATH_OUT + "Events\\zeniFiles\\"
+
+
+class CountingZeniProcedure(events.ZeniProcedure):
+    # Zeni procedure recording its outputs
+
+    def __init__(self):
+        super(CountingZeniProcedure, self).__init__()
+        self.outputs = list()
+
+    def detect(self,acq):
+        outputs = super(CountingZeniProcedure, self).detect(acq)
+        self.outputs.append(outputs)
+        return outputs
+
+
+def _events(acq):
+    return sorted([(str(it.GetLabel()),str(it.GetContext()),it.GetTime()) for it in btk.Iterate(acq.GetEvents())])
+
+def _sequentialEvents(filename):
+    acq = btkTools.smartReader(str(DATA_PATH + filename))
+    acq.ClearEvents()
+    evf = events.EventFilter(events.ZeniProcedure(),acq)
+    evf.detect()
+    return _events(acq),evf.getState()
+
+def _assertEvents(events1,events2):
+    assert [(label,context) for label,context,time in events1] == [(label,context) for label,context,time in events2]
+    np.testing.assert_almost_equal([time for label,context,time in events1],[time for label,context,time in events2],decimal=6)
+
+
+class Test_zeni:
+
+    def test_zeniFiles(self):
+        filenames = ["gait1.c3d","gait2.c3d"]
+
+        for processes in [1,2]:
+            outPath = OUT_PATH + "processes%i\\"%(processes)
+            files.createDir(outPath)
+            for filename in filenames:
+                if os.path.isfile(outPath + filename):
+                    os.remove(outPath + filename)
+
+            states,errors = eventDetector.zeniFiles(DATA_PATH,filenames,OUT_PATH=outPath,processes=processes)
+
+            assert errors == dict()
+            for filename in filenames:
+                sequentialEvents,state = _sequentialEvents(filename)
+                assert states[filename] == state
+                assert len(sequentialEvents) != 0
+                _assertEvents(_events(btkTools.smartReader(str(outPath + filename))),sequentialEvents)
+
+    def test_detectOnce(self):
+        # events are built from a single run of the procedure ( no progression cache needed)
+        acq = btkTools.smartReader(str(DATA_PATH + "gait1.c3d"))
+        acq.ClearEvents()
+        pf = acq.GetPointFrequency()
+
+        procedure = CountingZeniProcedure()
+        evf = events.EventFilter(procedure,acq)
+        evf.detect()
+
+        assert len(procedure.outputs) == 1
+        indexes_fs_left, indexes_fo_left, indexes_fs_right, indexes_fo_right = procedure.outputs[0]
+
+        expected = [("Foot Strike","Left",(ind-1)/pf) for ind in indexes_fs_left] + \
+                   [("Foot Off","Left",(ind-1)/pf) for ind in indexes_fo_left] + \
+                   [("Foot Strike","Right",(ind-1)/pf) for ind in indexes_fs_right] + \
+                   [("Foot Off","Right",(ind-1)/pf) for ind in indexes_fo_right]
+        _assertEvents(_events(acq),sorted(expected))
+
+        # a new run gives the same events
+        evf.detect()
+        assert len(procedure.outputs) == 2
+        for outputs1,outputs2 in zip(procedure.outputs[0],procedure.outputs[1]):
+            np.testing.assert_equal(outputs1,outputs2)
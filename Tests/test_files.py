@@ -10,6 +10,7 @@ from pyCGM2.Eclipse import vskTools,eclipse
 from pyCGM2 import enums
 
 import pytest
+import numpy as np
 from pyCGM2.Tools import btkTools
 
 
@@ -32,12 +33,74 @@ class Test_UtilsFiles:
         assert model !=False
         files.saveModel(model,pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","testModelOut")
 
+        model2 = files.loadModel(pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","testModelOut")
+        assert model2.mp == model.mp
+        for segment in model2.m_segmentCollection:
+            assert len(segment.anatomicalFrame.motion) == 0
+            np.testing.assert_equal(segment.anatomicalFrame.static.getRotation(),model.getSegment(segment.name).anatomicalFrame.static.getRotation())
+
     def test_loadAndSaveAnalysis(self):
 
         ana = files.loadAnalysis(pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","file")
         assert ana !=False
         files.saveAnalysis(ana,pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","testAnalysisOut")
 
+    def test_analysisStorage(self):
+
+        ana = files.loadAnalysis(pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","file")
+        files.saveAnalysis(ana,pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","testAnalysisStorageOut")
+        ana2 = files.loadAnalysis(pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\","testAnalysisStorageOut")
+
+        assert set(ana2.kinematicStats.data.keys()) == set(ana.kinematicStats.data.keys())
+        for key in ana.kinematicStats.data.keys():
+            np.testing.assert_equal(ana2.kinematicStats.data[key]["mean"],ana.kinematicStats.data[key]["mean"])
+            np.testing.assert_equal(np.array(ana2.kinematicStats.data[key]["values"]),np.array(ana.kinematicStats.data[key]["values"]))
+        for key in ana.stpStats.keys():
+            np.testing.assert_equal(ana2.stpStats[key]["mean"],ana.stpStats[key]["mean"])
+
+    def test_analysisStorage_replace(self):
+        path = pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\"
+
+        ana = files.loadAnalysis(path,"file")
+        files.saveAnalysis(ana,path,"testAnalysisReplaceOut")
+
+        ana2 = files.loadAnalysis(path,"testAnalysisReplaceOut")
+        key = list(ana2.kinematicStats.data.keys())[0]
+        mean = np.array(ana2.kinematicStats.data[key]["mean"])
+        ana3 = files.loadAnalysis(path,"testAnalysisReplaceOut")
+
+        # replace the file. loaded analyses are read in memory first
+        ana.kinematicStats.data[key]["mean"] = np.zeros(mean.shape)
+        files.saveAnalysis(ana,path,"testAnalysisReplaceOut")
+        np.testing.assert_equal(ana2.kinematicStats.data[key]["mean"],mean)
+        np.testing.assert_equal(ana3.kinematicStats.data[key]["mean"],mean)
+        assert not isinstance(ana3.kinematicStats.data[key]["mean"],np.memmap)
+
+        ana4 = files.loadAnalysis(path,"testAnalysisReplaceOut")
+        np.testing.assert_equal(ana4.kinematicStats.data[key]["mean"],np.zeros(mean.shape))
+
+        # a file modified outside saveAnalysis is not read silently
+        ana5 = files.loadAnalysis(path,"testAnalysisReplaceOut")
+        with open(path+"testAnalysisReplaceOut-pyCGM2.analysis","ab") as f:
+            f.write(b"0")
+        with pytest.raises(Exception):
+            ana5.kinematicStats.data[key]["std"]
+
+    def test_analysisStorage_numpyInfos(self):
+        path = pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\"
+
+        ana = files.loadAnalysis(path,"file")
+        ana.subjectInfo = {"Name":"Hannibal", "Bodymass": np.float64(71.0), "Age": np.int64(40)}
+        ana.modelInfo = {"Type":"CGM1", "LeftLegLength": np.float64(800.5)}
+        ana.experimentalInfo = {"Condition":"Barefoot", "Trials": np.int64(2), "Speeds": np.array([1.2,1.3])}
+        files.saveAnalysis(ana,path,"testAnalysisNumpyInfosOut")
+
+        ana2 = files.loadAnalysis(path,"testAnalysisNumpyInfosOut")
+        assert ana2.subjectInfo == {"Name":"Hannibal", "Bodymass": 71.0, "Age": 40}
+        assert ana2.modelInfo == {"Type":"CGM1", "LeftLegLength": 800.5}
+        assert ana2.experimentalInfo["Trials"] == 2
+        np.testing.assert_equal(ana2.experimentalInfo["Speeds"],[1.2,1.3])
+
     def test_getTranslators(self):
         translators = files.getTranslators(pyCGM2.TEST_DATA_PATH + "\\LowLevel\\IO\\Hänibàl_files\\", translatorType = "CGM1.translators")
         assert translators !=False
@@ -17,6 +17,7 @@ from pyCGM2 import log; log.setLoggingLevel(logging.INFO)
 from pyCGM2.Tools import  btkTools
 from pyCGM2.ForcePlates import forceplates
 from pyCGM2.Utils import utils
+from pyCGM2 import btk
 
 import numpy as np
 
@@ -181,3 +182,76 @@ class Test_manualAssigment:
 
         assignedMappedForcePlate4 = forceplates.matchingFootSideOnForceplate(acqGait,mfpa="AXAXXX")
         assert assignedMappedForcePlate4 == "RXR"
+
+
+def _perCallWrenchs(acq):
+    # btk pipelines as run by each force plate function before ForcePlateWrenchs
+    pfe = btk.btkForcePlatformsExtractor()
+    pfe.SetInput(acq)
+    pfc = pfe.GetOutput()
+    pfc.Update()
+
+    grwf = btk.btkGroundReactionWrenchFilter()
+    grwf.SetInput(pfc)
+    grwc = grwf.GetOutput()
+    grwc.Update()
+
+    pfwf = btk.btkForcePlatformWrenchFilter()
+    pfwf.SetInput(pfc)
+    pfwc = pfwf.GetOutput()
+    pfwc.Update()
+
+    return pfc,grwc,pfwc
+
+def _assertWrenchs(wrenchs1,wrenchs2):
+    assert wrenchs1.GetItemNumber() == wrenchs2.GetItemNumber()
+    for i in range(0,wrenchs1.GetItemNumber()):
+        for getter in ["GetPosition","GetForce","GetMoment"]:
+            np.testing.assert_equal(getattr(wrenchs1.GetItem(i),getter)().GetValues(),
+                                    getattr(wrenchs2.GetItem(i),getter)().GetValues())
+
+def _events(acq):
+    return sorted([(str(it.GetLabel()),str(it.GetContext()),it.GetFrame()) for it in btk.Iterate(acq.GetEvents())])
+
+
+class Test_forcePlateWrenchs:
+
+    def test_wrenchs(self):
+        MAIN_PATH = pyCGM2.TEST_DATA_PATH + "LowLevel\\ForcePlate\\ForcePlateAssignment\\"
+        acqGait = btkTools.smartReader(str(MAIN_PATH +  "walking_Y_3pf.c3d"))
+
+        pfc,grwc,pfwc = _perCallWrenchs(acqGait)
+        wrenchs = forceplates.ForcePlateWrenchs(acqGait)
+
+        assert wrenchs.getForcePlatforms().GetItemNumber() == pfc.GetItemNumber()
+        for i in range(0,pfc.GetItemNumber()):
+            for corner in range(0,4):
+                np.testing.assert_equal(wrenchs.getForcePlatforms().GetItem(i).GetCorner(corner),pfc.GetItem(i).GetCorner(corner))
+        _assertWrenchs(wrenchs.getGroundReactionWrenchs(),grwc)
+        _assertWrenchs(wrenchs.getForcePlatformWrenchs(),pfwc)
+
+        # pipelines run once
+        grwf = wrenchs.m_groundReactionWrenchFilter
+        wrenchs.getGroundReactionWrenchs()
+        assert wrenchs.m_groundReactionWrenchFilter is grwf
+
+    def test_sharedWrenchs(self):
+        MAIN_PATH = pyCGM2.TEST_DATA_PATH + "LowLevel\\ForcePlate\\ForcePlateAssignment\\"
+
+        for gaitFilename in ["walking_oppositeX_2pf.c3d","walking_Y_3pf.c3d"]:
+            # each function extracts its own wrenchs
+            acqGait1 = btkTools.smartReader(str(MAIN_PATH +  gaitFilename))
+            mappedForcePlate1 = forceplates.matchingFootSideOnForceplate(acqGait1)
+            forceplates.addForcePlateGeneralEvents(acqGait1,mappedForcePlate1)
+
+            # wrenchs extracted once and shared
+            acqGait2 = btkTools.smartReader(str(MAIN_PATH +  gaitFilename))
+            wrenchs = forceplates.ForcePlateWrenchs(acqGait2)
+            mappedForcePlate2 = forceplates.matchingFootSideOnForceplate(acqGait2,wrenchs=wrenchs)
+            forceplates.addForcePlateGeneralEvents(acqGait2,mappedForcePlate2,wrenchs=wrenchs)
+
+            assert mappedForcePlate2 == mappedForcePlate1
+            assert _events(acqGait2) == _events(acqGait1)
+            for i in range(0,wrenchs.getForcePlatforms().GetItemNumber()):
+                label = str("fp%icorner0"%(i))
+                np.testing.assert_equal(acqGait2.GetPoint(label).GetValues(),acqGait1.GetPoint(label).GetValues())
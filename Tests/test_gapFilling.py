@@ -0,0 +1,139 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_gapFilling.py::Test_lowDimensionalKalmanFilter::test_localWindows
+import pytest
+import numpy as np
+
+import pyCGM2
+from pyCGM2.Utils import testingUtils
+from pyCGM2.Gap import gapFilling
+
+# first frames of a smoothed sequence. The filter starts from a 1e12 covariance, so these frames
+# are ill-conditioned and only agree with the baseline smoother to about 2% of the signal range
+ILL_CONDITIONED_FRAMES = 5
+
+
+def _trajectories(frameNumber=1000,markerNumber=5):
+    # low dimensional synthetic trajectories
+    t = np.linspace(0,10,frameNumber)
+    base = np.array([np.sin(2*np.pi*0.9*t),np.cos(2*np.pi*0.9*t),
+                     np.sin(2*np.pi*1.8*t),np.cos(2*np.pi*1.8*t),
+                     np.sin(2*np.pi*2.7*t),np.cos(2*np.pi*2.7*t)]).T
+    randomState = np.random.RandomState(0)
+    return np.dot(base,randomState.randn(6,3*markerNumber)*100) + randomState.randn(3*markerNumber)*500
+
+def _rawdata(trajectories,gaps):
+    rawdata = trajectories.copy()
+    for index,begin,end in gaps:
+        rawdata[begin:end,3*index:3*index+3] = np.nan
+    return rawdata
+
+def _filledValues(procedure,acq):
+    gapFilling.GapFillingFilter(procedure,acq).fill()
+    return np.concatenate([acq.GetPoint(str("M%i"%(i))).GetValues() for i in range(0,acq.GetPointNumber())],axis=1)
+
+def _baselineSmooth(rawdata,tol,sigR,seed=0):
+    # smoother of pyCGM2 before the rewrite with preallocated arrays and solves
+    np.random.seed(seed)
+
+    X = rawdata[~np.isnan(rawdata).any(axis=1)]
+    m = np.mean(X,axis=0)
+    U, S, V = np.linalg.svd(X - m)
+    d = np.nonzero(np.cumsum(S)/np.sum(S)>(1-tol))[0][0]
+    Q = np.dot(np.dot(V[0:d,:],np.diag(np.std(np.diff(X,axis=0),axis=0))),V[0:d,:].T)
+
+    state = []
+    state_pred = []
+    cov_pred = []
+    cov = []
+    cov.insert(0,1e12*np.eye(d))
+    state.insert(0,np.random.normal(0.0,1.0,d))
+    cov_pred.insert(0,1e12*np.eye(d))
+    state_pred.insert(0,np.random.normal(0.0,1.0,d))
+    for i in range(1,rawdata.shape[0]+1):
+        z =  rawdata[i-1,~np.isnan(rawdata[i-1,:])]
+        H = np.diag(~np.isnan(rawdata[i-1,:]))
+        H = H[~np.all(H == 0, axis=1)]
+        Ht = np.dot(H,V[0:d,:].T)
+        R = sigR*np.eye(H.shape[0])
+
+        state_pred.insert(i,state[i-1])
+        cov_pred.insert(i,cov[i-1] + Q)
+        K = np.dot(np.dot(cov_pred[i],Ht.T),np.linalg.inv(np.dot(np.dot(Ht,cov_pred[i]),Ht.T) + R))
+        state.insert(i,state_pred[i] + np.dot(K,(z - (np.dot(Ht,state_pred[i])+np.dot(H,m)))))
+        cov.insert(i,np.dot(np.eye(d) - np.dot(K,Ht),cov_pred[i]))
+
+    y = np.zeros(rawdata.shape)
+    y[-1,:] = np.dot(V[0:d,:].T,state[-1]) + m
+    for i in range(len(state)-2,0,-1):
+        state[i] =  state[i] + np.dot(np.dot(cov[i],np.linalg.inv(cov_pred[i])),(state[i+1] - state_pred[i+1]))
+        cov[i] =  cov[i] + np.dot(np.dot(np.dot(cov[i],np.linalg.inv(cov_pred[i])),(cov[i+1] - cov_pred[i+1])),cov[i])
+        y[i-1,:] = np.dot(V[0:d,:].T,state[i]) + m
+
+    y[~np.isnan(rawdata)] = rawdata[~np.isnan(rawdata)]
+    return y
+
+def _assertBaseline(values,rawdata,signalRange,tol=1e-2,sigR=1e-3):
+    baseline = _baselineSmooth(rawdata,tol,sigR)
+    np.testing.assert_array_less(np.abs(values-baseline)[ILL_CONDITIONED_FRAMES:],1e-6*signalRange)
+    np.testing.assert_array_less(np.abs(values-baseline)[0:ILL_CONDITIONED_FRAMES],0.02*signalRange)
+
+
+class Test_lowDimensionalKalmanFilter:
+
+    def test_smooth(self):
+        trajectories = _trajectories()
+        signalRange = np.ptp(trajectories)
+
+        for gaps in [[(0,0,20),(2,500,530),(1,560,580)],
+                     [(0,100,300)],
+                     [(3,400,450),(4,420,470)]]:
+            rawdata = _rawdata(trajectories,gaps)
+            values = gapFilling.LowDimensionalKalmanFilterProcedure()._smooth(rawdata,tol=1e-2,sigR=1e-3)
+            _assertBaseline(values,rawdata,signalRange)
+
+    def test_localWindows(self):
+        trajectories = _trajectories()
+        signalRange = np.ptp(trajectories)
+        # gap at the trial edge, and two close gaps sharing a window
+        gaps = [(0,0,20),(2,500,530),(1,560,580)]
+        rawdata = _rawdata(trajectories,gaps)
+
+        whole = _filledValues(gapFilling.LowDimensionalKalmanFilterProcedure(),testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+        procedure = gapFilling.LowDimensionalKalmanFilterProcedure(localWindows=True)
+        local = _filledValues(procedure,testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+
+        windows = procedure._windows(rawdata)
+        assert windows == [(0,120),(400,680)]
+
+        # complete frames are kept, each window is the baseline smoothing of its frames
+        gapMask = np.isnan(rawdata)
+        np.testing.assert_equal(local[~gapMask],trajectories[~gapMask])
+        for begin,end in windows:
+            _assertBaseline(local[begin:end],rawdata[begin:end],signalRange)
+
+        # the subspace of a window differs from the whole trial one ( about 3% of the signal range here)
+        assert np.abs(local-whole)[gapMask].max() < 0.05*signalRange
+
+        # windows smoothed by a process pool
+        parallel = _filledValues(gapFilling.LowDimensionalKalmanFilterProcedure(localWindows=True,processes=2),testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+        np.testing.assert_equal(parallel,local)
+
+    def test_localWindows_fallback(self):
+        trajectories = _trajectories()
+        # a gap larger than maxWindowRatio of the trial
+        gaps = [(0,100,700)]
+
+        procedure = gapFilling.LowDimensionalKalmanFilterProcedure(localWindows=True)
+        assert procedure._windows(_rawdata(trajectories,gaps)) is None
+
+        whole = _filledValues(gapFilling.LowDimensionalKalmanFilterProcedure(),testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+        local = _filledValues(procedure,testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+        np.testing.assert_equal(local,whole)
+
+    def test_seed(self):
+        trajectories = _trajectories()
+        gaps = [(0,0,20),(2,500,530)]
+
+        values1 = _filledValues(gapFilling.LowDimensionalKalmanFilterProcedure(seed=3),testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+        values2 = _filledValues(gapFilling.LowDimensionalKalmanFilterProcedure(seed=3),testingUtils.syntheticAcquisition(trajectories,gaps=gaps))
+        np.testing.assert_equal(values1,values2)
@@ -50,3 +50,22 @@ class Test_gpsPlotTest():
         pf.plot()
 
         #plt.show()
+
+    def test_multipleAnalyses(self):
+
+        DATA_PATH = pyCGM2.TEST_DATA_PATH+"GaitData\CGM1-NormalGaitData-Events\Hånnibøl Lecter\\"
+
+        analysis1 = analysis.makeAnalysis(DATA_PATH,["gait Trial 01.c3d"])
+        analysis2 = analysis.makeAnalysis(DATA_PATH,["gait Trial 02.c3d"])
+        analysis3 = analysis.makeAnalysis(DATA_PATH,["gait Trial 02.c3d"])
+
+        ndp = normativeDatasets.Schwartz2008("Free")
+        scf = scores.MultipleScoreFilter(scores.CGM1_GPS(),[analysis1,analysis2], ndp)
+        scf.compute()
+
+        scf = scores.ScoreFilter(scores.CGM1_GPS(),analysis3, ndp)
+        scf.compute()
+
+        np.testing.assert_almost_equal(analysis2.gps["Overall"]["values"],analysis3.gps["Overall"]["values"])
+        for key in analysis3.gvs.keys():
+            np.testing.assert_almost_equal(analysis2.gvs[key]["values"],analysis3.gvs[key]["values"])
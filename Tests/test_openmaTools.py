@@ -13,8 +13,42 @@ import pytest
 from pyCGM2.Tools import trialTools
 from pyCGM2.Utils import utils
 from pyCGM2 import btk
+from pyCGM2 import ma
 
 
 class Test_openma:
     def test_reader(self):
         trial = trialTools.smartTrialReader(pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hånnibøl_c3d\\","static.c3d")
+
+    def test_timeSequenceIndex(self):
+        trial = trialTools.smartTrialReader(pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hånnibøl_c3d\\","gait1.c3d")
+
+        index = trialTools.getTimeSequenceIndex(trial)
+        assert index is trialTools.getTimeSequenceIndex(trial)
+        assert trialTools.isTimeSequenceExist(trial,"LASI")
+        assert not trialTools.isTimeSequenceExist(trial,"TOTO")
+        assert index.getData("TOTO") is None
+        assert (index.getData("LASI") == trial.findChild(ma.T_TimeSequence,utils.str("LASI")).data()).all()
+
+        # read-only data
+        assert not index.getData("LASI").flags.writeable
+
+    def test_timeSequenceIndex_modification(self):
+        root = ma.io.read(utils.str(pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hånnibøl_c3d\\gait1.c3d"))
+        trial = root.findChild(ma.T_Trial)
+        index = trialTools.getTimeSequenceIndex(trial)
+
+        # another proxy of the same trial shares the index
+        assert trialTools.getTimeSequenceIndex(root.findChild(ma.T_Trial)) is index
+
+        # modified data
+        ts = trial.findChild(ma.T_TimeSequence,utils.str("LASI"))
+        values = ts.data()
+        values[:,0] = values[:,0] + 10.0
+        ts.setData(values)
+        assert (index.getData("LASI") == values).all()
+
+        # renamed time sequence
+        ts.setName(utils.str("LASI_renamed"))
+        assert not index.isTimeSequenceExist("LASI")
+        assert (index.getData("LASI_renamed") == values).all()
@@ -0,0 +1,48 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_segment.py::Test_Segment::test_pickleKinematicCache
+import pytest
+import numpy as np
+import cPickle
+
+import pyCGM2
+from pyCGM2 import enums
+from pyCGM2.Model import model,frame
+
+
+def _motion(frameNumber=100,speed=1.0):
+    # rotation about the z-axis
+    angles = np.linspace(0,speed,frameNumber)
+    rotations = np.zeros((frameNumber,3,3))
+    rotations[:,0,0] = np.cos(angles)
+    rotations[:,0,1] = -np.sin(angles)
+    rotations[:,1,0] = np.sin(angles)
+    rotations[:,1,1] = np.cos(angles)
+    rotations[:,2,2] = 1
+    return rotations,np.zeros((frameNumber,3))
+
+
+class Test_Segment:
+
+    def test_pickleKinematicCache(self):
+        segment = model.Segment("Left Thigh",1,enums.SegmentSide.Left)
+        rotations,translations = _motion()
+        segment.anatomicalFrame.motion = frame.MotionFrames(rotations,translations)
+        # a motion modified twice
+        segment.anatomicalFrame.motion.setData(rotations,translations)
+
+        omega = segment.getAngularVelocity(100.0)
+        np.testing.assert_almost_equal(omega[1:-1,2],np.ones(98)*100/99.0,decimal=3)
+
+        # the modification counter is persisted, the cache is not
+        loaded = cPickle.loads(cPickle.dumps(segment,cPickle.HIGHEST_PROTOCOL))
+        assert loaded.anatomicalFrame.motion.getVersion() == segment.anatomicalFrame.motion.getVersion()
+        assert loaded.m_kinematicCache == dict()
+        np.testing.assert_equal(loaded.getAngularVelocity(100.0),omega)
+
+        # a new motion after unpickling is never served from the cache
+        loaded = cPickle.loads(cPickle.dumps(segment,cPickle.HIGHEST_PROTOCOL))
+        loaded.anatomicalFrame.motion.setData(*_motion(speed=2.0))
+        np.testing.assert_almost_equal(loaded.getAngularVelocity(100.0)[1:-1,2],np.ones(98)*200/99.0,decimal=3)
+
+        # the original segment keeps its cache
+        assert segment.getAngularVelocity(100.0) is omega
@@ -2,16 +2,28 @@
 # pytest -s --disable-pytest-warnings  test_signal.py::Test_filtering::test_markerFilteringCGM23
 
 import pytest
+import numpy as np
 import matplotlib.pyplot as plt
+from scipy import signal
 
 
 import pyCGM2
 from pyCGM2.Tools import btkTools
 from pyCGM2.Signal import signal_processing
-from pyCGM2.Utils import files
-
+from pyCGM2.Utils import files,testingUtils
 
 
+def _filterZeros(array,b,a):
+    # previous per-coordinate implementation of markerFiltering
+    out = np.zeros(len(array))
+    padded = np.concatenate(([0],(array!=0).astype(int),[0]))
+    steps = np.diff(padded)
+    for begin,end in zip(np.where(steps==1)[0],np.where(steps==-1)[0]):
+        padlen = 3 * max(len(a), len(b))
+        if end-begin <= padlen:
+            padlen = end-begin - 1
+        out[begin:end] = signal.filtfilt(b, a, array[begin:end] ,padlen=padlen)
+    return out
 
 class Test_filtering:
     def test_markerFiltering_noGap(self):
@@ -70,3 +82,37 @@ class Test_filtering:
         plt.plot(array1,'-r')
 
         plt.show()
+
+    def test_markerFiltering_syntheticGaps(self):
+        # random walks of 3 markers
+        trajectories = np.cumsum(np.random.RandomState(1).randn(300,9),axis=0)+100
+        acq = testingUtils.syntheticAcquisition(trajectories,labels=["A","B","C"])
+
+        # gap of a single coordinate, at the trial edge
+        values = acq.GetPoint("A").GetValues()
+        values[0:10,1] = 0
+        values[100:150,1] = 0
+        acq.GetPoint("A").SetValues(values)
+        # gaps of the whole marker
+        values = acq.GetPoint("B").GetValues()
+        values[50:60,:] = 0
+        values[295:,:] = 0
+        acq.GetPoint("B").SetValues(values)
+
+        b,a = signal.butter(4, 6.0 / (100*0.5) , btype='lowpass')
+        expected = dict()
+        for label in ["A","B","C"]:
+            values = acq.GetPoint(label).GetValues()
+            expected[label] = np.array([_filterZeros(values[:,i],b,a) for i in range(0,3)]).T
+
+        signal_processing.markerFiltering(acq,["A","B","C"],zerosFiltering=True,order=4, fc =6.0)
+        for label in ["A","B","C"]:
+            np.testing.assert_almost_equal(acq.GetPoint(label).GetValues(),expected[label])
+
+        # second-order sections
+        acqSos = testingUtils.syntheticAcquisition(trajectories,labels=["A","B","C"])
+        acqBa = testingUtils.syntheticAcquisition(trajectories,labels=["A","B","C"])
+        signal_processing.markerFiltering(acqSos,["A","B","C"],order=4, fc =6.0,sos=True)
+        signal_processing.markerFiltering(acqBa,["A","B","C"],order=4, fc =6.0)
+        for label in ["A","B","C"]:
+            np.testing.assert_almost_equal(acqSos.GetPoint(label).GetValues(),acqBa.GetPoint(label).GetValues())
@@ -41,42 +41,25 @@ class ZeniProcedure(object):
             pff = progressionFrame.ProgressionFrameFilter(acq,pfp)
             pff.compute()
             progressionAxis = pff.outputs["progressionAxis"]
-            globalFrame = pff.outputs["globalFrame"]
             forwardProgression = pff.outputs["forwardProgression"]
 
-
             longAxisIndex = 0 if progressionAxis == "X" else 1
+            sign = 1.0 if forwardProgression else -1.0
 
-            sacrum=(acq.GetPoint("LPSI").GetValues() + acq.GetPoint("RPSI").GetValues()) / 2.0
-
-            #Left
-            heel_left = acq.GetPoint("LHEE").GetValues()
-            toe_left = acq.GetPoint("LTOE").GetValues()
-
-            diffHeel_left = heel_left-sacrum
-            diffToe_left = toe_left-sacrum
-
-            #Right
-            heel_right = acq.GetPoint("RHEE").GetValues()
-            toe_right = acq.GetPoint("RTOE").GetValues()
+            # sacrum relative positions along the progression axis
+            sacrum=(acq.GetPoint("LPSI").GetValues()[:,longAxisIndex] + acq.GetPoint("RPSI").GetValues()[:,longAxisIndex]) / 2.0
 
-            diffHeel_right = heel_right-sacrum
-            diffToe_right = toe_right-sacrum
+            diffHeel_left = sign*(acq.GetPoint("LHEE").GetValues()[:,longAxisIndex]-sacrum)
+            diffToe_left = sign*(acq.GetPoint("LTOE").GetValues()[:,longAxisIndex]-sacrum)
 
+            diffHeel_right = sign*(acq.GetPoint("RHEE").GetValues()[:,longAxisIndex]-sacrum)
+            diffToe_right = sign*(acq.GetPoint("RTOE").GetValues()[:,longAxisIndex]-sacrum)
 
-            if  forwardProgression:
-                indexes_fs_left = detect_peaks.detect_peaks(diffHeel_left[:,longAxisIndex])+ff
-                indexes_fo_left = detect_peaks.detect_peaks(-diffToe_left[:,longAxisIndex])+ff
-            else:
-                indexes_fs_left = detect_peaks.detect_peaks(-diffHeel_left[:,longAxisIndex])+ff
-                indexes_fo_left = detect_peaks.detect_peaks(diffToe_left[:,longAxisIndex])+ff
+            indexes_fs_left = detect_peaks.detect_peaks(diffHeel_left)+ff
+            indexes_fo_left = detect_peaks.detect_peaks(-diffToe_left)+ff
 
-            if  forwardProgression:
-                indexes_fs_right = detect_peaks.detect_peaks(diffHeel_right[:,longAxisIndex])+ff
-                indexes_fo_right = detect_peaks.detect_peaks(-diffToe_right[:,longAxisIndex])+ff
-            else:
-                indexes_fs_right = detect_peaks.detect_peaks(-diffHeel_right[:,longAxisIndex])+ff
-                indexes_fo_right = detect_peaks.detect_peaks(diffToe_right[:,longAxisIndex])+ff
+            indexes_fs_right = detect_peaks.detect_peaks(diffHeel_right)+ff
+            indexes_fo_right = detect_peaks.detect_peaks(-diffToe_right)+ff
 
             return indexes_fs_left+self.footStrikeOffset,indexes_fo_left+self.footOffOffset, indexes_fs_right+self.footStrikeOffset, indexes_fo_right+self.footOffOffset
 
@@ -100,35 +83,36 @@ class EventFilter(object):
     def getState(self):
         return self.m_state
 
+    def _buildEvents(self,label,context,indexes,eventId):
+        pf = self.m_aqui.GetPointFrequency()
+        eventDescriptor = self.m_procedure.description
+
+        events = list()
+        for ind in indexes:
+            ev = btk.btkEvent(label, (ind-1)/pf, context, btk.btkEvent.Manual, '', eventDescriptor)
+            ev.SetId(eventId)
+            events.append(ev)
+        return events
+
     def detect(self):
         """
             Run the motion filter
+
+            .. note:: the procedure runs once. Events are built first, then appended to the acquisition
         """
-        pf = self.m_aqui.GetPointFrequency()
 
-        eventDescriptor = self.m_procedure.description
+        outputs = self.m_procedure.detect(self.m_aqui)
 
-        if self.m_procedure.detect(self.m_aqui) == 0:
+        if outputs == 0:
             self.m_state = False
         else:
-            indexes_fs_left,indexes_fo_left,indexes_fs_right,indexes_fo_right =  self.m_procedure.detect(self.m_aqui)
+            indexes_fs_left,indexes_fo_left,indexes_fs_right,indexes_fo_right =  outputs
             self.m_state = True
-            for ind in indexes_fs_left:
-                ev = btk.btkEvent('Foot Strike', (ind-1)/pf, 'Left', btk.btkEvent.Manual, '', eventDescriptor)
-                ev.SetId(1)
-                self.m_aqui.AppendEvent(ev)
 
-            for ind in indexes_fo_left:
-                ev = btk.btkEvent('Foot Off', (ind-1)/pf, 'Left', btk.btkEvent.Manual, '', eventDescriptor)
-                ev.SetId(2)
-                self.m_aqui.AppendEvent(ev)
-
-            for ind in indexes_fs_right:
-                ev = btk.btkEvent('Foot Strike', (ind-1)/pf, 'Right', btk.btkEvent.Manual, '', eventDescriptor)
-                ev.SetId(1)
-                self.m_aqui.AppendEvent(ev)
+            events = self._buildEvents('Foot Strike','Left',indexes_fs_left,1) + \
+                     self._buildEvents('Foot Off','Left',indexes_fo_left,2) + \
+                     self._buildEvents('Foot Strike','Right',indexes_fs_right,1) + \
+                     self._buildEvents('Foot Off','Right',indexes_fo_right,2)
 
-            for ind in indexes_fo_right:
-                ev = btk.btkEvent('Foot Off', (ind-1)/pf, 'Right', btk.btkEvent.Manual, '', eventDescriptor)
-                ev.SetId(2)
+            for ev in events:
                 self.m_aqui.AppendEvent(ev)
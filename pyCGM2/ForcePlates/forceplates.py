@@ -16,21 +16,73 @@ from pyCGM2.Tools import  btkTools
 
 
 
-def appendForcePlateCornerAsMarker (btkAcq):
+class ForcePlateWrenchs(object):
+    """
+        Force platforms of an acquisition and their wrenchs.
+
+        The btk pipelines are run once, at the first request, and their outputs are shared by the functions
+        handling force plates of a same trial ( matching, events, assembly with the model)
+    """
+
+    def __init__(self,btkAcq):
+        """
+            :Parameters:
+               - `btkAcq` (btkAcquisition) - Btk acquisition instance from a c3d
+        """
+        self.m_aqui = btkAcq
+
+        self.m_forcePlatformsExtractor = None
+        self.m_groundReactionWrenchFilter = None
+        self.m_forcePlatformWrenchFilter = None
+
+    def getForcePlatforms(self):
+        """
+            Get the force platform collection
+        """
+        if self.m_forcePlatformsExtractor is None:
+            self.m_forcePlatformsExtractor = btk.btkForcePlatformsExtractor()
+            self.m_forcePlatformsExtractor.SetInput(self.m_aqui)
+            self.m_forcePlatformsExtractor.GetOutput().Update()
+
+        return self.m_forcePlatformsExtractor.GetOutput()
+
+    def getGroundReactionWrenchs(self):
+        """
+            Get the ground reaction wrench collection ( wrenchs at the centre of pressure)
+        """
+        if self.m_groundReactionWrenchFilter is None:
+            self.m_groundReactionWrenchFilter = btk.btkGroundReactionWrenchFilter()
+            self.m_groundReactionWrenchFilter.SetInput(self.getForcePlatforms())
+            self.m_groundReactionWrenchFilter.GetOutput().Update()
+
+        return self.m_groundReactionWrenchFilter.GetOutput()
+
+    def getForcePlatformWrenchs(self):
+        """
+            Get the force platform wrench collection ( wrenchs at the centre of the force platforms, expressed in the global frame)
+        """
+        if self.m_forcePlatformWrenchFilter is None:
+            self.m_forcePlatformWrenchFilter = btk.btkForcePlatformWrenchFilter()
+            self.m_forcePlatformWrenchFilter.SetInput(self.getForcePlatforms())
+            self.m_forcePlatformWrenchFilter.GetOutput().Update()
+
+        return self.m_forcePlatformWrenchFilter.GetOutput()
+
+
+
+def appendForcePlateCornerAsMarker (btkAcq, wrenchs=None):
     """
         Add a marker at each force plate corners
 
         :Parameters:
            - `btkAcq` (btkAcquisition) : Btk acquisition instance from a c3d
+           - `wrenchs` (ForcePlateWrenchs) : [optional] force plates already extracted from the acquisition
 
     """
 
-
-    # --- ground reaction force wrench ---
-    pfe = btk.btkForcePlatformsExtractor()
-    pfe.SetInput(btkAcq)
-    pfc = pfe.GetOutput()
-    pfc.Update()
+    if wrenchs is None:
+        wrenchs = ForcePlateWrenchs(btkAcq)
+    pfc = wrenchs.getForcePlatforms()
 
 
     for i in range(0,pfc.GetItemNumber()):
@@ -59,7 +111,7 @@ def appendForcePlateCornerAsMarker (btkAcq):
 
 
 def matchingFootSideOnForceplate (btkAcq, enableRefine=True, forceThreshold=50, left_markerLabelToe ="LTOE", left_markerLabelHeel ="LHEE",
-                 right_markerLabelToe ="RTOE", right_markerLabelHeel ="RHEE",  display = False, mfpa=None):
+                 right_markerLabelToe ="RTOE", right_markerLabelHeel ="RHEE",  display = False, mfpa=None, wrenchs=None):
     """
         Convenient function detecting foot in contact with a force plate
 
@@ -79,10 +131,14 @@ def matchingFootSideOnForceplate (btkAcq, enableRefine=True, forceThreshold=50,
            - `right_markerLabelHeel` (str) - label of the right heel marker
            - `display` (bool) - display n figures ( n depend on force plate number) presenting relative distance between mid foot and the orgin of the force plate
            - `mfpa` (string or dict) - manual force plate assigmenment from another method. Can be a string (XLRA, A stand for automatic) or a dict returing assigned foot to a Force plate ID.
+           - `wrenchs` (ForcePlateWrenchs) - [optional] force plates and wrenchs already extracted from the acquisition
 
     """
 
-    appendForcePlateCornerAsMarker(btkAcq)
+    if wrenchs is None:
+        wrenchs = ForcePlateWrenchs(btkAcq)
+
+    appendForcePlateCornerAsMarker(btkAcq, wrenchs=wrenchs)
 
     ff=btkAcq.GetFirstFrame()
     lf=btkAcq.GetLastFrame()
@@ -90,13 +146,8 @@ def matchingFootSideOnForceplate (btkAcq, enableRefine=True, forceThreshold=50,
 
 
     # --- ground reaction force wrench ---
-    pfe = btk.btkForcePlatformsExtractor()
-    grwf = btk.btkGroundReactionWrenchFilter()
-    pfe.SetInput(btkAcq)
-    pfc = pfe.GetOutput()
-    grwf.SetInput(pfc)
-    grwc = grwf.GetOutput()
-    grwc.Update()
+    pfc = wrenchs.getForcePlatforms()
+    grwc = wrenchs.getGroundReactionWrenchs()
 
     midfoot_L=(btkAcq.GetPoint(left_markerLabelToe).GetValues() + btkAcq.GetPoint(left_markerLabelHeel).GetValues())/2.0
     midfoot_R=(btkAcq.GetPoint(right_markerLabelToe).GetValues() + btkAcq.GetPoint(right_markerLabelHeel).GetValues())/2.0
@@ -149,17 +200,7 @@ def matchingFootSideOnForceplate (btkAcq, enableRefine=True, forceThreshold=50,
 
             boolLst = Rz > forceThreshold
 
-
-
-            enableDataFlag = False
-            for it in boolLst.tolist():
-                if it == True:
-                    enableDataFlag=True
-
-                    break
-
-
-            if not enableDataFlag:
+            if not np.any(boolLst):
                 logging.debug("PF #%s not activated. It provides no data superior to threshold"%(str(indexFP)) )
                 li = list(suffix)
                 li[indexFP]="X"
@@ -199,18 +240,10 @@ def matchingFootSideOnForceplate (btkAcq, enableRefine=True, forceThreshold=50,
 
 
 
-                # check if contain both toe and hee marker
-                containFlags= list()
-                for i in range (0, Rz.shape[0]):
-                    if boolLst[i]:
-                        if path.contains_point(hee[i,0:2]) and path.contains_point(toe[i,0:2]):
-                            containFlags.append(True)
-                        else:
-                            containFlags.append(False)
-
-
+                # check if contain both toe and hee marker on frames above the threshold
+                containFlags = path.contains_points(hee[boolLst,0:2]) & path.contains_points(toe[boolLst,0:2])
 
-                if not all(containFlags) == True:
+                if not np.all(containFlags):
                     logging.debug("PF #%s not activated. While Rz superior to threshold, foot markers are not contained in force plate geometry  "%(str(indexFP)) )
                     # replace only one character
                     li = list(suffix)
@@ -253,9 +286,14 @@ def matchingFootSideOnForceplate (btkAcq, enableRefine=True, forceThreshold=50,
 
 
 
-def addForcePlateGeneralEvents (btkAcq,mappedForcePlate ):
+def addForcePlateGeneralEvents (btkAcq,mappedForcePlate, wrenchs=None):
     """
         Add General events from force plate assignmenet
+
+        :Parameters:
+           - `btkAcq` (btkAcquisition) - Btk acquisition instance from a c3d
+           - `mappedForcePlate` (str) - force plate assignment
+           - `wrenchs` (ForcePlateWrenchs) - [optional] force plates and wrenchs already extracted from the acquisition
     """
 
     ff=btkAcq.GetFirstFrame()
@@ -264,13 +302,9 @@ def addForcePlateGeneralEvents (btkAcq,mappedForcePlate ):
     appf=btkAcq.GetNumberAnalogSamplePerFrame()
 
      # --- ground reaction force wrench ---
-    pfe = btk.btkForcePlatformsExtractor()
-    grwf = btk.btkGroundReactionWrenchFilter()
-    pfe.SetInput(btkAcq)
-    pfc = pfe.GetOutput()
-    grwf.SetInput(pfc)
-    grwc = grwf.GetOutput()
-    grwc.Update()
+    if wrenchs is None:
+        wrenchs = ForcePlateWrenchs(btkAcq)
+    grwc = wrenchs.getGroundReactionWrenchs()
 
     # remove force plates events
     btkTools.clearEvents(btkAcq,["Left-FP","Right-FP"])
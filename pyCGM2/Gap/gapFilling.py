@@ -13,12 +13,15 @@ import matplotlib.pyplot as plt
 # -*- coding: utf-8 -*-
 import matplotlib.pyplot as plt
 import logging
+import multiprocessing
 import numpy as np
+from scipy import linalg
 
 from pyCGM2 import btk
 
 from pyCGM2.Tools import  btkTools
 from pyCGM2.Signal import detect_peaks
+from pyCGM2.Signal import signal_processing
 
 
 #-------- EVENT PROCEDURES  ----------
@@ -30,65 +33,183 @@ class LowDimensionalKalmanFilterProcedure(object):
         method from Burke et al. (Job 2016)
     """
 
-    def __init__(self):
+    def __init__(self,seed=0,localWindows=False,margin=100,maxWindowRatio=0.5,processes=1):
+        """
+            :Parameters:
+                - `seed` (int) - seed of the random initial state. Fixes the output of the filter between runs
+                - `localWindows` (bool) - smooth only windows around the gaps instead of the whole trial
+                - `margin` (int) - number of frames added before and after each gap to build its window
+                - `maxWindowRatio` (float) - ratio of trial frames beyond which windows fall back to the whole trial
+                - `processes` (int) - number of processes smoothing the windows. if 1, windows are smoothed sequentially
+        """
         self.description = "Burke (2016)"
+        self.m_seed = seed
+
+        self.m_localWindows = localWindows
+        self.m_margin = margin
+        self.m_maxWindowRatio = maxWindowRatio
+        self.m_processes = processes
 
 
     def _smooth(self,rawdata,tol=0.0025,sigR=1e-3,keepOriginal=True):
+        """
+            Low dimensional Kalman smoother of a data matrix with missing values ( nan)
+
+            :Parameters:
+                - `rawdata` (numpy.array(n,m)) - data matrix, missing values are nan
+                - `tol` (float) - tolerance on the cumulated singular values defining the dimension of the state
+                - `sigR` (float) - measurement noise
+                - `keepOriginal` (bool) - keep the non missing values
+
+            .. note:: states and covariances are preallocated, gains are computed with symmetric solves and
+            observation matrices are cached by pattern of missing values. The filtered covariance is updated in Joseph form.
+
+        """
+
+        observed = ~np.isnan(rawdata)
+
+        X = rawdata[observed.all(axis=1)]
+
+        m = np.mean(X,axis=0)
+
+        logging.debug('Computing SVD...')
+
+        U, S, V = np.linalg.svd(X - m,full_matrices=False)
+
+        logging.debug('done')
+
+        d = np.nonzero(np.cumsum(S)/np.sum(S)>(1-tol))[0][0]
+
+        P = V[0:d,:]
+        Q = np.dot(P*np.std(np.diff(X,axis=0),axis=0),P.T)
+
+        n = rawdata.shape[0]
+        eye = np.eye(d)
+
+        logging.debug('Forward Pass')
+        state = np.zeros((n+1,d))
+        state_pred = np.zeros((n+1,d))
+        cov = np.zeros((n+1,d,d))
+        cov_pred = np.zeros((n+1,d,d))
+
+        randomState = np.random.RandomState(self.m_seed)
+        cov[0] = 1e12*eye
+        state[0] = randomState.normal(0.0,1.0,d)
+        cov_pred[0] = 1e12*eye
+        state_pred[0] = randomState.normal(0.0,1.0,d)
+
+        observations = dict()
+        for i in range(1,n+1):
+
+            visible = observed[i-1]
+            key = visible.tostring()
+            if key not in observations:
+                Ht = P[:,visible].T
+                observations[key] = (Ht,m[visible],sigR*np.eye(Ht.shape[0]))
+            Ht,Hm,R = observations[key]
 
-    	X = rawdata[~np.isnan(rawdata).any(axis=1)]
+            state_pred[i] = state[i-1]
+            cov_pred[i] = cov[i-1] + Q
 
-    	m = np.mean(X,axis=0)
+            if Ht.shape[0] == 0:
+                state[i] = state_pred[i]
+                cov[i] = cov_pred[i]
+                continue
 
-    	logging.debug('Computing SVD...')
+            PHt = np.dot(cov_pred[i],Ht.T)
+            K = _solveSymmetric(np.dot(Ht,PHt) + R,PHt.T).T
 
-    	U, S, V = np.linalg.svd(X - m)
+            state[i] = state_pred[i] + np.dot(K,rawdata[i-1,visible] - (np.dot(Ht,state_pred[i])+Hm))
 
-    	logging.debug('done')
+            # joseph form, symmetrised. the symmetric solves only read one triangle of the covariances
+            IKH = eye - np.dot(K,Ht)
+            covariance = np.dot(np.dot(IKH,cov_pred[i]),IKH.T) + np.dot(np.dot(K,R),K.T)
+            cov[i] = 0.5*(covariance+covariance.T)
 
-    	d = np.nonzero(np.cumsum(S)/np.sum(S)>(1-tol))[0][0]
+        logging.debug('Backward Pass')
+        # smoothed covariances are not needed for the smoothed states
+        for i in range(n-1,0,-1):
+            G = _solveSymmetric(cov_pred[i],cov[i].T).T
+            state[i] = state[i] + np.dot(G,state[i+1] - state_pred[i+1])
 
-    	Q = np.dot(np.dot(V[0:d,:],np.diag(np.std(np.diff(X,axis=0),axis=0))),V[0:d,:].T)
+        y = np.dot(state[1:],P) + m
 
-    	logging.debug('Forward Pass')
-    	state = []
-    	state_pred = []
-    	cov_pred = []
-    	cov = []
-    	cov.insert(0,1e12*np.eye(d))
-    	state.insert(0,np.random.normal(0.0,1.0,d))
-    	cov_pred.insert(0,1e12*np.eye(d))
-    	state_pred.insert(0,np.random.normal(0.0,1.0,d))
-    	for i in range(1,rawdata.shape[0]+1):
+        if (keepOriginal):
+            y[observed] = rawdata[observed]
 
-    		z =  rawdata[i-1,~np.isnan(rawdata[i-1,:])]
-    		H = np.diag(~np.isnan(rawdata[i-1,:]))
-    		H = H[~np.all(H == 0, axis=1)]
-    		Ht = np.dot(H,V[0:d,:].T)
+        return y
 
-    		R = sigR*np.eye(H.shape[0])
 
-    		state_pred.insert(i,state[i-1])
-    		cov_pred.insert(i,cov[i-1] + Q)
+    def _windows(self,rawdata):
+        """
+            Frame windows around the gaps of the data matrix. Gaps closer than two margins share the same window.
+
+            :Parameters:
+                - `rawdata` (numpy.array(n,m)) - data matrix, missing values are nan
+
+            :Return:
+                - `windows` (list) - (begin,end) of each window, end excluded. None if the whole trial needs to be smoothed
+        """
+        n = rawdata.shape[0]
+        missing = np.isnan(rawdata).any(axis=1)
+
+        windows = list()
+        for begin,end in signal_processing.validSegments(missing):
+            begin = max(0,begin-self.m_margin)
+            end = min(n,end+self.m_margin)
+            if windows and begin <= windows[-1][1]:
+                windows[-1] = (windows[-1][0],end)
+            else:
+                windows.append((begin,end))
 
-    		K = np.dot(np.dot(cov_pred[i],Ht.T),np.linalg.inv(np.dot(np.dot(Ht,cov_pred[i]),Ht.T) + R))
+        if sum([end-begin for begin,end in windows]) > self.m_maxWindowRatio*n:
+            logging.debug("gaps dominate the trial - whole trial smoothing")
+            return None
 
-    		state.insert(i,state_pred[i] + np.dot(K,(z - (np.dot(Ht,state_pred[i])+np.dot(H,m)))))
-    		cov.insert(i,np.dot(np.eye(d) - np.dot(K,Ht),cov_pred[i]))
+        # the subspace of a window is defined from its complete frames
+        for begin,end in windows:
+            if np.sum(~missing[begin:end]) < min(self.m_margin,end-begin):
+                logging.debug("not enough complete frames around the gap [%i-%i] - whole trial smoothing"%(begin,end))
+                return None
 
-    	logging.debug('Backward Pass')
-    	y = np.zeros(rawdata.shape)
-    	y[-1,:] = np.dot(V[0:d,:].T,state[-1]) + m
-    	for i in range(len(state)-2,0,-1):
-    		state[i] =  state[i] + np.dot(np.dot(cov[i],np.linalg.inv(cov_pred[i])),(state[i+1] - state_pred[i+1]))
-    		cov[i] =  cov[i] + np.dot(np.dot(np.dot(cov[i],np.linalg.inv(cov_pred[i])),(cov[i+1] - cov_pred[i+1])),cov[i])
+        return windows
+
+
+    def _fillMatrix(self,rawdata,tol=0.0025,sigR=1e-3):
+        """
+            Fill the missing values of a data matrix, either from the whole trial or from windows around the gaps
+
+            :Parameters:
+                - `rawdata` (numpy.array(n,m)) - data matrix, missing values are nan
+                - `tol` (float) - tolerance on the cumulated singular values defining the dimension of the state
+                - `sigR` (float) - measurement noise
+        """
 
-    		y[i-1,:] = np.dot(V[0:d,:].T,state[i]) + m
+        windows = self._windows(rawdata) if self.m_localWindows else None
 
-    	if (keepOriginal):
-    		y[~np.isnan(rawdata)] = rawdata[~np.isnan(rawdata)]
+        if windows is None:
+            return self._smooth(rawdata,tol=tol,sigR=sigR,keepOriginal=True)
 
-    	return y
+        logging.debug("smoothing of %i window(s)"%(len(windows)))
+        tasks = [(self,rawdata[begin:end,:],tol,sigR) for begin,end in windows]
+
+        processes = max(1,min(self.m_processes,len(tasks)))
+        if processes == 1:
+            smoothed = [_smoothWindow(task) for task in tasks]
+        else:
+            pool = multiprocessing.Pool(processes)
+            try:
+                smoothed = pool.map(_smoothWindow,tasks,chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+        # frames out of the windows are complete
+        y = np.array(rawdata,copy=True)
+        for (begin,end),values in zip(windows,smoothed):
+            y[begin:end,:] = values
+
+        return y
 
 
     def fill(self,acq):
@@ -110,15 +231,10 @@ class LowDimensionalKalmanFilterProcedure(object):
         for i in range(0,len(btkmarkers)):
             values = acq.GetPoint(btkmarkers[i]).GetValues()
             residualValues = acq.GetPoint(btkmarkers[i]).GetResiduals()
-            rawDatabtk[:,3*i-3] = values[:,0]
-            rawDatabtk[:,3*i-2] = values[:,1]
-            rawDatabtk[:,3*i-1] = values[:,2]
-            E = residualValues[:,0]
-            rawDatabtk[np.asarray(E)==-1,3*i-3] = np.nan
-            rawDatabtk[np.asarray(E)==-1,3*i-2] = np.nan
-            rawDatabtk[np.asarray(E)==-1,3*i-1] = np.nan
+            rawDatabtk[:,3*i:3*i+3] = values
+            rawDatabtk[np.asarray(residualValues[:,0])==-1,3*i:3*i+3] = np.nan
 
-        Y2 = self._smooth(rawDatabtk,tol =1e-2,sigR=1e-3,keepOriginal=True)
+        Y2 = self._fillMatrix(rawDatabtk,tol =1e-2,sigR=1e-3)
 
         logging.debug("writing trajectories")
 
@@ -129,16 +245,32 @@ class LowDimensionalKalmanFilterProcedure(object):
             if btkTools.isGap(acq,targetMarker):
                 logging.info("marker (%s) --> filled"%(targetMarker))
                 filledMarkers.append(targetMarker)
-                val_final = np.zeros((pfn,3))
-                val_final[:,0] = Y2[:,3*i-3]
-                val_final[:,1] = Y2[:,3*i-2]
-                val_final[:,2] = Y2[:,3*i-1]
+                val_final = Y2[:,3*i:3*i+3]
                 btkTools.smartAppendPoint(acq,targetMarker,val_final)
         logging.info("----LowDimensionalKalmanFilter gap filling [complete]----")
 
         return acq, filledMarkers
 
 
+def _solveSymmetric(a,b):
+    """
+        Solve a.x = b, with a a covariance matrix. Falls back to a general solve if a is not numerically positive definite
+    """
+    try:
+        return linalg.solve(a,b,assume_a="pos")
+    except np.linalg.LinAlgError:
+        logging.debug("covariance not positive definite - general solve")
+        return linalg.solve(a,b)
+
+
+def _smoothWindow(task):
+    """
+        Smoothing of a window into a worker process
+    """
+    procedure,rawdata,tol,sigR = task
+    return procedure._smooth(rawdata,tol=tol,sigR=sigR,keepOriginal=True)
+
+
 class GapFillingFilter(object):
     """
 
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import logging
+import traceback
+import cPickle
+import multiprocessing
+
+# pyCGM2 libraries
+from pyCGM2.Tools import btkTools
+
+
+# global of the worker process : serialized calibrated model
+_serializedModel = None
+
+
+def _initWorker(serializedModel):
+    global _serializedModel
+    _serializedModel = serializedModel
+
+
+def _fitTrial(task):
+    """
+    Fitting of a single trial into a worker process.
+    Exceptions are caught and returned, so that a failing trial doesn t stop the batch.
+    """
+    fittingFunction,DATA_PATH,OUT_PATH,reconstructFilenameLabelled,outFilename,args,kwargs = task
+
+    try:
+        # each trial works on its own copy of the calibrated model
+        model = cPickle.loads(_serializedModel)
+
+        acqGait = fittingFunction(model,DATA_PATH, reconstructFilenameLabelled,*args,**kwargs)
+
+        btkTools.smartWriter(acqGait, str(OUT_PATH + outFilename))
+        logging.info("----Processing of [%s]-----> DONE"%(reconstructFilenameLabelled))
+
+        return reconstructFilenameLabelled,outFilename,None
+
+    except Exception:
+        logging.error("----Processing of [%s]-----> FAILED"%(reconstructFilenameLabelled))
+        return reconstructFilenameLabelled,None,traceback.format_exc()
+
+
+def trial(reconstructFilenameLabelled,*args,**kwargs):
+    """
+    Definition of a trial to fit.
+
+    :param reconstructFilenameLabelled [str]: c3d file
+    :param args: positional arguments of the fitting function following the c3d file (ex: translators, markerDiameter,...)
+    :param kwargs: keyword arguments of the fitting function (ex: fc_lowPass_marker,...)
+
+    Example:
+
+        trial("gait1.c3d", translators, markerDiameter, pointSuffix, mfpa, momentProjection, fc_lowPass_marker=6)
+    """
+
+    return (reconstructFilenameLabelled,args,kwargs)
+
+
+def fitting(fittingFunction,model,DATA_PATH,trials,OUT_PATH=None,outputSuffix=None,processes=None):
+    """
+    Fitting of many dynamic trials against one calibrated model with a pool of processes
+
+    :param fittingFunction [function]: fitting function of a Lib.CGM module (ex: cgm1.fitting)
+    :param model [pyCGM2.Model]: pyCGM2 model previously calibrated
+    :param DATA_PATH [str]: path to your data
+    :param trials [list]: trials to fit, defined with the function *trial*
+    :param OUT_PATH [str]: path of the output c3d files ( DATA_PATH by default)
+    :param outputSuffix [str]: suffix added to the output c3d files. if None, the input c3d is overwritten
+    :param processes [int]: number of processes (number of cores by default). if 1, trials are fitted sequentially without pool
+
+    :return outputs [list]: output c3d files of the trials successfully fitted
+    :return errors [dict]: traceback of the failed trials, keyed by input c3d file
+
+    **Note**: the fitted acquisitions are written into c3d files, btk acquisitions can't be transferred between processes.
+    """
+
+    if OUT_PATH is None:
+        OUT_PATH = DATA_PATH
+
+    tasks = list()
+    for reconstructFilenameLabelled,args,kwargs in trials:
+        if outputSuffix is not None:
+            outFilename = reconstructFilenameLabelled[:-4]+"-"+outputSuffix+".c3d"
+        else:
+            outFilename = reconstructFilenameLabelled
+        tasks.append((fittingFunction,DATA_PATH,OUT_PATH,reconstructFilenameLabelled,outFilename,args,kwargs))
+
+    serializedModel = cPickle.dumps(model,cPickle.HIGHEST_PROTOCOL)
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = max(1,min(processes,len(tasks)))
+
+    logging.info("[pyCGM2] --- batch fitting of %i trials with %i process(es) ---"%(len(tasks),processes))
+    if processes == 1:
+        _initWorker(serializedModel)
+        results = [_fitTrial(task) for task in tasks]
+    else:
+        pool = multiprocessing.Pool(processes,_initWorker,(serializedModel,))
+        try:
+            results = pool.map(_fitTrial,tasks,chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    outputs = list()
+    errors = dict()
+    for reconstructFilenameLabelled,outFilename,error in results:
+        if error is None:
+            outputs.append(outFilename)
+        else:
+            errors[reconstructFilenameLabelled] = error
+            logging.error("[pyCGM2] fitting of [%s] failed :\n%s"%(reconstructFilenameLabelled,error))
+
+    return outputs,errors
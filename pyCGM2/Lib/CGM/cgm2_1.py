@@ -293,17 +293,19 @@ def fitting(model,DATA_PATH, reconstructFilenameLabelled,
         if model.m_bodypart != enums.BodyPart.UpperLimb:
             # --- force plate handling----
             # find foot  in contact
-            mappedForcePlate = forceplates.matchingFootSideOnForceplate(acqGait,mfpa=mfpa)
-            forceplates.addForcePlateGeneralEvents(acqGait,mappedForcePlate)
+            fpWrenchs = forceplates.ForcePlateWrenchs(acqGait)
+            mappedForcePlate = forceplates.matchingFootSideOnForceplate(acqGait,mfpa=mfpa,wrenchs=fpWrenchs)
+            forceplates.addForcePlateGeneralEvents(acqGait,mappedForcePlate,wrenchs=fpWrenchs)
             logging.warning("Manual Force plate assignment : %s" %mappedForcePlate)
 
             # assembly foot and force plate
             modelFilters.ForcePlateAssemblyFilter(model,acqGait,mappedForcePlate,
                                      leftSegmentLabel="Left Foot",
-                                     rightSegmentLabel="Right Foot").compute(pointLabelSuffix=pointSuffix)
+                                     rightSegmentLabel="Right Foot",
+                                     wrenchs=fpWrenchs).compute(pointLabelSuffix=pointSuffix)
 
             #---- Joint kinetics----
-            idp = modelFilters.CGMLowerlimbInverseDynamicProcedure()
+            idp = modelFilters.VectorizedInverseDynamicProcedure()
             modelFilters.InverseDynamicFilter(model,
                                  acqGait,
                                  procedure = idp,
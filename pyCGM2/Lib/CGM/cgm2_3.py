@@ -436,18 +436,20 @@ def fitting(model,DATA_PATH, reconstructFilenameLabelled,
         if model.m_bodypart != enums.BodyPart.UpperLimb:
             # --- force plate handling----
             # find foot  in contact
-            mappedForcePlate = forceplates.matchingFootSideOnForceplate(finalAcqGait,mfpa=mfpa)
-            forceplates.addForcePlateGeneralEvents(finalAcqGait,mappedForcePlate)
+            fpWrenchs = forceplates.ForcePlateWrenchs(finalAcqGait)
+            mappedForcePlate = forceplates.matchingFootSideOnForceplate(finalAcqGait,mfpa=mfpa,wrenchs=fpWrenchs)
+            forceplates.addForcePlateGeneralEvents(finalAcqGait,mappedForcePlate,wrenchs=fpWrenchs)
             logging.warning("Manual Force plate assignment : %s" %mappedForcePlate)
 
 
             # assembly foot and force plate
             modelFilters.ForcePlateAssemblyFilter(model,finalAcqGait,mappedForcePlate,
                                      leftSegmentLabel="Left Foot",
-                                     rightSegmentLabel="Right Foot").compute(pointLabelSuffix=pointSuffix)
+                                     rightSegmentLabel="Right Foot",
+                                     wrenchs=fpWrenchs).compute(pointLabelSuffix=pointSuffix)
 
             #---- Joint kinetics----
-            idp = modelFilters.CGMLowerlimbInverseDynamicProcedure()
+            idp = modelFilters.VectorizedInverseDynamicProcedure()
             modelFilters.InverseDynamicFilter(model,
                                  finalAcqGait,
                                  procedure = idp,
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+import logging
+import traceback
+import multiprocessing
+
 from pyCGM2.Events import events
+from pyCGM2.Tools import btkTools
 
 def zeni(acqGait,footStrikeOffset=0,footOffOffset=0):
     """
@@ -30,3 +35,72 @@ def zeni(acqGait,footStrikeOffset=0,footOffOffset=0):
     evf.detect()
     state = evf.getState()
     return acqGait,state
+
+
+def _zeniFile(task):
+    """
+    Zeni detection of a c3d file into a worker process.
+    Exceptions are caught and returned, so that a failing trial doesn t stop the batch.
+    """
+    DATA_PATH,OUT_PATH,filename,footStrikeOffset,footOffOffset = task
+
+    try:
+        acqGait = btkTools.smartReader(str(DATA_PATH + filename))
+        acqGait,state = zeni(acqGait,footStrikeOffset=footStrikeOffset,footOffOffset=footOffOffset)
+        btkTools.smartWriter(acqGait, str(OUT_PATH + filename))
+
+        return filename,state,None
+
+    except Exception:
+        logging.error("----Event detection of [%s]-----> FAILED"%(filename))
+        return filename,False,traceback.format_exc()
+
+
+def zeniFiles(DATA_PATH,filenames,footStrikeOffset=0,footOffOffset=0,OUT_PATH=None,processes=None):
+    """
+    Detect gait events of many c3d files according Zeni's algorithm with a pool of processes
+
+    :param DATA_PATH [str]: path to your data
+    :param filenames [list]: c3d files
+
+    **optional**
+    :param footStrikeOffset [int]:  systematic offset to add to foot strike
+    :param footOffOffset [int]: systematic oofset to add to foot off
+    :param OUT_PATH [str]: path of the output c3d files ( DATA_PATH by default, the input c3d files are overwritten)
+    :param processes [int]: number of processes (number of cores by default). if 1, files are processed sequentially without pool
+
+    **Return**
+    :param states [dict]: detection state, keyed by c3d file
+    :param errors [dict]: traceback of the failed files, keyed by c3d file
+
+    **Note**: btk acquisitions can't be transferred between processes, each worker reads and writes its own c3d file.
+    """
+
+    if OUT_PATH is None:
+        OUT_PATH = DATA_PATH
+
+    tasks = [(DATA_PATH,OUT_PATH,filename,footStrikeOffset,footOffOffset) for filename in filenames]
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = max(1,min(processes,len(tasks)))
+
+    if processes == 1:
+        results = [_zeniFile(task) for task in tasks]
+    else:
+        pool = multiprocessing.Pool(processes)
+        try:
+            results = pool.map(_zeniFile,tasks,chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    states = dict()
+    errors = dict()
+    for filename,state,error in results:
+        states[filename] = state
+        if error is not None:
+            errors[filename] = error
+            logging.error("[pyCGM2] event detection of [%s] failed :\n%s"%(filename,error))
+
+    return states,errors
@@ -140,34 +140,78 @@ def secondOrderFiniteDifference(values,sampleFrequency):
     return out
    
 
-def matrixFirstDerivation(motionList, sampleFrequency):
-    
+def rotationsFirstDerivation(rotations, sampleFrequency):
+
     """
-        First-order differentiation of a list of array
+        First-order differentiation of a stack of matrices
 
         :Parameters:
-            - `values` (list of numpy.array(m,n)) - array of values 
-            - `sampleFrequency` (double) - sample frequency 
+            - `rotations` (numpy.array(n,3,3)) - matrices
+            - `sampleFrequency` (double) - sample frequency
 
         :Return:
-            - `out` (list numpy.array(m,n)) - derivated values 
+            - `out` (numpy.array(n,3,3)) - derivated matrices
 
     """
+    rotations = np.asarray(rotations)
+    nf = rotations.shape[0]
+    out = np.zeros(rotations.shape)
 
-    nf = len(motionList)
-    matrixList=[]
+    out[0] = (-3.0*rotations[0] + 4.0*rotations[1] - rotations[2])/(2*1/sampleFrequency)
+    out[1:nf-1] = (rotations[2:] - rotations[:-2])/(2*1/sampleFrequency)
+    out[nf-1] = (3.0*rotations[nf-1] - 4.0*rotations[nf-2] + rotations[nf-3])/(2*1/sampleFrequency)
 
-    #matrixList.append(np.zeros((3,3)))
-    i=0
-    matrixList.append( (-3.0*motionList[i].getRotation() + 4.0*motionList[i+1].getRotation()-motionList[i+2].getRotation())/(2*1/sampleFrequency))
- 
-    for i  in range(1,nf-1):
-        matrixList.append( (motionList[i+1].getRotation()-motionList[i-1].getRotation())/(2*1/sampleFrequency))
+    return out
+
+
+
+def rotationsSecondDerivation(rotations, sampleFrequency):
+
+    """
+        Second-order differentiation of a stack of matrices
+
+        :Parameters:
+            - `rotations` (numpy.array(n,3,3)) - matrices
+            - `sampleFrequency` (double) - sample frequency
+
+        :Return:
+            - `out` (numpy.array(n,3,3)) - derivated matrices
+
+    """
+    rotations = np.asarray(rotations)
+    nf = rotations.shape[0]
+    out = np.zeros(rotations.shape)
+
+    out[0] = (-5.0*rotations[1] + 4.0*rotations[2] - rotations[3])/(pow(1/sampleFrequency,2))
+    out[1:nf-1] = (rotations[:-2] - 2.0*rotations[1:-1] + rotations[2:])/(pow(1/sampleFrequency,2))
+    out[nf-1] = (-5.0*rotations[nf-2] + 4.0*rotations[nf-3] - rotations[nf-4])/(pow(1/sampleFrequency,2))
+
+    return out
 
-    #matrixList.append(np.zeros((3,3)))
-    i=nf-1        
-    matrixList.append( (3.0*motionList[i].getRotation() - 4.0*motionList[i-1].getRotation() + motionList[i-2].getRotation())/(2*1/sampleFrequency))    
-    return matrixList
+
+def _motionRotations(motionList):
+    if hasattr(motionList,"getRotations"):
+        return motionList.getRotations()
+    return np.array([it.getRotation() for it in motionList])
+
+
+def matrixFirstDerivation(motionList, sampleFrequency):
+
+    """
+        First-order differentiation of a list of array
+
+        :Parameters:
+            - `values` (list of numpy.array(m,n)) - array of values
+            - `sampleFrequency` (double) - sample frequency
+
+        :Return:
+            - `out` (list numpy.array(m,n)) - derivated values
+
+        .. note:: see *rotationsFirstDerivation* for an array output
+
+    """
+
+    return list(rotationsFirstDerivation(_motionRotations(motionList), sampleFrequency))
 
 
 
@@ -176,27 +220,14 @@ def matrixSecondDerivation(motionList,sampleFrequency):
         Second-order differentiation of a list of array
 
         :Parameters:
-            - `values` (list of numpy.array(m,n)) - array of values 
-            - `sampleFrequency` (double) - sample frequency 
+            - `values` (list of numpy.array(m,n)) - array of values
+            - `sampleFrequency` (double) - sample frequency
 
         :Return:
-            - `out` (list numpy.array(m,n)) - derivated values 
+            - `out` (list numpy.array(m,n)) - derivated values
 
-    """    
-    
-    nf = len(motionList)
-    matrixList=[]
+        .. note:: see *rotationsSecondDerivation* for an array output
 
-    #matrixList.append(np.zeros((3,3)))
-    i=0
-    matrixList.append( (-5.0*motionList[i+1].getRotation() + 4.0*motionList[i+2].getRotation()-motionList[i+3].getRotation())/(pow(1/sampleFrequency,2)))
-    for i  in range(1,nf-1):
-        matrixList.append( 
-                    (motionList[i-1].getRotation()
-                    -2.0*motionList[i].getRotation()
-                    +1*motionList[i+1].getRotation() )/(pow(1/sampleFrequency,2))
-                    )
-    #matrixList.append(np.zeros((3,3)))
-    i = nf-1                
-    matrixList.append( (-5.0*motionList[i-1].getRotation() + 4.0*motionList[i-2].getRotation()-motionList[i-3].getRotation())/(pow(1/sampleFrequency,2)))    
-    return matrixList
\ No newline at end of file
+    """
+
+    return list(rotationsSecondDerivation(_motionRotations(motionList), sampleFrequency))
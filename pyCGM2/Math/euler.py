@@ -228,3 +228,250 @@ def euler_zyx(Matrix, similarOrder = True):
         return Euler3,Euler2,Euler1
     else:
         return Euler1,Euler2,Euler3
+
+
+# ---- array versions : (n,3,3) rotation matrices -> (n,3) angles ----
+
+def wrapEulerToArray(inputAngles, Dest):
+    """
+        Apply `wrapEulerTo` along a sequence of euler angles, each frame being wrapped to the previous output
+
+        :Parameters:
+           - `inputAngles` (numpy.array(n,3)) - euler angles in radian
+           - `Dest` (numpy.array(3,)) - destination of the first frame
+
+        :Return:
+            - `OutputAngles` (numpy.array(n,3)) - wrapped angles
+    """
+
+    an = np.asarray(inputAngles,dtype=float)
+    bn = an * np.array([ 1, -1, 1 ]) + np.pi
+    Dest = np.asarray(Dest,dtype=float)
+
+    nFrames = an.shape[0]
+    if nFrames == 0:
+        return np.zeros((0,3))
+
+    def distance(Dest,Curr):
+        Diff = Dest - Curr
+        return np.max(np.abs(Diff - np.pi*2 * np.floor( (Diff + np.pi)/(np.pi*2) )),axis=-1)
+
+    # alternative (bn) chosen according the representative kept at the previous frame
+    swapFromA = distance(an[:-1],bn[1:]) < distance(an[:-1],an[1:])
+    swapFromB = distance(bn[:-1],bn[1:]) < distance(bn[:-1],an[1:])
+
+    swap = np.zeros(nFrames,dtype=bool)
+    swap[0] = distance(Dest,bn[0]) < distance(Dest,an[0])
+    for i in range(1,nFrames):
+        swap[i] = swapFromB[i-1] if swap[i-1] else swapFromA[i-1]
+
+    Curr = np.where(swap.reshape(-1,1),bn,an)
+
+    # number of turns added to each frame
+    turns = np.zeros((nFrames,3))
+    turns[0] = np.floor( (Dest - Curr[0] + np.pi)/(np.pi*2) )
+    turns[1:] = np.floor( (Curr[:-1] - Curr[1:] + np.pi)/(np.pi*2) )
+    turns = np.cumsum(turns,axis=0)
+
+    return Curr + np.pi*2 * turns
+
+
+def _safeArcsinArray(Values):
+    return np.arcsin(np.clip(Values,-1,1))
+
+
+def _isRegular(Euler):
+    return np.abs( np.cos( Euler ) ) > np.spacing(np.single(1))*10
+
+
+def euler_xyz_array(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence XYZ
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles, ordered as `euler_xyz`
+    """
+    Matrices = np.asarray(Matrices)
+
+    Euler2 = _safeArcsinArray( Matrices[:,0,2] )
+    regular = _isRegular(Euler2)
+    Euler1 = np.where(regular,
+                      np.arctan2( -Matrices[:,1,2], Matrices[:,2,2] ),
+                      np.where( Euler2 > 0,
+                                np.arctan2( Matrices[:,1,0], Matrices[:,1,1] ),
+                                -np.arctan2( Matrices[:,0,1], Matrices[:,1,1] )))
+    Euler3 = np.where(regular, np.arctan2( -Matrices[:,0,1], Matrices[:,0,0] ), 0.0)
+
+    return np.array([Euler1,Euler2,Euler3]).T
+
+
+def euler_xzy_array(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence XZY
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles, ordered as `euler_xzy`
+    """
+    Matrices = np.asarray(Matrices)
+
+    Euler3 = _safeArcsinArray( -Matrices[:,0,1] )
+    regular = _isRegular(Euler3)
+    Euler1 = np.where(regular,
+                      np.arctan2( Matrices[:,2,1], Matrices[:,1,1] ),
+                      np.where( Euler3 > 0,
+                                np.arctan2( -Matrices[:,2,0], Matrices[:,2,2] ),
+                                -np.arctan2( -Matrices[:,2,0], Matrices[:,2,2] )))
+    Euler2 = np.where(regular, np.arctan2( Matrices[:,0,2], Matrices[:,0,0] ), 0.0)
+
+    if similarOrder:
+        return np.array([Euler1,Euler3,Euler2]).T
+    else:
+        return np.array([Euler1,Euler2,Euler3]).T
+
+
+def euler_yxz_array(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence YXZ
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles, ordered as `euler_yxz`
+    """
+    Matrices = np.asarray(Matrices)
+
+    Euler1 = _safeArcsinArray( -Matrices[:,1,2] )
+    regular = _isRegular(Euler1)
+    Euler2 = np.where(regular,
+                      np.arctan2( Matrices[:,0,2], Matrices[:,2,2] ),
+                      np.where( Euler1 > 0,
+                                np.arctan2( -Matrices[:,0,1], Matrices[:,0,0] ),
+                                -np.arctan2( -Matrices[:,0,1], Matrices[:,0,0] )))
+    Euler3 = np.where(regular, np.arctan2( Matrices[:,1,0], Matrices[:,1,1] ), 0.0)
+
+    if similarOrder:
+        return np.array([Euler2,Euler1,Euler3]).T
+    else:
+        return np.array([Euler1,Euler2,Euler3]).T
+
+
+def euler_yzx_array(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence YZX
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles, ordered as `euler_yzx`
+    """
+    Matrices = np.asarray(Matrices)
+
+    Euler3 = _safeArcsinArray( Matrices[:,1,0] )
+    regular = _isRegular(Euler3)
+    Euler1 = np.where(regular, np.arctan2( -Matrices[:,1,2], Matrices[:,1,1] ), 0.0)
+    Euler2 = np.where(regular,
+                      np.arctan2( -Matrices[:,2,0], Matrices[:,0,0] ),
+                      np.where( Euler3 > 0,
+                                np.arctan2( Matrices[:,2,1], Matrices[:,2,2] ),
+                                -np.arctan2( Matrices[:,2,1], Matrices[:,2,2] )))
+
+    if similarOrder:
+        return np.array([Euler2,Euler3,Euler1]).T
+    else:
+        return np.array([Euler1,Euler2,Euler3]).T
+
+
+def euler_zxy_array(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence ZXY
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles, ordered as `euler_zxy`
+    """
+    Matrices = np.asarray(Matrices)
+
+    Euler1 = _safeArcsinArray( Matrices[:,2,1] )
+    regular = _isRegular(Euler1)
+    Euler2 = np.where(regular, np.arctan2( -Matrices[:,2,0], Matrices[:,2,2] ), 0.0)
+    Euler3 = np.where(regular,
+                      np.arctan2( -Matrices[:,0,1], Matrices[:,1,1] ),
+                      np.where( Euler1 > 0,
+                                np.arctan2( Matrices[:,0,2], Matrices[:,0,0] ),
+                                -np.arctan2( Matrices[:,0,2], Matrices[:,0,0] )))
+
+    if similarOrder:
+        return np.array([Euler3,Euler1,Euler2]).T
+    else:
+        return np.array([Euler1,Euler2,Euler3]).T
+
+
+def euler_zyx_array(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence ZYX
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles, ordered as `euler_zyx`
+    """
+    Matrices = np.asarray(Matrices)
+
+    Euler2 = _safeArcsinArray( -Matrices[:,2,0] )
+    regular = _isRegular(Euler2)
+    Euler1 = np.where(regular, np.arctan2( Matrices[:,2,1], Matrices[:,2,2] ), 0.0)
+    Euler3 = np.where(regular,
+                      np.arctan2( Matrices[:,1,0], Matrices[:,0,0] ),
+                      np.where( Euler2 > 0,
+                                np.arctan2( -Matrices[:,0,1], Matrices[:,0,2] ),
+                                -np.arctan2( -Matrices[:,0,1], Matrices[:,0,2] )))
+
+    if similarOrder:
+        return np.array([Euler3,Euler2,Euler1]).T
+    else:
+        return np.array([Euler1,Euler2,Euler3]).T
+
+
+def eulerArray(Matrices, sequence, similarOrder = True):
+    """
+        Decomposition of rotation matrices according a sequence
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `sequence` (str) - euler sequence (XYZ,XZY,YXZ,YZX,ZXY or ZYX)
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `angles` (numpy.array(n,3)) - angles
+    """
+    if sequence == "XYZ":
+        return euler_xyz_array(Matrices, similarOrder = similarOrder)
+    elif sequence == "XZY":
+        return euler_xzy_array(Matrices, similarOrder = similarOrder)
+    elif sequence == "YXZ":
+        return euler_yxz_array(Matrices, similarOrder = similarOrder)
+    elif sequence == "YZX":
+        return euler_yzx_array(Matrices, similarOrder = similarOrder)
+    elif sequence == "ZXY":
+        return euler_zxy_array(Matrices, similarOrder = similarOrder)
+    elif sequence == "ZYX":
+        return euler_zyx_array(Matrices, similarOrder = similarOrder)
+    else:
+        raise Exception("[pyCGM2] euler sequence (%s) unknown"%(sequence))
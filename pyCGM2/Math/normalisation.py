@@ -1,6 +1,47 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 
+# interpolation weights, keyed by (source length, target length)
+_INTERPOLATION_WEIGHTS = dict()
+
+
+def interpolationWeights(nSource,Nrow):
+    """
+        Linear interpolation weights from nSource to Nrow evenly spaced samples.
+        Weights are cached per (nSource, Nrow)
+
+        :parameters:
+            - `nSource` (int) : number of source samples
+            - `Nrow` (int) : number of target samples
+
+        :Return:
+            - `index` (numpy.array(Nrow,)) : index of the lower source sample
+            - `nextIndex` (numpy.array(Nrow,)) : index of the upper source sample
+            - `weight` (numpy.array(Nrow,)) : weight of the upper source sample
+
+    """
+    key = (nSource,Nrow)
+    if key not in _INTERPOLATION_WEIGHTS:
+
+        if nSource < 1:
+            raise Exception("[pyCGM2] normalisation of an empty time sequence")
+
+        if nSource == 1:
+            index = np.zeros(Nrow,dtype=int)
+            nextIndex = np.zeros(Nrow,dtype=int)
+            weight = np.zeros(Nrow)
+        else:
+            xp = np.linspace(0, 100, nSource)
+            x = np.linspace(0, 100, Nrow)
+
+            index = np.clip(np.searchsorted(xp,x,side="right")-1,0,nSource-2)
+            nextIndex = index+1
+            weight = (x - xp[index]) / (xp[nextIndex] - xp[index])
+
+        _INTERPOLATION_WEIGHTS[key] = (index,nextIndex,weight)
+
+    return _INTERPOLATION_WEIGHTS[key]
+
 
 def timeSequenceNormalisation(Nrow,data):
     """
@@ -10,11 +51,50 @@ def timeSequenceNormalisation(Nrow,data):
             - `Nrow` (double) : number of interval
             - `data` (numpy.array(m,n)) : number of interval
 
+        .. note:: all columns are interpolated together with cached interpolation weights
+
     """
 
-    ncol = data.shape[1]
-    out=np.zeros((Nrow,ncol))
-    for i in range(0,ncol):
-        out[:,i] = np.interp(np.linspace(0, 100, Nrow), np.linspace(0, 100, data.shape[0]), data[:,i])
+    index,nextIndex,weight = interpolationWeights(data.shape[0],Nrow)
+
+    lower = data[index,:]
+    out = lower + (data[nextIndex,:]-lower)*weight[:,np.newaxis]
 
     return out
+
+
+def timeSequencesNormalisation(Nrow,dataList):
+    """
+        Normalisation of many arrays of different lengths in a single operation
+
+        :parameters:
+            - `Nrow` (double) : number of interval
+            - `dataList` (list of numpy.array(m_i,n)) : arrays with the same number of columns
+
+        :Return:
+            - `out` (numpy.array(len(dataList),Nrow,n)) : normalized arrays
+
+    """
+    if len(dataList) == 0:
+        return np.zeros((0,Nrow,0))
+
+    indexes = list()
+    nextIndexes = list()
+    weights = list()
+    offset = 0
+    for data in dataList:
+        index,nextIndex,weight = interpolationWeights(data.shape[0],Nrow)
+        indexes.append(index+offset)
+        nextIndexes.append(nextIndex+offset)
+        weights.append(weight)
+        offset += data.shape[0]
+
+    block = np.concatenate(dataList,axis=0)
+    index = np.concatenate(indexes)
+    nextIndex = np.concatenate(nextIndexes)
+    weight = np.concatenate(weights)
+
+    lower = block[index,:]
+    out = lower + (block[nextIndex,:]-lower)*weight[:,np.newaxis]
+
+    return out.reshape((len(dataList),Nrow,block.shape[1]))
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 import logging
-import copy
 
 from pyCGM2 import btk
 
@@ -145,6 +144,13 @@ class CGM1(CGM):
     def setVersion(self,string):
         self.version = string
 
+    def getCalibrationCopy(self):
+        model = super(CGM1, self).getCalibrationCopy()
+        if hasattr(model,"_TopLumbar5"):
+            del model._TopLumbar5 # trajectory, computed again from the pelvis motion
+
+        return model
+
     def __repr__(self):
         return "CGM1.0"
 
@@ -204,7 +210,8 @@ class CGM1(CGM):
                     self.m_jointCollection = joint_list
 
                 if bodyPart == enums.BodyPart.UpperLimb:
-                    del self._TopLumbar5 # delete because compute from pelvis
+                    if hasattr(self,"_TopLumbar5"): # not in a model loaded from a file
+                        del self._TopLumbar5 # delete because compute from pelvis
 
                     logging.warning("[pyCGM2] Model reconfigured to UpperLimb model - Missing lower-limb tracking markers")
                     segment_list = [it for it in self.m_segmentCollection if it.name in self.UPPERLIMB_SEGMENTS]
@@ -2587,15 +2594,12 @@ class CGM1(CGM):
                 self._anatomical_motion(aqui,"Pelvis",originLabel = str(dictAnat["Pelvis"]['labels'][3]))
 
 
-                TopLumbar5=np.zeros((aqui.GetPointFrameNumber(),3))
-
-                for i in range(0,aqui.GetPointFrameNumber()):
-                    lhjc = aqui.GetPoint("LHJC").GetValues()[i,:]
-                    rhjc =  aqui.GetPoint("RHJC").GetValues()[i,:]
-                    pelvisScale = np.linalg.norm(lhjc-rhjc)
-                    offset = (lhjc+rhjc)/2.0
-                    R = self.getSegment("Pelvis").anatomicalFrame.motion[i].getRotation()
-                    TopLumbar5[i,:] = offset +  np.dot(R,(np.array([ 0, 0, 0.925]))* pelvisScale)
+                lhjc = aqui.GetPoint("LHJC").GetValues()
+                rhjc =  aqui.GetPoint("RHJC").GetValues()
+                pelvisScale = np.linalg.norm(lhjc-rhjc,axis=1)
+                offset = (lhjc+rhjc)/2.0
+                R = self.getSegment("Pelvis").anatomicalFrame.motion.getRotations()
+                TopLumbar5 = offset +  np.einsum("nij,nj->ni",R,np.outer(pelvisScale,np.array([ 0, 0, 0.925])))
 
 
                 self._TopLumbar5 = TopLumbar5
@@ -2669,33 +2673,13 @@ class CGM1(CGM):
         val=(aqui.GetPoint("LASI").GetValues() + aqui.GetPoint("RASI").GetValues()) / 2.0
         btkTools.smartAppendPoint(aqui,"midASIS",val, desc="")
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Pelvis"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Pelvis"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- HJCs
@@ -2712,48 +2696,27 @@ class CGM1(CGM):
         # --- motion of the anatomical referential
 
         seg.anatomicalFrame.motion=[]
-        TopLumbar5=np.zeros((aqui.GetPointFrameNumber(),3))
 
         # additional markers
         val=(aqui.GetPoint("LHJC").GetValues() + aqui.GetPoint("RHJC").GetValues()) / 2.0
         btkTools.smartAppendPoint(aqui,"midHJC",val,desc="")
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Pelvis"]['sequence'])
+        pt1=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][3])).GetValues()
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat["Pelvis"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
-
-            # length
-            lhjc = aqui.GetPoint("LHJC").GetValues()[i,:]
-            rhjc =  aqui.GetPoint("RHJC").GetValues()[i,:]
-            pelvisScale = np.linalg.norm(lhjc-rhjc)
-            offset = (lhjc+rhjc)/2.0
+        # length
+        lhjc = aqui.GetPoint("LHJC").GetValues()
+        rhjc =  aqui.GetPoint("RHJC").GetValues()
+        pelvisScale = np.linalg.norm(lhjc-rhjc,axis=1)
+        offset = (lhjc+rhjc)/2.0
 
-            TopLumbar5[i,:] = offset +  np.dot(R,(np.array([ 0, 0, 0.925]))* pelvisScale)
-            #seg.anatomicalFrame.static.addNode("TL5",TopLumbar5,positionType="Local")
+        TopLumbar5 = offset +  np.einsum("nij,nj->ni",R,np.outer(pelvisScale,np.array([ 0, 0, 0.925])))
+        #seg.anatomicalFrame.static.addNode("TL5",TopLumbar5,positionType="Local")
 
         self._TopLumbar5 = TopLumbar5
 
@@ -2793,35 +2756,17 @@ class CGM1(CGM):
         # computation
                 # --- LKJC
         LKJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][3])).GetValues()
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Thigh"]["TF"]['sequence'])
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Left Thigh"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        for i in range(0,aqui.GetPointFrameNumber()):
 
-            LKJCvalues[i,:] = modelDecorator.chord( (self.mp["LeftKneeWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=-self.mp_computed["LeftThighRotationOffset"] )
+            LKJCvalues[i,:] = modelDecorator.chord( (self.mp["LeftKneeWidth"]+ markerDiameter)/2.0 ,pt1[i,:],pt2[i,:],pt3[i,:], beta=-self.mp_computed["LeftThighRotationOffset"] )
 
         if  "useLeftKJCmarker" in options.keys() and options["useLeftKJCmarker"] is not "LKJC":
             logging.info("[pyCGM2] - LKJC marker forced to use %s"%(options["useLeftKJCmarker"]))
@@ -2838,34 +2783,13 @@ class CGM1(CGM):
         # additional markers
         # NA
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][3])).GetValues()
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Left Thigh"]['sequence'])
-
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat["Left Thigh"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _right_thigh_motion(self,aqui, dictRef,dictAnat,options=None):
         """
@@ -2901,36 +2825,18 @@ class CGM1(CGM):
 
         RKJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][3])).GetValues()
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Thigh"]["TF"]['sequence'])
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Right Thigh"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        for i in range(0,aqui.GetPointFrameNumber()):
 
 
-            RKJCvalues[i,:] = modelDecorator.chord( (self.mp["RightKneeWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=self.mp_computed["RightThighRotationOffset"] )
+            RKJCvalues[i,:] = modelDecorator.chord( (self.mp["RightKneeWidth"]+ markerDiameter)/2.0 ,pt1[i,:],pt2[i,:],pt3[i,:], beta=self.mp_computed["RightThighRotationOffset"] )
 
         if  "useRightKJCmarker" in options.keys() and options["useRightKJCmarker"] is not "RKJC":
             logging.info("[pyCGM2] - RKJC marker forced to use %s"%(options["useRightKJCmarker"]))
@@ -2954,33 +2860,13 @@ class CGM1(CGM):
 
         # computation
         seg.anatomicalFrame.motion=[]
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][3])).GetValues()
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Right Thigh"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat["Right Thigh"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _left_shank_motion(self,aqui, dictRef,dictAnat,options=None):
@@ -3021,40 +2907,20 @@ class CGM1(CGM):
         LAJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][0])).GetValues()[i,:] #ANK
-            pt2=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][1])).GetValues()[i,:] #KJC
-            pt3=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][2])).GetValues()[i,:] #TIB
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Shank"]["TF"]['sequence'])
+        pt1=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][3])).GetValues()
 
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Left Shank"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
+        for i in range(0,aqui.GetPointFrameNumber()):
 
-            LAJCvalues[i,:] = modelDecorator.chord( (self.mp["LeftAnkleWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=-self.mp_computed["LeftShankRotationOffset"] )
+            LAJCvalues[i,:] = modelDecorator.chord( (self.mp["LeftAnkleWidth"]+ markerDiameter)/2.0 ,pt1[i,:],pt2[i,:],pt3[i,:], beta=-self.mp_computed["LeftShankRotationOffset"] )
 
             # update of the AJC location with rotation around abdAddAxis
-            LAJCvalues[i,:] = self._rotateAjc(LAJCvalues[i,:],pt2,pt1,self.mp_computed["LeftAnkleAbAddOffset"])
+            LAJCvalues[i,:] = self._rotateAjc(LAJCvalues[i,:],pt2[i,:],pt1[i,:],self.mp_computed["LeftAnkleAbAddOffset"])
 
         if  "useLeftAJCmarker" in options.keys() and options["useLeftAJCmarker"] is not "LAJC":
             logging.info("[pyCGM2] - LAJC marker forced to use %s"%(options["useLeftAJCmarker"]))
@@ -3078,33 +2944,13 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3])).GetValues()
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Left Shank"]['sequence'])
-            csFrame=frame.Frame()
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat["Left Shank"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3147,17 +2993,13 @@ class CGM1(CGM):
         rotZ_tibRot[0,1] = np.sin(tibialTorsion)
         rotZ_tibRot[1,0] = - np.sin(tibialTorsion)
         rotZ_tibRot[1,1] = np.cos(tibialTorsion)
-        LKJC = aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3]))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=LKJC.GetValues()[i,:]
-            segProx.getReferential("TF").addMotionFrame(seg.getReferential("TF").motion[i]) # copy technical shank
+        ptOrigin = aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3])).GetValues()
 
-            R = np.dot(seg.anatomicalFrame.motion[i].getRotation(),rotZ_tibRot) # affect Tibial torsion to anatomical shank
+        # copy technical shank
+        segProx.getReferential("TF").setMotion(seg.getReferential("TF").motion.getRotations(),seg.getReferential("TF").motion.getTranslations())
 
-            csFrame.update(R,ptOrigin)
-            segProx.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.dot(seg.anatomicalFrame.motion.getRotations(),rotZ_tibRot) # affect Tibial torsion to anatomical shank
+        segProx.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3196,40 +3038,21 @@ class CGM1(CGM):
 
         RAJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][0])).GetValues()[i,:] #ank
-            pt2=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][1])).GetValues()[i,:] #kjc
-            pt3=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][2])).GetValues()[i,:] #tib
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Shank"]["TF"]['sequence'])
+        pt1=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][3])).GetValues()
 
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Right Shank"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        for i in range(0,aqui.GetPointFrameNumber()):
 
             # ajc position from chord modified by shank offset
-            RAJCvalues[i,:] = modelDecorator.chord( (self.mp["RightAnkleWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=self.mp_computed["RightShankRotationOffset"] )
+            RAJCvalues[i,:] = modelDecorator.chord( (self.mp["RightAnkleWidth"]+ markerDiameter)/2.0 ,pt1[i,:],pt2[i,:],pt3[i,:], beta=self.mp_computed["RightShankRotationOffset"] )
 
             # update of the AJC location with rotation around abdAddAxis
-            RAJCvalues[i,:] = self._rotateAjc(RAJCvalues[i,:],pt2,pt1,   self.mp_computed["RightAnkleAbAddOffset"])
+            RAJCvalues[i,:] = self._rotateAjc(RAJCvalues[i,:],pt2[i,:],pt1[i,:],   self.mp_computed["RightAnkleAbAddOffset"])
 
         # --- LAJC
         if  "useRightAJCmarker" in options.keys() and options["useRightAJCmarker"] is not "RAJC":
@@ -3254,33 +3077,13 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()[i,:]
-
+        pt1=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Right Shank"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat["Right Shank"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _right_shankProximal_motion(self,aqui,dictAnat,options=None):
         """
@@ -3318,16 +3121,13 @@ class CGM1(CGM):
         rotZ_tibRot[1,0] = - np.sin(tibialTorsion)
         rotZ_tibRot[1,1] = np.cos(tibialTorsion)
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()[i,:]
-
-            segProx.getReferential("TF").addMotionFrame(seg.getReferential("TF").motion[i]) # copy technical shank
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()
 
-            R = np.dot(seg.anatomicalFrame.motion[i].getRotation(),rotZ_tibRot)
+        # copy technical shank
+        segProx.getReferential("TF").setMotion(seg.getReferential("TF").motion.getRotations(),seg.getReferential("TF").motion.getTranslations())
 
-            csFrame.update(R,ptOrigin)
-            segProx.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.dot(seg.anatomicalFrame.motion.getRotations(),rotZ_tibRot)
+        segProx.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3361,45 +3161,25 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
-
-            if dictRef["Left Foot"]["TF"]['labels'][2] is not None:
-                pt3=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Left Shank Proximal").anatomicalFrame.motion[i].m_axisY
-
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Foot"]["TF"]['sequence'])
+        pt1=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][0])).GetValues() #toe
+        pt2=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][1])).GetValues() #ajc
 
+        if dictRef["Left Foot"]["TF"]['labels'][2] is not None:
+            pt3=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Left Shank Proximal").anatomicalFrame.motion.getRotations()[:,:,1]
 
-            if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
-                R2 = R
-            else:
-                R2 = np.dot(R,self._R_leftUnCorrfoot_dist_prox)
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][3])).GetValues()
 
+        R=frame.getRotationsFromVectors(pt2-pt1,v,dictRef["Left Foot"]["TF"]['sequence'])
 
-            csFrame.m_axisX=R2[:,0]
-            csFrame.m_axisY=R2[:,1]
-            csFrame.m_axisZ=R2[:,2]
-            csFrame.setRotation(R2)
-            csFrame.setTranslation(ptOrigin)
+        if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
+            R2 = R # e.g from proximal shank
+        else:
+            R2 = np.dot(R,self._R_leftUnCorrfoot_dist_prox) # e.g from distal shank Y axis
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        seg.getReferential("TF").setMotion(R2,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -3409,14 +3189,9 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()[i,:]
-
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3441,43 +3216,25 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
+        pt1=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][0])).GetValues() #toe
+        pt2=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][1])).GetValues() #ajc
 
-            if dictRef["Right Foot"]["TF"]['labels'][2] is not None:
-                pt3=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Right Shank Proximal").anatomicalFrame.motion[i].m_axisY
-
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        if dictRef["Right Foot"]["TF"]['labels'][2] is not None:
+            pt3=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Right Shank Proximal").anatomicalFrame.motion.getRotations()[:,:,1]
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Foot"]["TF"]['sequence'])
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][3])).GetValues()
 
-            if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
-                R2 = R # e.g from proximal shank
-            else:
-                R2 = np.dot(R,self._R_rightUnCorrfoot_dist_prox) # e.g from distal shank Y axis
+        R=frame.getRotationsFromVectors(pt2-pt1,v,dictRef["Right Foot"]["TF"]['sequence'])
 
-            csFrame.m_axisX=R2[:,0]
-            csFrame.m_axisY=R2[:,1]
-            csFrame.m_axisZ=R2[:,2]
-            csFrame.setRotation(R2)
-            csFrame.setTranslation(ptOrigin)
+        if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
+            R2 = R # e.g from proximal shank
+        else:
+            R2 = np.dot(R,self._R_rightUnCorrfoot_dist_prox) # e.g from distal shank Y axis
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        seg.getReferential("TF").setMotion(R2,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -3487,14 +3244,9 @@ class CGM1(CGM):
 
         # computation
         seg.anatomicalFrame.motion=[]
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()[i,:]
-
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     # ---- static PIG -----
 
@@ -3513,36 +3265,22 @@ class CGM1(CGM):
 
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aquiStatic.GetPointFrameNumber()):
-            ptOrigin=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()[i,:]
-
+        ptOrigin=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()
 
-            pt1=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][1])).GetValues()[i,:] #hee
-
-            if ("leftFlatFoot" in options.keys() and options["leftFlatFoot"]):
-                pt2[2] = pt1[2]+self.mp['LeftSoleDelta']
-
-            if dictAnat["Left Foot"]['labels'][2] is not None:
-                pt3=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Left Shank").anatomicalFrame.motion[i].m_axisY # distal segment
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][0])).GetValues() #toe
+        pt2=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][1])).GetValues() #hee
 
+        if ("leftFlatFoot" in options.keys() and options["leftFlatFoot"]):
+            pt2[:,2] = pt1[:,2]+self.mp['LeftSoleDelta']
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Left Foot"]['sequence'])
+        if dictAnat["Left Foot"]['labels'][2] is not None:
+            pt3=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Left Shank").anatomicalFrame.motion.getRotations()[:,:,1] # distal segment
 
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromVectors(pt2-pt1,v,dictAnat["Left Foot"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _right_foot_motion_static(self,aquiStatic, dictAnat,options=None):
@@ -3555,37 +3293,22 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aquiStatic.GetPointFrameNumber()):
-            ptOrigin=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()[i,:]
-
-
-            pt1=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][1])).GetValues()[i,:] #hee
+        ptOrigin=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()
 
-            if ("rightFlatFoot" in options.keys() and options["rightFlatFoot"]):
-                pt2[2] = pt1[2]+self.mp['RightSoleDelta']
+        pt1=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][0])).GetValues() #toe
+        pt2=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][1])).GetValues() #hee
 
+        if ("rightFlatFoot" in options.keys() and options["rightFlatFoot"]):
+            pt2[:,2] = pt1[:,2]+self.mp['RightSoleDelta']
 
-            if dictAnat["Right Foot"]['labels'][2] is not None:
-                pt3=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Right Shank").anatomicalFrame.motion[i].m_axisY # distal segment
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Right Foot"]['sequence'])
-
+        if dictAnat["Right Foot"]['labels'][2] is not None:
+            pt3=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Right Shank").anatomicalFrame.motion.getRotations()[:,:,1] # distal segment
 
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromVectors(pt2-pt1,v,dictAnat["Right Foot"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     # ----- least-square Segmental motion ------
     def _pelvis_motion_optimize(self,aqui, dictRef, motionMethod,anatomicalFrameMotionEnable=True):
@@ -3616,30 +3339,16 @@ class CGM1(CGM):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
 
         # --- HJC
@@ -3698,32 +3407,16 @@ class CGM1(CGM):
                 i+=1
 
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
         # --- LKJC
         desc = seg.getReferential('TF').static.getNode_byLabel("LKJC").m_desc
@@ -3773,32 +3466,16 @@ class CGM1(CGM):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
         # --- RKJC
         desc = seg.getReferential('TF').static.getNode_byLabel("RKJC").m_desc
@@ -3845,31 +3522,16 @@ class CGM1(CGM):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
 
         # --- LAJC
@@ -3921,32 +3583,16 @@ class CGM1(CGM):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
         # RAJC
         desc = seg.getReferential('TF').static.getNode_byLabel("RAJC").m_desc
@@ -3982,31 +3628,16 @@ class CGM1(CGM):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
 
         # --- AJC from Foot
@@ -4040,31 +3671,16 @@ class CGM1(CGM):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
 
         # --- AJC from Foot
@@ -4084,12 +3700,9 @@ class CGM1(CGM):
         seg.anatomicalFrame.motion=[]
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(originLabel).GetValues()[i,:]
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(originLabel).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _rotate_anatomical_motion(self,segmentLabel,angle,aqui,options=None):
@@ -4121,13 +3734,11 @@ class CGM1(CGM):
         rotZ[1,0] =  np.sin(angle)
         rotZ[1,1] = np.cos(angle)
 
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            ptOrigin=seg.anatomicalFrame.motion[i].getTranslation()
+        ptOrigin=seg.anatomicalFrame.motion.getTranslations()
 
-            R = np.dot(seg.anatomicalFrame.motion[i].getRotation(),rotZ)
+        R = np.dot(seg.anatomicalFrame.motion.getRotations(),rotZ)
 
-            seg.anatomicalFrame.motion[i].update(R,ptOrigin)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -5135,53 +4746,25 @@ class CGM1(CGM):
         LSJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
         RSJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-        LVWMvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        RVWMvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        OTvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][3])).GetValues()[i,:]
+        pt1=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][3])).GetValues()
 
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Thorax"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+        OTvalues = ptOrigin + -1.0*(markerDiameter/2.0)*R[:,:,0]
 
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Thorax"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-            OT = ptOrigin + -1.0*(markerDiameter/2.0)*csFrame.m_axisX #
-            OTvalues[i,:] = OT
-
-            if self.m_bodypart is not enums.BodyPart.LowerLimbTrunk:
-                LSHO = aqui.GetPoint(str("LSHO")).GetValues()[i,:]
-                LVWM = np.cross((LSHO - OT ), csFrame.m_axisX ) + LSHO
-
-                LSJCvalues[i,:] = modelDecorator.chord( -1.0*(self.mp["LeftShoulderOffset"]+ markerDiameter/2.0) ,LSHO,OT,LVWM, beta=0 )
-                LVWMvalues[i,:] = LVWM
-
-                RSHO = aqui.GetPoint(str("RSHO")).GetValues()[i,:]
-                RVWM = np.cross((RSHO - OT ), csFrame.m_axisX ) + RSHO
+        if self.m_bodypart is not enums.BodyPart.LowerLimbTrunk:
+            LSHO = aqui.GetPoint(str("LSHO")).GetValues()
+            RSHO = aqui.GetPoint(str("RSHO")).GetValues()
+            LVWMvalues = np.cross((LSHO - OTvalues ), R[:,:,0] ) + LSHO
+            RVWMvalues = np.cross((RSHO - OTvalues ), R[:,:,0] ) + RSHO
 
-                RSJCvalues[i,:] = modelDecorator.chord( 1.0*(self.mp["RightShoulderOffset"]+ markerDiameter/2.0) ,RSHO,OT,RVWM, beta=0 )
-                RVWMvalues[i,:] = RVWM
+            for i in range(0,aqui.GetPointFrameNumber()):
+                LSJCvalues[i,:] = modelDecorator.chord( -1.0*(self.mp["LeftShoulderOffset"]+ markerDiameter/2.0) ,LSHO[i,:],OTvalues[i,:],LVWMvalues[i,:], beta=0 )
+                RSJCvalues[i,:] = modelDecorator.chord( 1.0*(self.mp["RightShoulderOffset"]+ markerDiameter/2.0) ,RSHO[i,:],OTvalues[i,:],RVWMvalues[i,:], beta=0 )
 
         btkTools.smartAppendPoint(aqui,"OT",OTvalues,desc="")
 
@@ -5208,56 +4791,30 @@ class CGM1(CGM):
 
         # --- motion of the anatomical referential
         seg.anatomicalFrame.motion=[]
-        T5inThorax = np.zeros((aqui.GetPointFrameNumber(),3))
-        C7inThorax = np.zeros((aqui.GetPointFrameNumber(),3))
-        T10inThorax = np.zeros((aqui.GetPointFrameNumber(),3))
 
         # additional markers
         # NA
         # computation
 
         #self._TopLumbar5
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][3])).GetValues()
 
-            pt1=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][0])).GetValues()[i,:] #midTop
-            pt2=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][1])).GetValues()[i,:] #midBottom
-            pt3=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][2])).GetValues()[i,:] #midFront
-            ptOrigin=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][3])).GetValues()[i,:] #OT
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat["Thorax"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
+        if hasattr(self,"_TopLumbar5"):
+            T5inThorax = np.einsum("nji,nj->ni",R,self._TopLumbar5-ptOrigin)
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Thorax"]['sequence'])
-
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
-
-            if hasattr(self,"_TopLumbar5"):
-                T5inThorax[i,:] = np.dot(R.T,self._TopLumbar5[i,:]-ptOrigin)
-
-
-            offset =( ptOrigin + np.dot(R,np.array([-markerDiameter/2.0,0,0])) - ptOrigin)*1.05
-
-            C7Global= aqui.GetPoint(str("C7")).GetValues()[i,:] + offset
-            C7inThorax[i,:] = np.dot(R.T,C7Global-ptOrigin)
+        offset = ( -markerDiameter/2.0*R[:,:,0] )*1.05
 
-            T10Global= aqui.GetPoint(str("T10")).GetValues()[i,:] + offset
-            T10inThorax[i,:] = np.dot(R.T,T10Global-ptOrigin)
+        C7Global= aqui.GetPoint(str("C7")).GetValues() + offset
+        C7inThorax = np.einsum("nji,nj->ni",R,C7Global-ptOrigin)
 
+        T10Global= aqui.GetPoint(str("T10")).GetValues() + offset
+        T10inThorax = np.einsum("nji,nj->ni",R,T10Global-ptOrigin)
 
         if hasattr(self,"_TopLumbar5"):
             meanT5inThorax =np.mean(T5inThorax,axis=0)
@@ -5305,33 +4862,13 @@ class CGM1(CGM):
         # additional markers
 
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" Clavicle"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef[side+" Clavicle"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -5340,33 +4877,13 @@ class CGM1(CGM):
         # additional markers
         # NA
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" Clavicle"]['sequence'])
-
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][3])).GetValues()
 
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat[side+" Clavicle"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _upperArm_motion(self,side,aqui, dictRef,dictAnat,options=None,frameReconstruction="Both"):
@@ -5422,40 +4939,17 @@ class CGM1(CGM):
             # computation
             EJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
-
-                pt1=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][0])).GetValues()[i,:]
-                pt2=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][1])).GetValues()[i,:]
-                pt3=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][2])).GetValues()[i,:]
-                ptOrigin=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+            pt1=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][1])).GetValues()
+            pt3=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][2])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][3])).GetValues()
 
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" UpperArm"]["TF"]['sequence'])
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-                SJC = aqui.GetPoint(prefix+"SJC").GetValues()[i,:]
-                LHE=aqui.GetPoint(prefix+"ELB").GetValues()[i,:]
-                CVM = aqui.GetPoint(prefix+"CVM").GetValues()[i,:]
+            R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef[side+" UpperArm"]["TF"]['sequence'])
+            seg.getReferential("TF").setMotion(R,ptOrigin)
 
+            for i in range(0,aqui.GetPointFrameNumber()):
                 #EJCvalues[i,:] =  modelDecorator.chord( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,LHE,SJC,CVM, beta=0 )
-                EJCvalues[i,:] =  modelDecorator.chord( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=0 )
+                EJCvalues[i,:] =  modelDecorator.chord( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,pt1[i,:],pt2[i,:],pt3[i,:], beta=0 )
 
 
             #btkTools.smartAppendPoint(aqui,"LKJC_Chord",LKJCvalues,desc="chord")
@@ -5488,34 +4982,13 @@ class CGM1(CGM):
             # additional markers
             # NA
             # computation
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
+            pt1=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][1])).GetValues()
+            pt3=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][2])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][3])).GetValues()
 
-                pt1=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][0])).GetValues()[i,:]
-                pt2=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][1])).GetValues()[i,:]
-                pt3=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][2])).GetValues()[i,:]
-                ptOrigin=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" UpperArm"]['sequence'])
-
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat[side+" UpperArm"]['sequence'])
+            seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _foreArm_motion(self,side,aqui, dictRef,dictAnat,options=None, frameReconstruction="both"):
         """
@@ -5556,52 +5029,23 @@ class CGM1(CGM):
             # additional markers
 
             # computation
-            WJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
-
-                pt1=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][0])).GetValues()[i,:]#
-                pt2=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][1])).GetValues()[i,:]
-                pt3=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][2])).GetValues()[i,:]
-                ptOrigin=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][3])).GetValues()[i,:]
+            pt1=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][1])).GetValues()
+            pt3=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][2])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][3])).GetValues()
 
+            R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef[side+" ForeArm"]["TF"]['sequence'])
+            seg.getReferential("TF").setMotion(R,ptOrigin)
 
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" ForeArm"]["TF"]['sequence'])
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-                EJC = pt2
-                US=pt3
-                RS=pt1
-
-                MWP=aqui.GetPoint(prefix+"MWP").GetValues()[i,:]
-
-                WJCaxis = np.cross((US-RS),(EJC-MWP))
-                WJCaxis = WJCaxis / np.linalg.norm(WJCaxis)
-                WJCvalues[i,:] =MWP +  (s*(self.mp[side +"WristWidth"]+markerDiameter)/2.0)*WJCaxis
-
-
-                EJC=aqui.GetPoint(prefix+"EJC").GetValues()[i,:]
-                US=aqui.GetPoint(prefix+"WRB").GetValues()[i,:]
-                RS=aqui.GetPoint(prefix+"WRA").GetValues()[i,:]
-                MWP=aqui.GetPoint(prefix+"MWP").GetValues()[i,:]
+            EJC = pt2
+            US=pt3
+            RS=pt1
+            MWP=aqui.GetPoint(prefix+"MWP").GetValues()
 
+            WJCaxis = np.cross((US-RS),(EJC-MWP))
+            WJCaxis = WJCaxis / np.linalg.norm(WJCaxis,axis=1).reshape(-1,1)
+            WJCvalues =MWP +  (s*(self.mp[side +"WristWidth"]+markerDiameter)/2.0)*WJCaxis
 
             #btkTools.smartAppendPoint(aqui,"LKJC_Chord",LKJCvalues,desc="chord")
 
@@ -5629,38 +5073,18 @@ class CGM1(CGM):
             seg.anatomicalFrame.motion=[]
 
             # computation
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
-
-                pt1=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][0])).GetValues()[i,:]
-                pt2=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][1])).GetValues()[i,:]
-                if dictAnat[side+" ForeArm"]['labels'][2] is not None:
-                    pt3=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][2])).GetValues()[i,:]
-
-                ptOrigin=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                if dictAnat[side+" ForeArm"]['labels'][2] is not None:
-                    v=(pt3-pt1)
-                    v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-                else:
-                    v=self.getSegment(side+" UpperArm").anatomicalFrame.motion[i].m_axisY
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" ForeArm"]['sequence'])
+            pt1=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][1])).GetValues()
+            if dictAnat[side+" ForeArm"]['labels'][2] is not None:
+                pt3=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][2])).GetValues()
+                v=(pt3-pt1)
+            else:
+                v=self.getSegment(side+" UpperArm").anatomicalFrame.motion.getRotations()[:,:,1]
 
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
+            ptOrigin=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][3])).GetValues()
 
-                seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            R=frame.getRotationsFromVectors(pt2-pt1,v,dictAnat[side+" ForeArm"]['sequence'])
+            seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _hand_motion(self,side,aqui, dictRef,dictAnat,options=None):
         """
@@ -5705,37 +5129,19 @@ class CGM1(CGM):
         # computation
         HOvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][3])).GetValues()
 
-            pt1=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][3])).GetValues()[i,:]
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef[side+" Hand"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" Hand"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-            WJC=aqui.GetPoint(prefix+"WJC").GetValues()[i,:]
-            MH2=aqui.GetPoint(prefix+"FIN").GetValues()[i,:]
-            MWP=aqui.GetPoint(prefix+"MWP").GetValues()[i,:]
-            HOvalues[i,:] =  modelDecorator.chord( (self.mp[side+"HandThickness"]+ markerDiameter)/2.0 ,MH2, WJC, MWP, beta=0 )
+        WJC=aqui.GetPoint(prefix+"WJC").GetValues()
+        MH2=aqui.GetPoint(prefix+"FIN").GetValues()
+        MWP=aqui.GetPoint(prefix+"MWP").GetValues()
+        for i in range(0,aqui.GetPointFrameNumber()):
+            HOvalues[i,:] =  modelDecorator.chord( (self.mp[side+"HandThickness"]+ markerDiameter)/2.0 ,MH2[i,:], WJC[i,:], MWP[i,:], beta=0 )
 
 
         if  "useLeftHOmarker" in options.keys():
@@ -5760,33 +5166,13 @@ class CGM1(CGM):
         # additional markers
         # NA
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+        pt1=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][3])).GetValues()
 
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" Hand"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictAnat[side+" Hand"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _head_motion(self,aqui, dictRef,dictAnat,options=None):
         """
@@ -5819,32 +5205,13 @@ class CGM1(CGM):
         btkTools.smartAppendPoint(aqui,"HC",valmHC,desc="")
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][3])).GetValues()
 
-            pt1=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
-            pt3=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][2])).GetValues()[i,:] #ajc
-            ptOrigin=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Head"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Head"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -5854,13 +5221,9 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Head"]['labels'][3])).GetValues()[i,:]
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Head"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     # --- opensim --------
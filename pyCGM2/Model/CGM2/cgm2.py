@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 import logging
-import copy
 
 from pyCGM2 import btk
 
@@ -1577,15 +1576,12 @@ class CGM2_4(CGM2_3):
                 self._pelvis_motion_optimize(aqui, dictRef, motionMethod)
                 self._anatomical_motion(aqui,"Pelvis",originLabel = str(dictAnat["Pelvis"]['labels'][3]))
 
-                TopLumbar5=np.zeros((aqui.GetPointFrameNumber(),3))
-
-                for i in range(0,aqui.GetPointFrameNumber()):
-                    lhjc = aqui.GetPoint("LHJC").GetValues()[i,:]
-                    rhjc =  aqui.GetPoint("RHJC").GetValues()[i,:]
-                    pelvisScale = np.linalg.norm(lhjc-rhjc)
-                    offset = (lhjc+rhjc)/2.0
-                    R = self.getSegment("Pelvis").anatomicalFrame.motion[i].getRotation()
-                    TopLumbar5[i,:] = offset +  np.dot(R,(np.array([ 0, 0, 0.925]))* pelvisScale)
+                lhjc = aqui.GetPoint("LHJC").GetValues()
+                rhjc =  aqui.GetPoint("RHJC").GetValues()
+                pelvisScale = np.linalg.norm(lhjc-rhjc,axis=1)
+                offset = (lhjc+rhjc)/2.0
+                R = self.getSegment("Pelvis").anatomicalFrame.motion.getRotations()
+                TopLumbar5 = offset +  np.einsum("nij,nj->ni",R,np.outer(pelvisScale,np.array([ 0, 0, 0.925])))
 
                 self._TopLumbar5 = TopLumbar5
 
@@ -1664,40 +1660,19 @@ class CGM2_4(CGM2_3):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][1])).GetValues()[i,:]
-
-            if dictRef["Left Foot"]["TF"]['labels'][2] is not None:
-                pt3=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][2])).GetValues()[i,:] # not used
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Left Shank").anatomicalFrame.motion[i].m_axisY
-
-
-
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][3])).GetValues()[i,:]
+        pt1=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][1])).GetValues()
 
+        if dictRef["Left Foot"]["TF"]['labels'][2] is not None:
+            pt3=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][2])).GetValues() # not used
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Left Shank").anatomicalFrame.motion.getRotations()[:,:,1]
 
-            a1=(pt2-pt1)
-            a1= np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Foot"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromVectors(pt2-pt1,v,dictRef["Left Foot"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
         # --- FJC
         # btkTools.smartAppendPoint(aqui,"LFJC",seg.getReferential("TF").getNodeTrajectory("LFJC"),desc="from hindFoot" ) # put in ForefootMotion
@@ -1706,13 +1681,9 @@ class CGM2_4(CGM2_3):
 
         # --- motion of the anatomical referential
         seg.anatomicalFrame.motion=[]
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()[i,:]
-            #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _left_foreFoot_motion(self,aqui, dictRef,dictAnat,options=None):
@@ -1737,46 +1708,22 @@ class CGM2_4(CGM2_3):
         # NA
 
         #computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][3])).GetValues()
 
-            pt1=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][2])).GetValues()[i,:]
-
-            ptOrigin=aqui.GetPoint(str(dictRef["Left ForeFoot"]["TF"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1= np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left ForeFoot"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Left ForeFoot"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
         # --- motion of new markers
         btkTools.smartAppendPoint(aqui,"LvSMH",seg.getReferential("TF").getNodeTrajectory("LvSMH") )
 
         # --- motion of the anatomical referential
         seg.anatomicalFrame.motion=[]
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left ForeFoot"]['labels'][3])).GetValues()[i,:]
-            #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left ForeFoot"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -1799,40 +1746,19 @@ class CGM2_4(CGM2_3):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][0])).GetValues()[i,:] #cun
-            pt2=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
-
-            if dictRef["Right Foot"]["TF"]['labels'][2] is not None:
-                pt3=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][2])).GetValues()[i,:] # not used
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Right Shank").anatomicalFrame.motion[i].m_axisY
-
-
+        pt1=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][1])).GetValues()
 
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1= np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Foot"]["TF"]['sequence'])
+        if dictRef["Right Foot"]["TF"]['labels'][2] is not None:
+            pt3=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][2])).GetValues() # not used
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Right Shank").anatomicalFrame.motion.getRotations()[:,:,1]
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromVectors(pt2-pt1,v,dictRef["Right Foot"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
         # --- RvTOE
         btkTools.smartAppendPoint(aqui,"RFJC-HindFoot",seg.getReferential("TF").getNodeTrajectory("RFJC"),desc="from hindFoot" )
@@ -1840,13 +1766,9 @@ class CGM2_4(CGM2_3):
 
         # --- motion of the technical referential
         seg.anatomicalFrame.motion=[]
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()[i,:]
-            #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _right_foreFoot_motion(self,aqui, dictRef,dictAnat,options=None):
@@ -1871,34 +1793,13 @@ class CGM2_4(CGM2_3):
         # NA
 
         #computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][2])).GetValues()[i,:]
-
-            ptOrigin=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1= np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right ForeFoot"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Right ForeFoot"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        R=frame.getRotationsFromPoints(pt1,pt2,pt3,dictRef["Right ForeFoot"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- motion of new markers
@@ -1907,13 +1808,9 @@ class CGM2_4(CGM2_3):
         # --- motion of the anatomical referential
 
         seg.anatomicalFrame.motion=[]
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right ForeFoot"]['labels'][3])).GetValues()[i,:]
-            #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right ForeFoot"]['labels'][3])).GetValues()
+        R = np.dot(seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     # ----- least-square Segmental motion ------
@@ -1939,31 +1836,16 @@ class CGM2_4(CGM2_3):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
         # --- vTOE and AJC
         btkTools.smartAppendPoint(aqui,"LAJC-HindFoot",seg.getReferential("TF").getNodeTrajectory("LAJC"),desc="opt from hindfoot" )
@@ -1996,30 +1878,16 @@ class CGM2_4(CGM2_3):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
 
         # --- motion of new markers
@@ -2055,30 +1923,16 @@ class CGM2_4(CGM2_3):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
 
         # --- vTOE and AJC
         btkTools.smartAppendPoint(aqui,"RAJC-HindFoot",seg.getReferential("TF").getNodeTrajectory("RAJC"),desc="opt from hindfoot" )
@@ -2111,30 +1965,16 @@ class CGM2_4(CGM2_3):
                 staticPos[i,:] = seg.getReferential("TF").static.getNode_byLabel(label).m_global
                 i+=1
 
-        # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        # part 2 : get dynamic position ( look out i pick up value in a marker block)
+        markers = btkTools.MarkerBlock(aqui,seg.m_tracking_markers)
+        dynPos = markers.getArray(seg.m_tracking_markers)
+
+        if motionMethod == enums.motionMethod.Sodervisk :
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(staticPos,dynPos)
+            R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+
+            seg.getReferential("TF").setMotion(R,tOri)
 
         # --- motion of new markers
         # --- LvSMH
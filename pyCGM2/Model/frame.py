@@ -129,14 +129,6 @@ def setFrameData(a1,a2,sequence):
         rot=np.array([axisX,axisY,axisZ]).T
 
 
-    if sequence == "YXZ" or sequence == "YXiZ" :
-        if sequence == "YXiZ":
-            a2=a2*-1.0
-        axisY=a1
-        axisX=a2
-        axisZ=np.cross(a2,a1)
-        rot=np.array([axisX,axisY,axisZ]).T
-
 
     if sequence == "ZXY" or sequence == "ZXiY" :
         if sequence == "ZXiY":
@@ -156,6 +148,85 @@ def setFrameData(a1,a2,sequence):
 
     return axisX, axisY, axisZ, rot
 
+def setFrameDataArrays(a1,a2,sequence):
+    """
+        Batched version of `setFrameData`. Set rotation matrices of n coordinate systems
+        from two arrays of vectors and a sequence
+
+        :Parameters:
+           - `a1` (numy.array(n,3)) - first vectors
+           - `a2` (numy.array(n,3)) - second vectors
+           - `sequence` (str) - construction sequence (XYZ, XYiZ)
+
+        :Return:
+            - `rot` (numy.array(n,3,3)) - rotation matrices
+
+        .. note:: if sequence includes a *i* ( ex: XYiZ), opposite of vector a2 is considered
+
+    """
+    axes = sequence.replace("i","")
+    if len(axes) !=3 or set(axes) != set("XYZ"):
+        raise Exception("[pyCGM2] sequence (%s) not known"%(sequence))
+
+    if "i" in sequence:
+        a2=a2*-1.0
+
+    first = "XYZ".index(axes[0])
+    second = "XYZ".index(axes[1])
+    third = "XYZ".index(axes[2])
+
+    rot = np.zeros((a1.shape[0],3,3))
+    rot[:,:,first] = a1
+    rot[:,:,second] = a2
+    # direct sequences (XY,YZ,ZX) get a1^a2, the others a2^a1
+    if (second-first)%3 == 1:
+        rot[:,:,third] = np.cross(a1,a2)
+    else:
+        rot[:,:,third] = np.cross(a2,a1)
+
+    return rot
+
+def _normalizeArray(values):
+    return np.nan_to_num(np.divide(values,np.linalg.norm(values,axis=1).reshape(-1,1)))
+
+def getRotationsFromVectors(a1,v,sequence):
+    """
+        Build rotation matrices of n coordinate systems from a main axis and a vector of the plane
+
+        :Parameters:
+           - `a1` (numy.array(n,3)) - first axis
+           - `v` (numy.array(n,3)) - vector of the plane
+           - `sequence` (str) - construction sequence (XYZ, XYiZ)
+
+        :Return:
+            - `rot` (numy.array(n,3,3)) - rotation matrices
+
+        .. note:: a1, v and the normal a1^v are normalized
+
+    """
+    a1=_normalizeArray(a1)
+    v=_normalizeArray(v)
+    a2=_normalizeArray(np.cross(a1,v))
+
+    return setFrameDataArrays(a1,a2,sequence)
+
+def getRotationsFromPoints(pt1,pt2,pt3,sequence):
+    """
+        Build rotation matrices of n coordinate systems from three point trajectories.
+        The main axis is pt1->pt2 , the plane is defined by pt1->pt3
+
+        :Parameters:
+           - `pt1` (numy.array(n,3)) - first point
+           - `pt2` (numy.array(n,3)) - second point
+           - `pt3` (numy.array(n,3)) - third point
+           - `sequence` (str) - construction sequence (XYZ, XYiZ)
+
+        :Return:
+            - `rot` (numy.array(n,3,3)) - rotation matrices
+
+    """
+    return getRotationsFromVectors(pt2-pt1,pt3-pt1,sequence)
+
 class Node(object):
     """
         A node is a local position of a point in a Frame
@@ -483,3 +554,185 @@ class Frame(object):
         node = self.getNode_byLabel(nodeLabel)
 
         return np.dot(self.getRotation(),node.getLocal())+ self.getTranslation()
+
+
+class FrameView(Frame):
+    """
+        Read-only `Frame` pointing at one sample of a `MotionFrames` store.
+
+        It keeps the `Frame` accessors (getRotation, getTranslation, m_axisX...)
+        for callers iterating over a motion but doesn't hold any data
+    """
+
+    def __init__(self,motionFrames,index):
+        """
+            :Parameters:
+               - `motionFrames` (pyCGM2.Model.frame.MotionFrames) - motion store
+               - `index` (int) - frame index within the store
+        """
+        self._store = motionFrames
+        self._index = index
+        self._nodes=[]
+
+    @property
+    def _matrixRot(self):
+        return self._store.getRotation(self._index)
+
+    @property
+    def _translation(self):
+        return self._store.getTranslation(self._index)
+
+    @property
+    def m_axisX(self):
+        return self._store.getRotation(self._index)[:,0]
+
+    @property
+    def m_axisY(self):
+        return self._store.getRotation(self._index)[:,1]
+
+    @property
+    def m_axisZ(self):
+        return self._store.getRotation(self._index)[:,2]
+
+    def _readOnly(self,*args,**kwargs):
+        raise Exception("[pyCGM2] motion frame is read-only. Update the motion of the referential instead")
+
+    setRotation = _readOnly
+    setTranslation = _readOnly
+    updateAxisFromRotation = _readOnly
+    update = _readOnly
+    addNode = _readOnly
+
+
+class MotionFrames(object):
+    """
+        Compact storage of a referential motion.
+
+        Rotations and translations of all frames are stored as a (n,3,3) and a (n,3) array.
+        Indexing returns a read-only `FrameView`.
+    """
+
+    def __init__(self,rotations=None,translations=None):
+        """
+            :Parameters:
+               - `rotations` (numpy.array(n,3,3)) - [optional] rotation matrices
+               - `translations` (numpy.array(n,3)) - [optional] translation vectors
+        """
+
+        self._rotations = np.zeros((0,3,3))
+        self._translations = np.zeros((0,3))
+        self._frameNumber = 0
+        self._version = 0
+
+        if rotations is not None:
+            self.setData(rotations,translations)
+
+    def __len__(self):
+        return self._frameNumber
+
+    def __getitem__(self,index):
+        if isinstance(index,slice):
+            return [FrameView(self,i) for i in range(*index.indices(self._frameNumber))]
+
+        if index < 0:
+            index += self._frameNumber
+        if index < 0 or index >= self._frameNumber:
+            raise IndexError("[pyCGM2] motion frame index out of range")
+        return FrameView(self,index)
+
+    def __iter__(self):
+        for i in range(0,self._frameNumber):
+            yield FrameView(self,i)
+
+    def __getstate__(self):
+        # drop the unused capacity
+        return {"_rotations": self._rotations[0:self._frameNumber].copy(),
+                "_translations": self._translations[0:self._frameNumber].copy(),
+                "_frameNumber": self._frameNumber,
+                "_version": self._version}
+
+    def __setstate__(self,state):
+        self.__dict__.update(state)
+        # the counter goes on from its pickled value, values cached against the motion never match a later modification
+        if "_version" not in state:
+            self._version = 0
+
+    def getVersion(self):
+        """
+            Get the modification counter of the motion. It changes each time frames are appended or set
+        """
+        return self._version
+
+    def _reserve(self,frameNumber):
+        capacity = self._rotations.shape[0]
+        if frameNumber > capacity:
+            capacity = max(frameNumber,2*capacity,64)
+            rotations = np.zeros((capacity,3,3))
+            translations = np.zeros((capacity,3))
+            rotations[0:self._frameNumber] = self._rotations[0:self._frameNumber]
+            translations[0:self._frameNumber] = self._translations[0:self._frameNumber]
+            self._rotations = rotations
+            self._translations = translations
+
+    def append(self,frame):
+        """
+            Append a frame. Values are copied, the frame can be reused by the caller
+
+            :Parameters:
+               - `frame` (pyCGM2.Model.frame.Frame) - a frame instance
+        """
+        self._reserve(self._frameNumber+1)
+        self._rotations[self._frameNumber] = frame.getRotation()
+        self._translations[self._frameNumber] = np.asarray(frame.getTranslation()).reshape(3)
+        self._frameNumber+=1
+        self._version+=1
+
+    def setData(self,rotations,translations):
+        """
+            Set all frames at once
+
+            :Parameters:
+               - `rotations` (numpy.array(n,3,3)) - rotation matrices
+               - `translations` (numpy.array(n,3)) - translation vectors
+        """
+        rotations = np.array(rotations,dtype=float).reshape(-1,3,3)
+        translations = np.array(translations,dtype=float).reshape(-1,3)
+        if rotations.shape[0] != translations.shape[0]:
+            raise Exception("[pyCGM2] rotations and translations have different frame numbers")
+
+        self._rotations = rotations
+        self._translations = translations
+        self._frameNumber = rotations.shape[0]
+        self._version+=1
+
+    def getRotations(self):
+        """
+            Get rotation matrices of all frames
+
+            :Return:
+                - `na` (numpy.array(n,3,3)) - read-only rotation matrices
+        """
+        out = self._rotations[0:self._frameNumber]
+        out.flags.writeable = False
+        return out
+
+    def getTranslations(self):
+        """
+            Get translation vectors of all frames
+
+            :Return:
+                - `na` (numpy.array(n,3)) - read-only translation vectors
+        """
+        out = self._translations[0:self._frameNumber]
+        out.flags.writeable = False
+        return out
+
+    def getRotation(self,index):
+        out = self._rotations[index]
+        out.flags.writeable = False
+        return out
+
+    def getTranslation(self,index):
+        out = self._translations[index]
+        out.flags.writeable = False
+        return out
@@ -203,6 +203,13 @@ class Model(object):
 
 
 
+    def invalidateKinematics(self):
+        """
+            Clear the cached kinematic values of all segments. Called once the motion is computed
+        """
+        for it in self.m_segmentCollection:
+            it.invalidateKinematics()
+
     def getSegment(self,label):
         """
             Get `Segment` from its label
@@ -382,20 +389,17 @@ class Model(object):
 
     def displayMotionCoordinateSystem(self,acqui,  segmentLabel, targetPointLabel, referential = "Anatomic" ):
         seg=self.getSegment(segmentLabel)
-        valX=np.zeros((acqui.GetPointFrameNumber(),3))
-        valY=np.zeros((acqui.GetPointFrameNumber(),3))
-        valZ=np.zeros((acqui.GetPointFrameNumber(),3))
-
 
         if referential == "Anatomic":
             ref =seg.anatomicalFrame
         else:
             ref = seg.getReferential("TF")
 
-        for i in range(0,acqui.GetPointFrameNumber()):
-            valX[i,:]= np.dot(ref.motion[i].getRotation() , np.array([100.0,0.0,0.0])) + ref.motion[i].getTranslation()
-            valY[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,100.0,0.0])) + ref.motion[i].getTranslation()
-            valZ[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,0.0,100.0])) + ref.motion[i].getTranslation()
+        rotations = ref.motion.getRotations()
+        translations = ref.motion.getTranslations()
+        valX= np.dot(rotations , np.array([100.0,0.0,0.0])) + translations
+        valY= np.dot(rotations , np.array([0.0,100.0,0.0])) + translations
+        valZ= np.dot(rotations , np.array([0.0,0.0,100.0])) + translations
 
         btkTools.smartAppendPoint(acqui,targetPointLabel+"_X",valX,desc="")
         btkTools.smartAppendPoint(acqui,targetPointLabel+"_Y",valY,desc="")
@@ -405,22 +409,17 @@ class Model(object):
     def displayMotionViconCoordinateSystem(self,acqui,  segmentLabel,targetPointLabelO,targetPointLabelX,targetPointLabelY,targetPointLabelZ, referential = "Anatomic" ):
         seg=self.getSegment(segmentLabel)
 
-        origin=np.zeros((acqui.GetPointFrameNumber(),3))
-        valX=np.zeros((acqui.GetPointFrameNumber(),3))
-        valY=np.zeros((acqui.GetPointFrameNumber(),3))
-        valZ=np.zeros((acqui.GetPointFrameNumber(),3))
-
-
         if referential == "Anatomic":
             ref =seg.anatomicalFrame
         else:
             ref = seg.getReferential("TF")
 
-        for i in range(0,acqui.GetPointFrameNumber()):
-            origin[i,:] = ref.motion[i].getTranslation()
-            valX[i,:]= np.dot(ref.motion[i].getRotation() , np.array([100.0,0.0,0.0])) + ref.motion[i].getTranslation()
-            valY[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,100.0,0.0])) + ref.motion[i].getTranslation()
-            valZ[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,0.0,100.0])) + ref.motion[i].getTranslation()
+        rotations = ref.motion.getRotations()
+        translations = ref.motion.getTranslations()
+        origin = np.array(translations)
+        valX= np.dot(rotations , np.array([100.0,0.0,0.0])) + translations
+        valY= np.dot(rotations , np.array([0.0,100.0,0.0])) + translations
+        valZ= np.dot(rotations , np.array([0.0,0.0,100.0])) + translations
 
         btkTools.smartAppendPoint(acqui,targetPointLabelO,origin,desc="")
         btkTools.smartAppendPoint(acqui,targetPointLabelX,valX,desc="")
@@ -461,6 +460,20 @@ class Model(object):
         dic = {"segmentLabel": segmentLabel,"coordinateSystemLabel": coordinateSystemLabel,"referentialType": referentialType}
         self.m_csDefinitions.append(dic)
 
+    def getCalibrationCopy(self):
+        """
+            Get a copy of the model restricted to its calibration state ( static frames, nodes, relative matrices, mp...).
+            Motion data of segments are dropped. The copy shares calibration members with the model.
+
+            :Return:
+                - `model` (pyCGM2.Model.model.Model) - model copy
+        """
+        model = copy.copy(self)
+        model.m_segmentCollection = [segment.getCalibrationCopy() for segment in self.m_segmentCollection]
+        model.m_centreOfMass = None
+
+        return model
+
 
 class Model6Dof(Model):
     """
@@ -556,31 +569,22 @@ class Model6Dof(Model):
         segPicked.getReferential("TF").motion =[]
         if method == enums.motionMethod.Sodervisk :
             tms= segPicked.m_tracking_markers
-            for i in range(0,aqui.GetPointFrameNumber()):
-                visibleMarkers = btkTools.getVisibleMarkersAtFrame(aqui,tms,i)
-
-                # constructuion of the input of sodervisk
-                arrayStatic = np.zeros((len(visibleMarkers),3))
-                arrayDynamic = np.zeros((len(visibleMarkers),3))
-
-                j=0
-                for vm in visibleMarkers:
-                    arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(vm).m_global
-                    arrayDynamic[j,:] = aqui.GetPoint(vm).GetValues()[i,:]
-                    j+=1
-
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(arrayStatic,arrayDynamic)
-                R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
-
-                cframe=frame.Frame()
-                cframe.setRotation(R)
-                cframe.setTranslation(tOri)
-                cframe.m_axisX=R[:,0]
-                cframe.m_axisY=R[:,1]
-                cframe.m_axisZ=R[:,2]
-
-                segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+            markers = btkTools.MarkerBlock(aqui,tms)
+
+            # constructuion of the input of sodervisk
+            arrayStatic = np.zeros((len(tms),3))
+            j=0
+            for label in tms:
+                arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(label).m_global
+                j+=1
+            arrayDynamic = markers.getArray(tms)
+            visibility = markers.getVisibility(tms)
+
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(arrayStatic,arrayDynamic,visibility=visibility)
+            R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
+            tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
+
+            segPicked.getReferential("TF").setMotion(R,tOri)
         else:
             raise Exception("[pyCGM2] : motion method doesn t exist")
 
@@ -593,11 +597,8 @@ class Model6Dof(Model):
         ndO = str(dictAnatomic[segName]['labels'][3])
         ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptO)
-            segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.dot(segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+        segPicked.anatomicalFrame.setMotion(R,ptO)
 
 
 # --------  MODEL COMPONANTS ---------
@@ -607,10 +608,35 @@ class Referential(object):
     """
     def __init__(self):
         self.static=frame.Frame()
-        self.motion=[]
+        self._motion=frame.MotionFrames()
         self.relativeMatrixAnatomic = np.zeros((3,3))
         self.additionalInfos = dict()
 
+    def __setstate__(self,state):
+        # models pickled with a list of Frame as motion
+        if "motion" in state:
+            motionFrames = state.pop("motion")
+            self.__dict__.update(state)
+            self.motion = motionFrames
+        else:
+            self.__dict__.update(state)
+
+    @property
+    def motion(self):
+        """
+            motion of the referential (pyCGM2.Model.frame.MotionFrames)
+        """
+        return self._motion
+
+    @motion.setter
+    def motion(self,frames):
+        if isinstance(frames,frame.MotionFrames):
+            self._motion = frames
+        else:
+            self._motion = frame.MotionFrames()
+            for it in frames:
+                self._motion.append(it)
+
     def setStaticFrame(self,Frame):
         """
             Set a `Frame` to the member Static of the `Referential`
@@ -629,7 +655,27 @@ class Referential(object):
                 - `Frame` (pyCGM2.Model.CGM2.frame.Frame) - pyCGM2-Frame instance
 
         """
-        self.motion.append(Frame)
+        self._motion.append(Frame)
+
+    def setMotion(self,rotations,translations):
+        """
+             Set the whole motion of the `Referential`
+
+            :Parameters:
+                - `rotations` (numpy.array(n,3,3)) - rotation matrices
+                - `translations` (numpy.array(n,3)) - translation vectors
+
+        """
+        self._motion = frame.MotionFrames(rotations,translations)
+
+    def getCalibrationCopy(self):
+        """
+            Get a copy of the referential without motion
+        """
+        referential = copy.copy(self)
+        referential._motion = frame.MotionFrames()
+
+        return referential
 
     def getNodeTrajectory(self,label):
         """
@@ -644,10 +690,7 @@ class Referential(object):
         """
 
         node=self.static.getNode_byLabel(label)
-        nFrames=len(self.motion)
-        pt=np.zeros((nFrames,3))
-        for i in range(0,nFrames):
-            pt[i,:]=np.dot(self.motion[i].getRotation(),node.m_local)+ self.motion[i].getTranslation()
+        pt = np.dot(self._motion.getRotations(),node.m_local) + self._motion.getTranslations()
 
         return pt
 
@@ -749,6 +792,64 @@ class Segment(object):
         self.m_info = dict()
         self.m_isCloneOf = False
 
+        self.m_kinematicCache = dict()
+
+    def __getstate__(self):
+        # cached kinematics are not stored
+        state = self.__dict__.copy()
+        state["m_kinematicCache"] = dict()
+        return state
+
+    def _getCachedKinematics(self,key,compute):
+        """
+            Get values derived from the motion of the anatomical referential.
+            Values are cached until the motion is recomputed
+
+            :Parameters:
+                - `key` (tuple) - key of the values ( ex: quantity, sample frequency, method)
+                - `compute` (function) - function computing the values
+
+            :Return:
+                - `values` (numpy.array) - read-only values
+        """
+        if not hasattr(self,"m_kinematicCache"): # models pickled before the cache
+            self.m_kinematicCache = dict()
+
+        motionFrames = self.anatomicalFrame.motion
+        if key in self.m_kinematicCache:
+            cachedMotion,version,values = self.m_kinematicCache[key]
+            if cachedMotion is motionFrames and version == motionFrames.getVersion():
+                return values
+
+        values = compute()
+        values.flags.writeable = False
+        self.m_kinematicCache[key] = (motionFrames,motionFrames.getVersion(),values)
+
+        return values
+
+    def invalidateKinematics(self):
+        """
+            Clear the cached values derived from the anatomical motion ( angular velocity, com trajectory...)
+        """
+        self.m_kinematicCache = dict()
+
+    def getCalibrationCopy(self):
+        """
+            Get a copy of the segment without motion data ( referential motions, cached kinematics, wrenchs)
+        """
+        segment = copy.copy(self)
+        segment.anatomicalFrame = self.anatomicalFrame.getCalibrationCopy()
+        segment.referentials = [referential.getCalibrationCopy() for referential in self.referentials]
+        segment.m_kinematicCache = dict()
+        segment.zeroingExternalDevice()
+        segment.zeroingProximalWrench()
+        segment.m_proximalMomentContribution = dict.fromkeys(self.m_proximalMomentContribution.keys())
+
+        return segment
+
+    def _comKey(self):
+        return tuple(np.asarray(self.m_bsp["com"],dtype=float).ravel())
+
     def removeTrackingMarker(self,label):
         """
             Add a tracking marker
@@ -976,10 +1077,8 @@ class Segment(object):
                 - `values` (numpy.array(n,3)) - values of the com trajectory
         """
 
-        frameNumber = len(self.anatomicalFrame.motion)
-        values = np.zeros((frameNumber,3))
-        for i in range(0,frameNumber):
-            values[i,:] = np.dot(self.anatomicalFrame.motion[i].getRotation() ,self.m_bsp["com"]) + self.anatomicalFrame.motion[i].getTranslation()
+        values = self._getCachedKinematics(("comTrajectory",self._comKey()),
+                                           lambda : np.dot(self.anatomicalFrame.motion.getRotations(),self.m_bsp["com"]) + self.anatomicalFrame.motion.getTranslations())
 
         if exportBtkPoint:
             if btkAcq != None:
@@ -1002,6 +1101,11 @@ class Segment(object):
 
         """
 
+        return self._getCachedKinematics(("comVelocity",self._comKey(),pointFrequency,method),
+                                         lambda : self._computeComVelocity(pointFrequency,method))
+
+    def _computeComVelocity(self,pointFrequency,method):
+
         if method == "spline":
             values = derivation.splineDerivation(self.getComTrajectory(),pointFrequency,order=1)
         elif method == "spline fitting":
@@ -1034,9 +1138,19 @@ class Segment(object):
 
         """
 
-        valueCom = self.getComTrajectory()
         if "fc" in options.keys() and  "order" in options.keys():
-            valueCom = signal_processing.arrayLowPassFiltering(valueCom,pointFrequency,options["order"],options["fc"]  )
+            lowPass = (options["order"],options["fc"])
+        else:
+            lowPass = None
+
+        return self._getCachedKinematics(("comAcceleration",self._comKey(),pointFrequency,method,lowPass),
+                                         lambda : self._computeComAcceleration(pointFrequency,method,lowPass))
+
+    def _computeComAcceleration(self,pointFrequency,method,lowPass):
+
+        valueCom = self.getComTrajectory()
+        if lowPass is not None:
+            valueCom = signal_processing.arrayLowPassFiltering(valueCom,pointFrequency,lowPass[0],lowPass[1])
 
         if method == "spline":
             values = derivation.splineDerivation(valueCom,pointFrequency,order=2)
@@ -1075,36 +1189,38 @@ class Segment(object):
 
                 The *conventional* method computes angular velocity through this statement :math:`\dot{R}R^t`
 
+                Values are cached per sample frequency and method until the anatomical motion is recomputed
+
         """
 
+        return self._getCachedKinematics(("angularVelocity",sampleFrequency,method),
+                                         lambda : self._computeAngularVelocity(sampleFrequency,method))
+
+
+    def _computeAngularVelocity(self,sampleFrequency,method):
 
-        frameNumber = len(self.anatomicalFrame.motion)
+        rotations = self.anatomicalFrame.motion.getRotations()
+        frameNumber = rotations.shape[0]
         AngularVelocValues = np.zeros((frameNumber,3))
 
         # pig method0
         if method == "pig":
-            for i in range(1,frameNumber-1):
-                omegaX=(np.dot( self.anatomicalFrame.motion[i+1].m_axisY,
-                                          self.anatomicalFrame.motion[i-1].m_axisZ))/(2*1/sampleFrequency)
+            nextR = rotations[2:]
+            prevR = rotations[:-2]
+            omega = np.zeros((max(frameNumber-2,0),3))
+            omega[:,0] = np.sum(nextR[:,:,1]*prevR[:,:,2],axis=1)/(2*1/sampleFrequency)
+            omega[:,1] = np.sum(nextR[:,:,2]*prevR[:,:,0],axis=1)/(2*1/sampleFrequency)
+            omega[:,2] = np.sum(nextR[:,:,0]*prevR[:,:,1],axis=1)/(2*1/sampleFrequency)
 
-                omegaY=(np.dot( self.anatomicalFrame.motion[i+1].m_axisZ,
-                                          self.anatomicalFrame.motion[i-1].m_axisX))/(2*1/sampleFrequency)
-
-                omegaZ=(np.dot( self.anatomicalFrame.motion[i+1].m_axisX,
-                                self.anatomicalFrame.motion[i-1].m_axisY))/(2*1/sampleFrequency)
-
-                omega = np.array([[omegaX,omegaY,omegaZ]]).transpose()
-
-                AngularVelocValues[i,:] = np.dot(self.anatomicalFrame.motion[i].getRotation(),  omega).transpose()
+            AngularVelocValues[1:frameNumber-1,:] = np.einsum("nij,nj->ni",rotations[1:frameNumber-1],omega)
 
         # conventional method
         if method == "conventional":
-            rdot = derivation.matrixFirstDerivation(self.anatomicalFrame.motion, sampleFrequency)
-            for i in range(1,frameNumber-1):
-                tmp =np.dot(rdot[i],self.anatomicalFrame.motion[i].getRotation().transpose())
-                AngularVelocValues[i,0]=tmp[2,1]
-                AngularVelocValues[i,1]=tmp[0,2]
-                AngularVelocValues[i,2]=tmp[1,0]
+            rdot = derivation.rotationsFirstDerivation(rotations, sampleFrequency)
+            tmp = np.einsum("nij,nkj->nik",rdot[1:frameNumber-1],rotations[1:frameNumber-1])
+            AngularVelocValues[1:frameNumber-1,0]=tmp[:,2,1]
+            AngularVelocValues[1:frameNumber-1,1]=tmp[:,0,2]
+            AngularVelocValues[1:frameNumber-1,2]=tmp[:,1,0]
 
         return AngularVelocValues
 
@@ -1123,8 +1239,8 @@ class Segment(object):
             .. note:: A first order differention of the angular velocity is used
         """
 
-        values = derivation.firstOrderFiniteDifference(self.getAngularVelocity(sampleFrequency),sampleFrequency)
-        return values
+        return self._getCachedKinematics(("angularAcceleration",sampleFrequency),
+                                         lambda : derivation.firstOrderFiniteDifference(self.getAngularVelocity(sampleFrequency),sampleFrequency))
 
 class Joint(object):
     """
@@ -227,9 +227,10 @@ def midPoint(acq,lateralMarkerLabel,medialMarkerLabel,offset=0):
 
     midvalues = np.zeros((acq.GetPointFrameNumber(),3))
 
+    markers = btkTools.MarkerBlock(acq,[lateralMarkerLabel,medialMarkerLabel])
     for i in range(0,acq.GetPointFrameNumber()):
-        lateral = acq.GetPoint(lateralMarkerLabel).GetValues()[i,:]
-        medial = acq.GetPoint(medialMarkerLabel).GetValues()[i,:]
+        lateral = markers.getValues(lateralMarkerLabel)[i,:]
+        medial = markers.getValues(medialMarkerLabel)[i,:]
 
         if offset !=0:
             v = medial-lateral
@@ -260,7 +261,7 @@ def calibration2Dof(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,j
         else:
             frames = frames0
 
-        nFrames = len(frames)
+        frames = np.array(frames,dtype=int)
 
         angle=np.deg2rad(x)
         rotZ = np.eye(3,3)
@@ -269,34 +270,12 @@ def calibration2Dof(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,j
         rotZ[1,0] = np.sin(angle)
         rotZ[1,1] = np.cos(angle)
 
-        jointValues = np.zeros((nFrames,3))
+        Rprox = np.dot(proxMotionRef.getRotations()[frames],rotZ)
+        Rdist = distMotionRef.getRotations()[frames]
 
-        i=0
-        for f in frames:
-            Rprox = np.dot(proxMotionRef[f].getRotation(),rotZ)
-            Rdist = distMotionRef[f].getRotation()
+        Rrelative= np.einsum("nji,njk->nik",Rprox, Rdist)
 
-            Rrelative= np.dot(Rprox.T, Rdist)
-
-            if sequence == "XYZ":
-                Euler1,Euler2,Euler3 = euler.euler_xyz(Rrelative)
-            elif sequence == "XZY":
-                Euler1,Euler2,Euler3 = euler.euler_xzy(Rrelative)
-            elif sequence == "YXZ":
-                Euler1,Euler2,Euler3 = euler.euler_yxz(Rrelative)
-            elif sequence == "YZX":
-                Euler1,Euler2,Euler3 = euler.euler_yzx(Rrelative)
-            elif sequence == "ZXY":
-                Euler1,Euler2,Euler3 = euler.euler_zxy(Rrelative)
-            elif sequence == "ZYX":
-                Euler1,Euler2,Euler3 = euler.euler_zyx(Rrelative)
-            else:
-                raise Exception("[pyCGM2] joint sequence unknown ")
-
-            jointValues[i,0] = Euler1
-            jointValues[i,1] = Euler2
-            jointValues[i,2] = Euler3
-            i+=1
+        jointValues = euler.eulerArray(Rrelative,sequence)
 
         if  jointRange is None:
             variance = np.var(jointValues[:,index])
@@ -714,6 +693,8 @@ class Kad(DecoratorModel):
         RKNEvalues =  np.zeros((self.acq.GetPointFrameNumber(),3))
         RAJCvalues = np.zeros((self.acq.GetPointFrameNumber(),3))
 
+        markers = btkTools.MarkerBlock(self.acq)
+
 
         if side == "both" or side == "left":
 
@@ -726,9 +707,9 @@ class Kad(DecoratorModel):
 
             for i in range(0,self.acq.GetPointFrameNumber()):
                 #  compute points left and right lateral condyle
-                LKAX = self.acq.GetPoint("LKAX").GetValues()[i,:]
-                LKD1 = self.acq.GetPoint("LKD1").GetValues()[i,:]
-                LKD2 = self.acq.GetPoint("LKD2").GetValues()[i,:]
+                LKAX = markers.getValues("LKAX")[i,:]
+                LKD1 = markers.getValues("LKD1")[i,:]
+                LKD2 = markers.getValues("LKD2")[i,:]
 
                 dist = np.array([np.linalg.norm(LKAX-LKD1), np.linalg.norm(LKAX-LKD2),np.linalg.norm(LKD1-LKD2)] )
                 dist =  dist / np.sqrt(2)
@@ -745,8 +726,8 @@ class Kad(DecoratorModel):
 
                 # locate KJC
     #            LKJC = LKNE + LKAXO * (self.model.mp["leftKneeWidth"]+markerDiameter )/2.0
-                if btkTools.isPointExist(self.acq,"LHJC"):
-                    LHJC = self.acq.GetPoint("LHJC").GetValues()[i,:]
+                if markers.isPointExist("LHJC"):
+                    LHJC = markers.getValues("LHJC")[i,:]
                     LKJCvalues[i,:] = chord( (self.model.mp["LeftKneeWidth"]+markerDiameter )/2.0 ,LKNEvalues[i,:],LHJC,LKAX, beta= 0.0 )
                 else:
                     LKJCvalues[i,:] = LKNEvalues[i,:] + LKAXO * (self.model.mp["LeftKneeWidth"]+markerDiameter )/2.0
@@ -759,7 +740,7 @@ class Kad(DecoratorModel):
                     ajcDesc = "KAD-manualTT"
 
 
-                LANK = self.acq.GetPoint("LANK").GetValues()[i,:]
+                LANK = markers.getValues("LANK")[i,:]
                 LAJCvalues[i,:] = chord( (self.model.mp["LeftAnkleWidth"]+markerDiameter )/2.0 ,LANK,LKJCvalues[i,:],LKAX,beta= beta )
 
             tf_prox = self.model.getSegment("Left Thigh").getReferential("TF")
@@ -796,9 +777,9 @@ class Kad(DecoratorModel):
 
             for i in range(0,self.acq.GetPointFrameNumber()):
                 #  compute points left and right lateral condyle
-                RKAX = self.acq.GetPoint("RKAX").GetValues()[i,:]
-                RKD1 = self.acq.GetPoint("RKD1").GetValues()[i,:]
-                RKD2 = self.acq.GetPoint("RKD2").GetValues()[i,:]
+                RKAX = markers.getValues("RKAX")[i,:]
+                RKD1 = markers.getValues("RKD1")[i,:]
+                RKD2 = markers.getValues("RKD2")[i,:]
 
                 dist = np.array([np.linalg.norm(RKAX-RKD1), np.linalg.norm(RKAX-RKD2),np.linalg.norm(RKD1-RKD2)] )
                 dist =  dist / np.sqrt(2)
@@ -817,8 +798,8 @@ class Kad(DecoratorModel):
 
                 # locate KJC
     #            RKJC = RKNE + RKAXO * (self.model.mp["rightKneeWidth"]+markerDiameter )/2.0
-                if btkTools.isPointExist(self.acq,"RHJC"):
-                    RHJC = self.acq.GetPoint("RHJC").GetValues()[frameInit:frameEnd,:].mean(axis=0)
+                if markers.isPointExist("RHJC"):
+                    RHJC = markers.getValues("RHJC")[frameInit:frameEnd,:].mean(axis=0)
                     RKJCvalues[i,:] = chord( (self.model.mp["RightKneeWidth"]+markerDiameter )/2.0 ,RKNEvalues[i,:],RHJC,RKAX,beta= 0.0 )
                 else:
                     RKJCvalues[i,:] = RKNEvalues[i,:] + RKAXO * (self.model.mp["RightKneeWidth"]+markerDiameter )/2.0
@@ -830,7 +811,7 @@ class Kad(DecoratorModel):
                     ajcDesc = "KAD-manualTT"
 
                 # locate AJC
-                RANK = self.acq.GetPoint("RANK").GetValues()[i,:]
+                RANK = markers.getValues("RANK")[i,:]
                 RAJCvalues[i,:] = chord( (self.model.mp["RightAnkleWidth"]+markerDiameter )/2.0 ,RANK,RKJCvalues[i,:],RKAX,beta= beta )
 
             tf_prox = self.model.getSegment("Right Thigh").getReferential("TF")
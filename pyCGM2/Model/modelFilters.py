@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import logging
 import numpy as np
-import copy
+from collections import OrderedDict
 
 from pyCGM2 import btk
 
@@ -12,6 +12,7 @@ from pyCGM2 import enums
 from  pyCGM2.Math import euler,numeric
 import pyCGM2.Signal.signal_processing as pyCGM2signal
 from pyCGM2.Tools import  btkTools
+from pyCGM2.ForcePlates import forceplates
 from pyCGM2.Utils import timer
 import matplotlib.pyplot as plt
 
@@ -243,7 +244,6 @@ class CGMLowerlimbInverseDynamicProcedure(object):
 
         forceValues = np.zeros((N,3))
         momentValues = np.zeros((N,3))
-        positionValues = np.zeros((N,3))
 
         wrench = btk.btkWrench()
         ForceBtkPoint = btk.btkPoint(N)
@@ -294,8 +294,7 @@ class CGMLowerlimbInverseDynamicProcedure(object):
 
         momentValues = inertieCont + accCont -  grCont - extMoment - distSegMoment
 
-        for i in range(0,N):
-            positionValues[i,:] = Ti[i].getTranslation()
+        positionValues = Ti.getTranslations()
 
         ForceBtkPoint.SetValues(forceValues)
         MomentBtkPoint.SetValues(momentValues/scaleToMeter)
@@ -339,6 +338,85 @@ class CGMLowerlimbInverseDynamicProcedure(object):
         model.getSegment("Right Shank Proximal").m_proximalMomentContribution = model.getSegment("Right Shank").m_proximalMomentContribution
         self.computeSegmental(model,"Right Thigh",btkAcq, gravity, scaleToMeter,distalSegmentLabel = "Right Shank")
 
+
+class VectorizedInverseDynamicProcedure(CGMLowerlimbInverseDynamicProcedure):
+    """
+        Lower limb inverse dynamic procedure computing all frames at once.
+
+        Contributions are evaluated with batched cross products over (n,3) arrays
+        and einsum over the (n,3,3) rotation stack of the segment motion.
+        Forces and moments are identical to the CGMLowerlimbInverseDynamicProcedure.
+    """
+    def __init__(self):
+        super(VectorizedInverseDynamicProcedure, self).__init__()
+
+    def _externalDeviceMomentContribution(self, wrenchs, Oi, scaleToMeter):
+
+        nf = wrenchs[0].GetMoment().GetValues().shape[0]
+        momentValues = np.zeros((nf,3))
+        origin = Oi.getTranslations()
+
+        for wrIt in wrenchs:
+            Fext = wrIt.GetForce().GetValues()
+            Mext = wrIt.GetMoment().GetValues()
+            posExt = wrIt.GetPosition().GetValues()
+
+            di = (posExt - origin)*scaleToMeter
+            momentValues = momentValues + Mext*scaleToMeter + np.cross(di,Fext)
+
+        return momentValues
+
+    def _distalMomentContribution(self, wrench, Oi, scaleToMeter, source = "Wrench"):
+
+        Fext = wrench.GetForce().GetValues()
+        Mext = wrench.GetMoment().GetValues()
+        posExt = wrench.GetPosition().GetValues()
+
+        di = (posExt - Oi.getTranslations())*scaleToMeter
+
+        if source == "Wrench":
+            momentValues = - 1.0*Mext*scaleToMeter - 1.0*np.cross(di,Fext)
+        elif source == "Force":
+            momentValues = - 1.0*np.cross(di,Fext)
+        elif source == "Moment":
+            momentValues = - 1.0*Mext*scaleToMeter
+        else:
+            raise Exception("[pyCGM2] distal moment source (%s) unknown" %(source))
+
+        return momentValues
+
+    def _forceAccelerationContribution(self,mi,ai,g,scaleToMeter):
+
+        return mi*ai*scaleToMeter - mi*np.asarray(g).reshape(1,3)
+
+    def _inertialMomentContribution(self,Ii, alphai,omegai, Ti ,scaleToMeter):
+
+        R = Ti.getRotations()
+        Ii = np.asarray(Ii)*np.power(scaleToMeter,2)
+
+        # global inertia tensor : R.Ii.R^T for each frame
+        Ig = np.einsum("nij,jk,nlk->nil",R,Ii,R)
+
+        accelerationContribution = np.einsum("nij,nj->ni",Ig,alphai)
+        coriolisContribution = np.cross(omegai,np.einsum("nij,nj->ni",Ig,omegai))
+
+        return   accelerationContribution + coriolisContribution
+
+    def _accelerationMomentContribution(self, mi,ci, ai, Ti, scaleToMeter):
+
+        R = Ti.getRotations()
+        ciGlobal = np.einsum("nij,j->ni",R,np.asarray(ci).reshape(3)*scaleToMeter)
+
+        return -1.0*mi*np.cross(ai*scaleToMeter,ciGlobal)
+
+    def _gravityMomentContribution(self, mi,ci, g, Ti, scaleToMeter):
+
+        R = Ti.getRotations()
+        ciGlobal = np.einsum("nij,j->ni",R,np.asarray(ci).reshape(3)*scaleToMeter)
+        g = np.asarray(g).reshape(1,3)
+
+        return - 1.0 *mi*np.cross(g,ciGlobal)
+
 #-------- FILTERS ----------
 
 
@@ -537,60 +615,33 @@ class ModelMotionFilter(object):
                 segPicked.getReferential("TF").motion =[]
 
                 if self.m_method == enums.motionMethod.Determinist :
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-
-                        pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()[i,:]
-                        pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()[i,:]
-                        pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()[i,:]
-                        ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()[i,:]
-
-                        a1=(pt2-pt1)
-                        a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                        v=(pt3-pt1)
-                        v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                        a2=np.cross(a1,v)
-                        a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                        x,y,z,R=frame.setFrameData(a1,a2,self.m_procedure.definition[segName]["TF"]['sequence'])
+                    pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()
+                    pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()
+                    pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()
+                    ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()
 
-                        cframe=frame.Frame()
-                        cframe.m_axisX=x
-                        cframe.m_axisY=y
-                        cframe.m_axisZ=z
-                        cframe.setRotation(R)
-                        cframe.setTranslation(ptOrigin)
-
-                        segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                    R=frame.getRotationsFromPoints(pt1,pt2,pt3,self.m_procedure.definition[segName]["TF"]['sequence'])
+                    segPicked.getReferential("TF").setMotion(R,ptOrigin)
 
 
                 if self.m_method == enums.motionMethod.Sodervisk :
                     tms= segPicked.m_tracking_markers
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        visibleMarkers = btkTools.getVisibleMarkersAtFrame(self.m_aqui,tms,i)
-
-                        arrayStatic = np.zeros((len(visibleMarkers),3))
-                        arrayDynamic = np.zeros((len(visibleMarkers),3))
+                    markers = btkTools.MarkerBlock(self.m_aqui,tms)
 
-                        j=0
-                        for vm in visibleMarkers:
-                            arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(vm).m_global
-                            arrayDynamic[j,:] = self.m_aqui.GetPoint(vm).GetValues()[i,:]
-                            j+=1
-
-                        Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(arrayStatic,arrayDynamic)
-                        R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
-                        tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
+                    # constructuion of the input of sodervisk
+                    arrayStatic = np.zeros((len(tms),3))
+                    j=0
+                    for label in tms:
+                        arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(label).m_global
+                        j+=1
+                    arrayDynamic = markers.getArray(tms)
+                    visibility = markers.getVisibility(tms)
 
-                        cframe=frame.Frame()
-                        cframe.setRotation(R)
-                        cframe.setTranslation(tOri)
-                        cframe.m_axisX=R[:,0]
-                        cframe.m_axisY=R[:,1]
-                        cframe.m_axisZ=R[:,2]
+                    Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(arrayStatic,arrayDynamic,visibility=visibility)
+                    R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
+                    tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
 
-                        segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                    segPicked.getReferential("TF").setMotion(R,tOri)
 
             if not self.m_noAnatomicalMotion:
                 for segName in segments:
@@ -601,11 +652,8 @@ class ModelMotionFilter(object):
                     ndO = str(self.m_procedure.anatomicalDefinition[segName]['labels'][3])
                     ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                    csFrame=frame.Frame()
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                        csFrame.update(R,ptO)
-                        segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                    R = np.dot(segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                    segPicked.anatomicalFrame.setMotion(R,ptO)
             else:
                 for segName in self.m_procedure.definition:
                     segPicked=self.m_model.getSegment(segName)
@@ -615,11 +663,11 @@ class ModelMotionFilter(object):
                     ndO = str(self.m_procedure.definition[segName]["TF"]['labels'][3])
                     ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                    csFrame=frame.Frame()
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                        csFrame.update(R,ptO)
-                        segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                    R = np.dot(segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                    segPicked.anatomicalFrame.setMotion(R,ptO)
+
+        self.m_model.invalidateKinematics()
+
     def compute(self):
         """
             Run the motion filter
@@ -638,62 +686,33 @@ class ModelMotionFilter(object):
                     segPicked.getReferential("TF").motion =[]
 
                     if self.m_method == enums.motionMethod.Determinist :
-                        for i in range(0,self.m_aqui.GetPointFrameNumber()):
-
-                            pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()[i,:]
-                            pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()[i,:]
-                            pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()[i,:]
-                            ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()[i,:]
-
-                            a1=(pt2-pt1)
-                            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                            v=(pt3-pt1)
-                            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                            a2=np.cross(a1,v)
-                            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+                        pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()
+                        pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()
+                        pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()
+                        ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()
 
-                            x,y,z,R=frame.setFrameData(a1,a2,self.m_procedure.definition[segName]["TF"]['sequence'])
-
-                            cframe=frame.Frame()
-                            cframe.m_axisX=x
-                            cframe.m_axisY=y
-                            cframe.m_axisZ=z
-                            cframe.setRotation(R)
-                            cframe.setTranslation(ptOrigin)
-
-                            segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                        R=frame.getRotationsFromPoints(pt1,pt2,pt3,self.m_procedure.definition[segName]["TF"]['sequence'])
+                        segPicked.getReferential("TF").setMotion(R,ptOrigin)
 
                     if self.m_method == enums.motionMethod.Sodervisk :
 
                         tms= segPicked.m_tracking_markers
+                        markers = btkTools.MarkerBlock(self.m_aqui,tms)
 
-                        for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                            visibleMarkers = btkTools.getVisibleMarkersAtFrame(self.m_aqui,tms,i)
-
-                            # constructuion of the input of sodervisk
-                            arrayStatic = np.zeros((len(visibleMarkers),3))
-                            arrayDynamic = np.zeros((len(visibleMarkers),3))
-
-                            j=0
-                            for vm in visibleMarkers:
-                                arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(vm).m_global
-                                arrayDynamic[j,:] = self.m_aqui.GetPoint(vm).GetValues()[i,:]
-                                j+=1
-
-                            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(arrayStatic,arrayDynamic)
-                            R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
-                            tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
+                        # constructuion of the input of sodervisk
+                        arrayStatic = np.zeros((len(tms),3))
+                        j=0
+                        for label in tms:
+                            arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(label).m_global
+                            j+=1
+                        arrayDynamic = markers.getArray(tms)
+                        visibility = markers.getVisibility(tms)
 
-                            cframe=frame.Frame()
-                            cframe.setRotation(R)
-                            cframe.setTranslation(tOri)
-                            cframe.m_axisX=R[:,0]
-                            cframe.m_axisY=R[:,1]
-                            cframe.m_axisZ=R[:,2]
+                        Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArrays(arrayStatic,arrayDynamic,visibility=visibility)
+                        R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
+                        tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
 
-                            segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                        segPicked.getReferential("TF").setMotion(R,tOri)
 
 
 
@@ -706,11 +725,8 @@ class ModelMotionFilter(object):
                         ndO = str(self.m_procedure.anatomicalDefinition[segName]['labels'][3])
                         ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                        csFrame=frame.Frame()
-                        for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                            R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                            csFrame.update(R,ptO)
-                            segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                        R = np.dot(segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                        segPicked.anatomicalFrame.setMotion(R,ptO)
                 else:
                     for segName in self.m_procedure.definition:
                         segPicked=self.m_model.getSegment(segName)
@@ -719,12 +735,11 @@ class ModelMotionFilter(object):
                         ndO = str(self.m_procedure.definition[segName]["TF"]['labels'][3])
                         ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                        csFrame=frame.Frame()
-                        for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                            R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                            csFrame.update(R,ptO)
-                            segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                        R = np.dot(segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                        segPicked.anatomicalFrame.setMotion(R,ptO)
 
+        # derived quantities are computed once per motion
+        self.m_model.invalidateKinematics()
 
 
 class TrackingMarkerDecompositionFilter(object):
@@ -830,6 +845,7 @@ class ModelJCSFilter(object):
         """
 
 
+        outputs = OrderedDict()
         for it in  self.m_model.m_jointCollection:
             logging.debug("---Processing of %s---"  % it.m_label)
             logging.debug(" proximal : %s "% it.m_proximalLabel)
@@ -841,33 +857,14 @@ class ModelJCSFilter(object):
             proxSeg = self.m_model.getSegment(it.m_proximalLabel)
             distSeg = self.m_model.getSegment(it.m_distalLabel)
 
-            jointValues = np.zeros((self.m_aqui.GetPointFrameNumber(),3))
-            for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                Rprox = proxSeg.anatomicalFrame.motion[i].getRotation()
-                Rdist = distSeg.anatomicalFrame.motion[i].getRotation()
-#                Rprox = np.dot(proxSeg.getReferential("TF").motion[i].getRotation(), proxSeg.getReferential("TF").relativeMatrixAnatomic)
-#                Rdist = np.dot(distSeg.getReferential("TF").motion[i].getRotation(), distSeg.getReferential("TF").relativeMatrixAnatomic)
-                Rrelative= np.dot(Rprox.T, Rdist)
-
-
-                if it.m_sequence == "XYZ":
-                    Euler1,Euler2,Euler3 = euler.euler_xyz(Rrelative)
-                elif it.m_sequence == "XZY":
-                    Euler1,Euler2,Euler3 = euler.euler_xzy(Rrelative)
-                elif it.m_sequence == "YXZ":
-                    Euler1,Euler2,Euler3 = euler.euler_yxz(Rrelative)
-                elif it.m_sequence == "YZX":
-                    Euler1,Euler2,Euler3 = euler.euler_yzx(Rrelative)
-                elif it.m_sequence == "ZXY":
-                    Euler1,Euler2,Euler3 = euler.euler_zxy(Rrelative)
-                elif it.m_sequence == "ZYX":
-                    Euler1,Euler2,Euler3 = euler.euler_zyx(Rrelative)
-                else:
-                    raise Exception("[pycga] joint sequence unknown ")
+            Rprox = proxSeg.anatomicalFrame.motion.getRotations()
+            Rdist = distSeg.anatomicalFrame.motion.getRotations()
+            Rrelative= np.einsum("nji,njk->nik",Rprox, Rdist)
 
-                jointValues[i,0] = Euler1
-                jointValues[i,1] = Euler2
-                jointValues[i,2] = Euler3
+            if it.m_sequence in ["XYZ","XZY","YXZ","YZX","ZXY","ZYX"]:
+                jointValues = euler.eulerArray(Rrelative,it.m_sequence)
+            else:
+                raise Exception("[pycga] joint sequence unknown ")
 
 
 
@@ -884,16 +881,14 @@ class ModelJCSFilter(object):
 
             if self.m_fixEuler:
                 dest = np.deg2rad(np.array([0,0,0]))
-                for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                    jointFinalValues[i,:] = euler.wrapEulerTo(np.deg2rad(jointFinalValues[i,:]), dest)
-                    dest = jointFinalValues[i,:]
+                jointFinalValues = euler.wrapEulerToArray(np.deg2rad(jointFinalValues), dest)
 
                 jointFinalValues = np.rad2deg(jointFinalValues)
 
             fulljointLabel  = jointLabel + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Angles"
-            btkTools.smartAppendPoint(self.m_aqui,
-                             fulljointLabel,
-                             jointFinalValues,PointType=btk.btkPoint.Angle, desc=description)
+            outputs[fulljointLabel] = (jointFinalValues,btk.btkPoint.Angle,description)
+
+        btkTools.smartAppendPoints(self.m_aqui,outputs)
 
 
 class ModelAbsoluteAnglesFilter(object):
@@ -991,41 +986,27 @@ class ModelAbsoluteAnglesFilter(object):
                 #logging.debug( "segment (%s) - sequence doest recognize - sequence Tilt-Obliquity-Rotation used by default" %(seg.name) )
 
 
-            for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                Rseg = seg.anatomicalFrame.motion[i].getRotation()
-                Rrelative= np.dot(Rglobal.T,Rseg)
-
-                if eulerSequence == "TOR":
-                    tilt,obliquity,rotation = euler.euler_yxz(Rrelative)
-                elif eulerSequence == "TRO":
-                    tilt,rotation,obliquity = euler.euler_yzx(Rrelative)
-                elif eulerSequence == "ROT":
-                    rotation,obliquity,tilt = euler.euler_zxy(Rrelative)
-                elif eulerSequence == "RTO":
-                    rotation,tilt,obliquity = euler.euler_zyx(Rrelative)
-                elif eulerSequence == "OTR":
-                    obliquity,tilt,rotation = euler.euler_xyz(Rrelative)
-                elif eulerSequence == "ORT":
-                    obliquity,rotation,tilt = euler.euler_xzy(Rrelative)
-                elif eulerSequence == "YXZ":
-                    tilt,obliquity,rotation = euler.euler_yxz(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "YZX":
-                    tilt,obliquity,rotation = euler.euler_yzx(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "ZXY":
-                    tilt,obliquity,rotation = euler.euler_zxy(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "ZYX":
-                    tilt,obliquity,rotation = euler.euler_zyx(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "XYZ":
-                    tilt,obliquity,rotation = euler.euler_xyz(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "XZY":
-                    tilt,obliquity,rotation = euler.euler_xzy(Rrelative)#,similarOrder = False)
-                else:
-                    logging.debug("no sequence defined for absolute angles. sequence YXZ selected by default" )
-                    tilt,obliquity,rotation = euler.euler_yxz(Rrelative)
+            Rseg = seg.anatomicalFrame.motion.getRotations()
+            Rrelative= np.einsum("ij,njk->nik",Rglobal.T,Rseg)
 
-                absoluteAngleValues[i,0] = tilt
-                absoluteAngleValues[i,1] = obliquity
-                absoluteAngleValues[i,2] = rotation
+            # columns : tilt, obliquity, rotation
+            if eulerSequence == "TOR":
+                absoluteAngleValues = euler.euler_yxz_array(Rrelative)
+            elif eulerSequence == "TRO":
+                absoluteAngleValues = euler.euler_yzx_array(Rrelative)[:,[0,2,1]]
+            elif eulerSequence == "ROT":
+                absoluteAngleValues = euler.euler_zxy_array(Rrelative)[:,[2,1,0]]
+            elif eulerSequence == "RTO":
+                absoluteAngleValues = euler.euler_zyx_array(Rrelative)[:,[1,2,0]]
+            elif eulerSequence == "OTR":
+                absoluteAngleValues = euler.euler_xyz_array(Rrelative)[:,[1,0,2]]
+            elif eulerSequence == "ORT":
+                absoluteAngleValues = euler.euler_xzy_array(Rrelative)[:,[2,0,1]]
+            elif eulerSequence in ["YXZ","YZX","ZXY","ZYX","XYZ","XZY"]:
+                absoluteAngleValues = euler.eulerArray(Rrelative,eulerSequence)
+            else:
+                logging.debug("no sequence defined for absolute angles. sequence YXZ selected by default" )
+                absoluteAngleValues = euler.euler_yxz_array(Rrelative)
 
             segName = self.m_segmentLabels[index]
 
@@ -1041,9 +1022,7 @@ class ModelAbsoluteAnglesFilter(object):
                     fullAngleLabel  = self.m_angleLabels[index] + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else self.m_angleLabels[index]+"Angles"
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
+                    absoluteAngleValuesFinal = euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest)
                     absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
 
                     btkTools.smartAppendPoint(self.m_aqui, fullAngleLabel,
@@ -1070,9 +1049,7 @@ class ModelAbsoluteAnglesFilter(object):
                     fullAngleLabel  = self.m_angleLabels[index] + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else self.m_angleLabels[index]+"Angles"
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
+                    absoluteAngleValuesFinal = euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest)
                     absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
 
 
@@ -1091,9 +1068,7 @@ class ModelAbsoluteAnglesFilter(object):
 
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
+                    absoluteAngleValuesFinal = euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest)
                     absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
 
 
@@ -1113,9 +1088,7 @@ class ModelAbsoluteAnglesFilter(object):
                     fullAngleLabel  = "R" + self.m_angleLabels[index] + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else "R" +self.m_angleLabels[index]+"Angles"
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
+                    absoluteAngleValuesFinal = euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest)
                     absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
 
                     btkTools.smartAppendPoint(self.m_aqui, fullAngleLabel,
@@ -1138,7 +1111,7 @@ class ForcePlateAssemblyFilter(object):
         Assemble Force plate with the model
     """
 
-    def __init__(self, iMod, btkAcq, mappedForcePlateLetters, leftSegmentLabel="Left Foot", rightSegmentLabel="Right Foot" ):
+    def __init__(self, iMod, btkAcq, mappedForcePlateLetters, leftSegmentLabel="Left Foot", rightSegmentLabel="Right Foot", wrenchs=None ):
         """
             :Parameters:
                - `btkAcq` (btkAcquisition) - btk acquisition instance of a dynamic trial
@@ -1146,9 +1119,13 @@ class ForcePlateAssemblyFilter(object):
                - `mappedForcePlateLetters` (str) - string indicating body side of the segment in contact with the force plate
                - `leftSegmentLabel` (str) - left segment label to assemble with force plates
                - `rightSegmentLabel` (str) - right segment label to assemble with force plates
+               - `wrenchs` (pyCGM2.ForcePlates.forceplates.ForcePlateWrenchs) - [optional] force plate wrenchs already extracted from the acquisition ( ex: during the foot matching)
+
+            .. warning:: the ground reaction wrenchs assembled with the model are downsampled in place. The assembly is the last use of the extracted wrenchs.
 
         """
         self.m_aqui = btkAcq
+        self.m_wrenchs = wrenchs if wrenchs is not None else forceplates.ForcePlateWrenchs(btkAcq)
         self.m_model = iMod
         self.m_mappedForcePlate = mappedForcePlateLetters
         self.m_leftSeglabel = leftSegmentLabel
@@ -1165,21 +1142,12 @@ class ForcePlateAssemblyFilter(object):
             run `ForcePlateAssemblyFilter`
         """
 
-        pfe = btk.btkForcePlatformsExtractor()
-        grwf = btk.btkGroundReactionWrenchFilter()
-        pfe.SetInput(self.m_aqui)
-        pfc = pfe.GetOutput()
-        grwf.SetInput(pfc)
-        grwc = grwf.GetOutput()
-        grwc.Update()
+        grwc = self.m_wrenchs.getGroundReactionWrenchs()
 
         appf = self.m_aqui.GetNumberAnalogSamplePerFrame()
         pfn = self.m_aqui.GetPointFrameNumber()
 
-        fpwf = btk.btkForcePlatformWrenchFilter() # the wrench of the center of the force platform data, expressed in the global frame
-        fpwf.SetInput(pfe.GetOutput())
-        fpwc = fpwf.GetOutput()
-        fpwc.Update()
+        fpwc = self.m_wrenchs.getForcePlatformWrenchs() # the wrench of the center of the force platform data, expressed in the global frame
 
 
         left_forceValues =  np.zeros((pfn,3))
@@ -1321,6 +1289,7 @@ class InverseDynamicFilter(object):
 
 
 
+        outputs = OrderedDict()
         for it in  self.m_model.m_jointCollection:
 
             if it.m_label not in ["ForeFoot"]:  # TODO : clumpsy... :-(  Think about a new method
@@ -1348,19 +1317,15 @@ class InverseDynamicFilter(object):
                         elif self.m_projection == enums.MomentProjection.Proximal:
                             mot = self.m_model.getSegment(proximalSegLabel).anatomicalFrame.motion
 
-                        forceValues = np.zeros((nFrames,3))
-                        momentValues = np.zeros((nFrames,3))
-                        for i in range(0,nFrames ):
-                            if self.m_projection == enums.MomentProjection.Global:
-                                forceValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(Rglobal.T,
-                                                                                            self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetForce().GetValues()[i,:].T)
-                                momentValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(Rglobal.T,
-                                                                                          self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()[i,:].T)
-                            else:
-                                forceValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(mot[i].getRotation().T,
-                                                                                        self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetForce().GetValues()[i,:].T)
-                                momentValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(mot[i].getRotation().T,
-                                                                                        self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()[i,:].T)
+                        F = self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetForce().GetValues()
+                        M = self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()
+                        if self.m_projection == enums.MomentProjection.Global:
+                            forceValues = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(F,Rglobal)
+                            momentValues = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(M,Rglobal)
+                        else:
+                            R = mot.getRotations()
+                            forceValues = (1.0 / self.m_model.mp["Bodymass"]) * np.einsum("nji,nj->ni",R,F)
+                            momentValues = (1.0 / self.m_model.mp["Bodymass"]) * np.einsum("nji,nj->ni",R,M)
 
 
                     else:
@@ -1451,15 +1416,10 @@ class InverseDynamicFilter(object):
                         finalMomentValues = momentValues
 
                     fulljointLabel_force  = jointLabel + "Force_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Force"
-
-                    btkTools.smartAppendPoint(self.m_aqui,
-                                     fulljointLabel_force,
-                                     finalForceValues,PointType=btk.btkPoint.Force, desc="")
+                    outputs[fulljointLabel_force] = (finalForceValues,btk.btkPoint.Force,"")
 
                     fulljointLabel_moment  = jointLabel + "Moment_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Moment"
-                    btkTools.smartAppendPoint(self.m_aqui,
-                                     fulljointLabel_moment,
-                                     finalMomentValues,PointType=btk.btkPoint.Moment, desc="")
+                    outputs[fulljointLabel_moment] = (finalMomentValues,btk.btkPoint.Moment,"")
 
                     # Todo - Validate
                     # if self.m_exportMomentContributions:
@@ -1481,6 +1441,7 @@ class InverseDynamicFilter(object):
                     #                          fulljointLabel_moment,
                     #                          finalMomentValues,PointType=btk.btkPoint.Moment, desc= contIt + " Moment contribution")
 
+        btkTools.smartAppendPoints(self.m_aqui,outputs)
 
 
 class JointPowerFilter(object):
@@ -1510,6 +1471,7 @@ class JointPowerFilter(object):
                - `pointLabelSuffix` (str) - suffix ending the power label
         """
 
+        outputs = OrderedDict()
         for it in  self.m_model.m_jointCollection:
             if "ForeFoot" not in it.m_label:
                 logging.debug("power of %s"  %(it.m_label))
@@ -1526,15 +1488,16 @@ class JointPowerFilter(object):
 
                     relativeOmega = prox_omegai - dist_omegai
 
+                    moment = self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()
+
                     power = np.zeros((nFrames,3))
-                    for i in range(0, nFrames):
-                        power[i,2] = -1.0*(1.0 / self.m_model.mp["Bodymass"]) * self.m_scale * np.dot(self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()[i,:] ,relativeOmega[i,:])#
+                    power[:,2] = -1.0*(1.0 / self.m_model.mp["Bodymass"]) * self.m_scale * np.einsum("ij,ij->i",moment ,relativeOmega)
 
 
                     fulljointLabel  = jointLabel + "Power_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Power"
-                    btkTools.smartAppendPoint(self.m_aqui,
-                                     fulljointLabel,
-                                     power,PointType=btk.btkPoint.Power, desc="")
+                    outputs[fulljointLabel] = (power,btk.btkPoint.Power,"")
+
+        btkTools.smartAppendPoints(self.m_aqui,outputs)
 
 
 class GeneralCoordinateSystemProcedure(object):
@@ -1612,7 +1575,7 @@ class CentreOfMassFilter(object):
         self.model.setCentreOfMass(com)
 
         outLabel  = "CentreOfMass_" + pointLabelSuffix if pointLabelSuffix is not None else "CentreOfMass"
-        btkTools.smartAppendPoint(self.aqui,outLabel,self.model.getCentreOfMass())
+        btkTools.smartAppendPoints(self.aqui,{outLabel : (self.model.getCentreOfMass(),btk.btkPoint.Marker,"")})
 
 class Naim2019ThighMisaligmentCorrectionProcedure(object):
     """
@@ -1697,31 +1660,8 @@ class Naim2019ThighMisaligmentCorrectionProcedure(object):
             #alteration of the segmental motion
             seg.anatomicalFrame.motion=[] # erase all previous motion
 
-            csFrame=frame.Frame()
-            for i in range(0,len(ajc)):
-                pt1=kjc[i,:]
-                pt2=hjc[i,:]
-                pt3=virtual[i,:]
-                ptOrigin=hjc[i,:]
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,sequence)
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            R=frame.getRotationsFromPoints(kjc,hjc,virtual,sequence)
+            seg.anatomicalFrame.setMotion(R,hjc)
 
 
             logging.warning("[pyCGM2] : %s thigh anatomical frame motion corrected according Naim et al, 2019"%(side))
@@ -36,3 +36,55 @@ def segmentalLeastSquare(A, B):
 
 
     return R, L, RMSE, Am, Bm
+
+
+def segmentalLeastSquareArrays(A, B, visibility=None):
+    """
+        Compute the transformation between two coordinate systems using SVD for all frames at once.
+
+        :Parameters:
+            - `A` (numpy.array(m,3) or numpy.array(n,m,3)) - Coordinates [x,y,z] of the m markers in the reference position
+            - `B` (numpy.array(n,m,3)) - Coordinates [x,y,z] of the m markers for the n frames
+            - `visibility` (numpy.array(n,m) of bool) - markers used for each frame. All markers are used if None
+
+        :Return:
+            - `R` (numpy.array(n,3,3)) - Rotation matrices between A and B
+            - `L` (numpy.array(n,3)) - Translation vectors between A and B
+            - `RMSE` (numpy.array(n)) - Root-mean-squared errors for the rigid body model( :math:` B = R*A + L + err`). nan if no marker is visible
+            - `Am` (numpy.array(n,3)) - centroid of the visible markers in A
+            - `Bm` (numpy.array(n,3)) - centroid of the visible markers in B
+
+        .. note:: frames without visible markers return an identity rotation and a null translation
+    """
+    B = np.asarray(B,dtype=float)
+    A = np.asarray(A,dtype=float)
+    if A.ndim == 2:
+        A = np.broadcast_to(A,B.shape)
+
+    if visibility is None:
+        visibility = np.ones(B.shape[0:2],dtype=bool)
+    w = np.asarray(visibility,dtype=float)
+    count = w.sum(axis=1)
+    safeCount = np.where(count>0,count,1.0).reshape(-1,1)
+
+    Am = np.einsum("nk,nki->ni",w,A) / safeCount        # centroid of m1
+    Bm = np.einsum("nk,nki->ni",w,B) / safeCount        # centroid of m2
+    Ac = A - Am[:,np.newaxis,:]
+    Bc = B - Bm[:,np.newaxis,:]
+    M = np.einsum("nk,nki,nkj->nij",w,Bc,Ac)            # considering only rotation
+
+    # singular value decomposition
+    U, S, Vt = np.linalg.svd(M)
+    # rotation matrix
+    D = np.ones((B.shape[0],3))
+    D[:,2] = np.linalg.det(np.einsum("nij,njk->nik",U,Vt))
+    R = np.einsum("nij,nj,njk->nik",U,D,Vt)
+    # translation vector
+    L = Bm - np.einsum("nij,nj->ni",R,Am)
+    # RMSE
+    Bp = np.einsum("nij,nkj->nki",R,A) + L[:,np.newaxis,:]
+    err = np.einsum("nk,nki->n",w,(Bp - B)**2)
+    RMSE = np.sqrt(err/safeCount.ravel()/3)
+    RMSE[count==0] = np.nan
+
+    return R, L, RMSE, Am, Bm
@@ -197,18 +197,20 @@ class AnalysisBuilder(AbstractBuilder):
         logging.info("--kinematic computation--")
         if self.m_cycles.kinematicCycles is not None:
             if "Left" in self.m_kinematicLabelsDict.keys():
-                for label in self.m_kinematicLabelsDict["Left"]:
-                    labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                    out[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kinematicCycles,labelPlus,"Left")
+                labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Left"]]
+                stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kinematicCycles,labelsPlus,"Left")
+                for labelPlus in labelsPlus:
+                    out[labelPlus,"Left"]=stats[labelPlus]
 
                 logging.info("left kinematic computation---> done")
             else:
                 logging.warning("No left Kinematic computation")
 
             if "Right" in self.m_kinematicLabelsDict.keys():
-                for label in self.m_kinematicLabelsDict["Right"]:
-                    labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                    out[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kinematicCycles,labelPlus,"Right")
+                labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Right"]]
+                stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kinematicCycles,labelsPlus,"Right")
+                for labelPlus in labelsPlus:
+                    out[labelPlus,"Right"]=stats[labelPlus]
 
                 logging.info("right kinematic computation---> done")
             else:
@@ -244,25 +246,29 @@ class AnalysisBuilder(AbstractBuilder):
 
            if "Left" in self.m_kineticLabelsDict.keys():
                if "Left" in found_context:
-                   for label in self.m_kineticLabelsDict["Left"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       out[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Left")
-                   for label in self.m_kinematicLabelsDict["Left"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       outOptional[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Left")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kineticLabelsDict["Left"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Left")
+                   for labelPlus in labelsPlus:
+                       out[labelPlus,"Left"]=stats[labelPlus]
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Left"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Left")
+                   for labelPlus in labelsPlus:
+                       outOptional[labelPlus,"Left"]=stats[labelPlus]
                    logging.info("left kinetic computation---> done")
                else:
                    logging.warning("No left Kinetic computation")
 
            if "Right" in self.m_kineticLabelsDict.keys():
                if  "Right" in found_context:
-                   for label in self.m_kineticLabelsDict["Right"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       out[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Right")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kineticLabelsDict["Right"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Right")
+                   for labelPlus in labelsPlus:
+                       out[labelPlus,"Right"]=stats[labelPlus]
 
-                   for label in self.m_kinematicLabelsDict["Right"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       outOptional[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Right")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Right"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Right")
+                   for labelPlus in labelsPlus:
+                       outOptional[labelPlus,"Right"]=stats[labelPlus]
 
                    logging.info("right kinetic computation---> done")
                else:
@@ -288,9 +294,11 @@ class AnalysisBuilder(AbstractBuilder):
 
         logging.info("--emg computation--")
         if self.m_cycles.emgCycles is not None:
+            statsLeft = CGM2cycle.analogs_descriptiveStats(self.m_cycles.emgCycles,self.m_emgLabelList,"Left")
+            statsRight = CGM2cycle.analogs_descriptiveStats(self.m_cycles.emgCycles,self.m_emgLabelList,"Right")
             for rawLabel in self.m_emgLabelList:
-                out[rawLabel,"Left"]=CGM2cycle.analog_descriptiveStats(self.m_cycles.emgCycles,rawLabel,"Left")
-                out[rawLabel,"Right"]=CGM2cycle.analog_descriptiveStats(self.m_cycles.emgCycles,rawLabel,"Right")
+                out[rawLabel,"Left"]=statsLeft[rawLabel]
+                out[rawLabel,"Right"]=statsRight[rawLabel]
 
         else:
             logging.warning("No emg computation")
@@ -392,9 +400,10 @@ class GaitAnalysisBuilder(AbstractBuilder):
         logging.info("--kinematic computation--")
         if self.m_cycles.kinematicCycles is not None:
             if "Left" in self.m_kinematicLabelsDict.keys():
-                for label in self.m_kinematicLabelsDict["Left"]:
-                    labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                    out[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kinematicCycles,labelPlus,"Left")
+                labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Left"]]
+                stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kinematicCycles,labelsPlus,"Left")
+                for labelPlus in labelsPlus:
+                    out[labelPlus,"Left"]=stats[labelPlus]
 
                 for label in CGM2cycle.GaitCycle.STP_LABELS:
                     outPst[label,"Left"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kinematicCycles,label,"Left")
@@ -404,9 +413,10 @@ class GaitAnalysisBuilder(AbstractBuilder):
                 logging.warning("No left Kinematic computation")
 
             if "Right" in self.m_kinematicLabelsDict.keys():
-                for label in self.m_kinematicLabelsDict["Right"]:
-                    labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                    out[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kinematicCycles,labelPlus,"Right")
+                labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Right"]]
+                stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kinematicCycles,labelsPlus,"Right")
+                for labelPlus in labelsPlus:
+                    out[labelPlus,"Right"]=stats[labelPlus]
 
                 for label in CGM2cycle.GaitCycle.STP_LABELS:
                     outPst[label,"Right"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kinematicCycles,label,"Right")
@@ -445,14 +455,16 @@ class GaitAnalysisBuilder(AbstractBuilder):
 
            if "Left" in self.m_kineticLabelsDict.keys():
                if "Left" in found_context:
-                   for label in self.m_kineticLabelsDict["Left"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       out[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Left")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kineticLabelsDict["Left"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Left")
+                   for labelPlus in labelsPlus:
+                       out[labelPlus,"Left"]=stats[labelPlus]
                    for label in CGM2cycle.GaitCycle.STP_LABELS:
                         outPst[label,"Left"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kineticCycles,label,"Left")
-                   for label in self.m_kinematicLabelsDict["Left"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       outOptional[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Left")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Left"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Left")
+                   for labelPlus in labelsPlus:
+                       outOptional[labelPlus,"Left"]=stats[labelPlus]
                    logging.info("left kinetic computation---> done")
                else:
                    logging.warning("No left Kinetic computation")
@@ -462,16 +474,18 @@ class GaitAnalysisBuilder(AbstractBuilder):
 
            if "Right" in self.m_kineticLabelsDict.keys():
                if  "Right" in found_context:
-                   for label in self.m_kineticLabelsDict["Right"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       out[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Right")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kineticLabelsDict["Right"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Right")
+                   for labelPlus in labelsPlus:
+                       out[labelPlus,"Right"]=stats[labelPlus]
 
                    for label in CGM2cycle.GaitCycle.STP_LABELS:
                         outPst[label,"Right"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kineticCycles,label,"Right")
 
-                   for label in self.m_kinematicLabelsDict["Right"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       outOptional[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Right")
+                   labelsPlus = [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in self.m_kinematicLabelsDict["Right"]]
+                   stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,labelsPlus,"Right")
+                   for labelPlus in labelsPlus:
+                       outOptional[labelPlus,"Right"]=stats[labelPlus]
 
 
                    logging.info("right kinetic computation---> done")
@@ -501,9 +515,11 @@ class GaitAnalysisBuilder(AbstractBuilder):
         logging.info("--emg computation--")
         if self.m_cycles.emgCycles is not None:
 
+            statsLeft = CGM2cycle.analogs_descriptiveStats(self.m_cycles.emgCycles,self.m_emgLabelList,"Left")
+            statsRight = CGM2cycle.analogs_descriptiveStats(self.m_cycles.emgCycles,self.m_emgLabelList,"Right")
             for rawLabel in self.m_emgLabelList:
-                out[rawLabel,"Left"]=CGM2cycle.analog_descriptiveStats(self.m_cycles.emgCycles,rawLabel,"Left")
-                out[rawLabel,"Right"]=CGM2cycle.analog_descriptiveStats(self.m_cycles.emgCycles,rawLabel,"Right")
+                out[rawLabel,"Left"]=statsLeft[rawLabel]
+                out[rawLabel,"Right"]=statsRight[rawLabel]
 
 
             for label in CGM2cycle.GaitCycle.STP_LABELS:
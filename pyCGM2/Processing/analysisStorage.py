@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+    Columnar storage of an Analysis instance.
+
+    An analysis file is an uncompressed zip container with :
+
+        - `header.json` - format version, infos ( numpy values stored as python values) and the layout of each statistic section
+        - `arrays/<n>.npy` - one numpy array per statistic item ( mean, std, median, values...)
+
+    Arrays are stored uncompressed, so each of them can be memory-mapped from the file.
+    A loaded analysis only reads the statistic entries ( label,context) its consumer accesses.
+    The file stays open while the analysis is alive. Call `releaseFile` before replacing or removing it.
+"""
+import numpy as np
+import os
+import weakref
+import json
+import zipfile
+import struct
+import collections
+import io
+
+from pyCGM2.Processing import analysis
+
+FORMAT_VERSION = 1
+
+# sections of (label,context)-keyed statistics
+SECTIONS = ["stpStats",
+            "kinematicStats.data","kinematicStats.pst",
+            "kineticStats.data","kineticStats.pst","kineticStats.optionalData",
+            "emgStats.data","emgStats.pst",
+            "gvs","coactivations"]
+
+# zip local file header : signature, versions, flags, compression, time, date, crc, sizes, name length, extra length
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+# analysis files opened for lazy reading
+_OPEN_FILES = weakref.WeakSet()
+
+
+def isAnalysisFile(filename):
+    """
+        Check if a file is a columnar analysis file
+
+        :Parameters:
+            - `filename` (str) - full filename
+    """
+    if not zipfile.is_zipfile(filename):
+        return False
+    zf = zipfile.ZipFile(filename,"r")
+    try:
+        return "header.json" in zf.namelist()
+    finally:
+        zf.close()
+
+
+def releaseFile(filename):
+    """
+        Load in memory the statistics read, or still to read, from an analysis file, then close the file.
+        Loaded analysis instances stay valid once the file is replaced or removed
+
+        :Parameters:
+            - `filename` (str) - full filename
+    """
+    path = os.path.normcase(os.path.abspath(filename))
+    for analysisFile in list(_OPEN_FILES):
+        if analysisFile.m_path == path:
+            analysisFile.release()
+
+
+def _getSection(analysisInstance,section):
+    if "." in section:
+        structureName,member = section.split(".")
+        return getattr(getattr(analysisInstance,structureName),member,dict())
+    else:
+        return getattr(analysisInstance,section)
+
+
+def _setSection(analysisInstance,section,content):
+    if "." in section:
+        structureName,member = section.split(".")
+        setattr(getattr(analysisInstance,structureName),member,content)
+    else:
+        setattr(analysisInstance,section,content)
+
+
+class _Writer(object):
+    """
+        Write arrays of an analysis into a zip container
+    """
+    def __init__(self,zf):
+        self.m_zipFile = zf
+        self.m_count = 0
+
+    def writeArray(self,array):
+        name = "arrays/%i.npy"%(self.m_count)
+        self.m_count+=1
+
+        buf = io.BytesIO()
+        np.lib.format.write_array(buf, array, allow_pickle=False)
+        self.m_zipFile.writestr(zipfile.ZipInfo(name), buf.getvalue())
+
+        return name
+
+    def writeStatistics(self,stats):
+        """
+            write items of a statistic dictionnary, return the item layout
+        """
+        layout = dict()
+        for item,value in stats.items():
+            if isinstance(value,list):
+                kind = "list"
+                array = np.array(value)
+            elif np.isscalar(value) or (isinstance(value,np.ndarray) and value.ndim == 0):
+                kind = "scalar"
+                array = np.asarray(value)
+            else:
+                kind = "array"
+                array = np.asarray(value)
+
+            if array.dtype.hasobject:
+                raise Exception("[pyCGM2] item (%s) of the analysis can not be stored as a numeric array"%(item))
+
+            layout[item] = [kind, self.writeArray(array)]
+
+        return layout
+
+
+def _jsonDefault(value):
+    """
+        numpy values of the info dictionnaries written as their python equivalent
+    """
+    if isinstance(value,np.ndarray):
+        return value.tolist()
+    if isinstance(value,np.generic):
+        return value.item()
+    raise TypeError("[pyCGM2] %s is not JSON serializable"%(repr(value)))
+
+
+def writeAnalysis(analysisInstance,filename):
+    """
+        Write an analysis instance into a columnar analysis file
+
+        :Parameters:
+            - `analysisInstance` (pyCGM2.Processing.analysis.Analysis) - analysis instance
+            - `filename` (str) - full filename
+    """
+
+    zf = zipfile.ZipFile(filename,"w",zipfile.ZIP_STORED,allowZip64=True)
+    try:
+        writer = _Writer(zf)
+
+        header = dict()
+        header["version"] = FORMAT_VERSION
+        header["subjectInfo"] = analysisInstance.subjectInfo
+        header["experimentalInfo"] = analysisInstance.experimentalInfo
+        header["modelInfo"] = analysisInstance.modelInfo
+
+        header["sections"] = dict()
+        for section in SECTIONS:
+            content = _getSection(analysisInstance,section)
+            if content is not None:
+                header["sections"][section] = [[list(key) if isinstance(key,tuple) else [key], writer.writeStatistics(stats)]
+                                                for key,stats in content.items()]
+
+        if analysisInstance.gps is not None:
+            header["gps"] = {"Overall": writer.writeStatistics(analysisInstance.gps["Overall"]),
+                             "Context": dict([(context, writer.writeStatistics(stats)) for context,stats in analysisInstance.gps["Context"].items()])}
+        else:
+            header["gps"] = None
+
+        zf.writestr(zipfile.ZipInfo("header.json"), json.dumps(header,default=_jsonDefault))
+    finally:
+        zf.close()
+
+
+class AnalysisFile(object):
+    """
+        Read access to a columnar analysis file.
+
+        Only the header is read at construction. Arrays are read, or memory-mapped, on request.
+        The file is kept open, reads never follow a replacement of the file.
+    """
+
+    def __init__(self,filename,mmap=True):
+        """
+            :Parameters:
+                - `filename` (str) - full filename
+                - `mmap` (bool) - memory-map arrays instead of reading them. Arrays are mapped copy-on-write
+        """
+        self.m_filename = filename
+        self.m_path = os.path.normcase(os.path.abspath(filename))
+        self.m_mmap = mmap
+        self.m_statistics = list()
+
+        self.m_file = open(filename,"rb")
+        self.m_state = self._getState()
+
+        zf = zipfile.ZipFile(self.m_file,"r")
+        try:
+            self.m_members = dict([(info.filename,info) for info in zf.infolist()])
+            self.m_header = json.loads(zf.read("header.json"),object_pairs_hook=collections.OrderedDict)
+        finally:
+            zf.close()
+
+        if self.m_header["version"] > FORMAT_VERSION:
+            self.m_file.close()
+            raise Exception("[pyCGM2] analysis file version (%i) not supported. Update pyCGM2"%(self.m_header["version"]))
+
+        _OPEN_FILES.add(self)
+
+    def _getState(self):
+        state = os.fstat(self.m_file.fileno())
+        return (state.st_size,state.st_mtime)
+
+    def getHeader(self):
+        return self.m_header
+
+    def register(self,statistics):
+        """
+            Register a statistic dictionnary reading from the file. It is loaded in memory when the file is released
+
+            :Parameters:
+                - `statistics` (pyCGM2.Processing.analysisStorage.LazyStatistics) - statistic dictionnary
+        """
+        self.m_statistics.append(weakref.ref(statistics))
+
+    def release(self):
+        """
+            Load in memory all registered statistics, then close the file
+        """
+        if self.m_file is None:
+            return
+
+        self.m_mmap = False
+        for ref in self.m_statistics:
+            statistics = ref()
+            if statistics is not None:
+                statistics.materialize()
+
+        self.m_file.close()
+        self.m_file = None
+        _OPEN_FILES.discard(self)
+
+    def readArray(self,name):
+        """
+            Read an array of the file
+
+            :Parameters:
+                - `name` (str) - array member name
+        """
+        if self.m_file is None:
+            raise Exception("[pyCGM2] analysis file (%s) released. array (%s) can not be read"%(self.m_filename,name))
+        if self._getState() != self.m_state:
+            raise Exception("[pyCGM2] analysis file (%s) modified since it was opened. array (%s) can not be read"%(self.m_filename,name))
+
+        info = self.m_members[name]
+        f = self.m_file
+
+        if info.compress_type != zipfile.ZIP_STORED:
+            zf = zipfile.ZipFile(f,"r")
+            try:
+                return np.lib.format.read_array(io.BytesIO(zf.read(name)), allow_pickle=False)
+            finally:
+                zf.close()
+
+        f.seek(info.header_offset)
+        fields = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+        if fields[0] != zipfile.stringFileHeader:
+            raise Exception("[pyCGM2] analysis file (%s) corrupted. bad header of array (%s)"%(self.m_filename,name))
+        start = info.header_offset + _LOCAL_HEADER.size + fields[-2] + fields[-1]
+
+        f.seek(start)
+        version = np.lib.format.read_magic(f)
+        if version == (1,0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+
+        if self.m_mmap and len(shape)>0 and np.prod(shape)>0:
+            return np.memmap(f, dtype=dtype, mode="c", shape=shape,
+                             order="F" if fortran else "C", offset=f.tell())
+
+        f.seek(start)
+        return np.lib.format.read_array(f, allow_pickle=False)
+
+
+class LazyStatistics(collections.MutableMapping):
+    """
+        Statistic dictionnary ( mean, std, median, values...) whose items are read from an analysis file on first access
+    """
+
+    def __init__(self,analysisFile,layout):
+        self.m_file = analysisFile
+        self.m_layout = dict(layout)
+        self.m_items = dict()
+
+        analysisFile.register(self)
+
+    def materialize(self):
+        """
+            Read all items and copy memory-mapped values in memory
+        """
+        for item in list(self.m_layout.keys()):
+            self[item]
+
+        for item,value in self.m_items.items():
+            if isinstance(value,np.memmap):
+                self.m_items[item] = np.array(value)
+            elif isinstance(value,list):
+                self.m_items[item] = [np.array(it) if isinstance(it,np.memmap) else it for it in value]
+
+    def __getitem__(self,item):
+        if item not in self.m_items:
+            if item not in self.m_layout:
+                raise KeyError(item)
+
+            kind,name = self.m_layout.pop(item)
+            array = self.m_file.readArray(name)
+            if kind == "list":
+                self.m_items[item] = list(array)
+            elif kind == "scalar":
+                self.m_items[item] = array[()]
+            else:
+                self.m_items[item] = array
+
+        return self.m_items[item]
+
+    def __setitem__(self,item,value):
+        self.m_layout.pop(item,None)
+        self.m_items[item] = value
+
+    def __delitem__(self,item):
+        if item in self.m_layout:
+            self.m_layout.pop(item)
+        else:
+            del self.m_items[item]
+
+    def __iter__(self):
+        return iter(list(self.m_items.keys()) + list(self.m_layout.keys()))
+
+    def __len__(self):
+        return len(self.m_items) + len(self.m_layout)
+
+    def __contains__(self,item):
+        return item in self.m_items or item in self.m_layout
+
+    def __repr__(self):
+        return "LazyStatistics(%s)"%(", ".join(sorted(self)))
+
+
+def readAnalysis(filename,mmap=True):
+    """
+        Read an analysis instance from a columnar analysis file
+
+        :Parameters:
+            - `filename` (str) - full filename
+            - `mmap` (bool) - memory-map arrays instead of reading them
+
+        :Return:
+            - `analysisInstance` (pyCGM2.Processing.analysis.Analysis) - analysis instance. Statistics are loaded on access
+
+    """
+    analysisFile = AnalysisFile(filename,mmap=mmap)
+    header = analysisFile.getHeader()
+
+    analysisInstance = analysis.Analysis()
+    # AnalysisStructure members are class attributes. each structure needs its own dictionnaries
+    for structure in [analysisInstance.kinematicStats,analysisInstance.kineticStats,analysisInstance.emgStats]:
+        structure.data = dict()
+        structure.pst = dict()
+        structure.optionalData = dict()
+
+    analysisInstance.setSubjectInfo(header["subjectInfo"])
+    analysisInstance.setExperimentalInfo(header["experimentalInfo"])
+    analysisInstance.setModelInfo(header["modelInfo"])
+
+    for section in SECTIONS:
+        if section not in header["sections"]:
+            continue
+        content = dict()
+        for key,layout in header["sections"][section]:
+            key = tuple(key) if len(key)>1 else key[0]
+            content[key] = LazyStatistics(analysisFile,layout)
+        _setSection(analysisInstance,section,content)
+
+    if header["gps"] is not None:
+        analysisInstance.setGps(LazyStatistics(analysisFile,header["gps"]["Overall"]),
+                                dict([(context, LazyStatistics(analysisFile,layout)) for context,layout in header["gps"]["Context"].items()]))
+
+    return analysisInstance
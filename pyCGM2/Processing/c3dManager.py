@@ -2,6 +2,7 @@
 import numpy as np
 import pandas as pd
 import logging
+import os
 
 # pyCGM2
 from pyCGM2.Tools import trialTools
@@ -16,6 +17,55 @@ class C3dManager(object):
         self.emg={"Trials":None , "Filenames":None}
 
 
+class TrialCache(object):
+    """
+        Cache of openma trials, keyed by file path and modification time.
+
+        A c3d is read and its events sorted once, then the trial instance is shared
+        by reference between the trial sets. A modified file is read again.
+    """
+
+    def __init__ (self):
+        self.m_trials = dict()
+
+    def getTrial(self,data_path,filename):
+        """
+            Get the trial of a c3d file
+
+            :Parameters:
+                - `data_path` (str) - folder path
+                - `filename` (str) - c3d filename
+
+            :Return:
+                - `trial` (openma.trial) - trial with sorted events
+        """
+        path = os.path.abspath(filename if data_path is None else data_path+filename)
+        mtime = os.path.getmtime(path)
+
+        if path in self.m_trials and self.m_trials[path][0] == mtime:
+            return self.m_trials[path][1]
+
+        trial = trialTools.smartTrialReader(data_path,filename)
+        self.m_trials[path] = (mtime,trial)
+
+        return trial
+
+    def buildTrials(self,data_path,filenames):
+        """
+            Get trial list from filenames ( see trialTools.buildTrials)
+        """
+
+        trials = [self.getTrial(data_path,filename) for filename in filenames]
+        return trials,list(filenames)
+
+    def automaticKineticDetection(self,data_path,filenames):
+        """
+            Detect trials with correct kinetics ( see trialTools.automaticKineticDetection)
+        """
+        trials,filenames = self.buildTrials(data_path,filenames)
+        return trialTools.automaticKineticDetection(data_path,filenames,trials = trials)
+
+
 
 class UniqueOpenmaTrialSetProcedure(object):
 
@@ -54,9 +104,10 @@ class UniqueOpenmaTrialSetProcedure(object):
 class UniqueC3dSetProcedure(object):
 
 
-    def __init__(self, data_path, fileLst):
+    def __init__(self, data_path, fileLst, trialCache=None):
         self.m_files = fileLst
         self.m_data_path = data_path
+        self.m_trialCache = TrialCache() if trialCache is None else trialCache
 
 
 
@@ -65,29 +116,30 @@ class UniqueC3dSetProcedure(object):
 
         #---spatioTemporalTrials
         if spatioTempFlag:
-            c3dManager.spatioTemporal["Trials"],c3dManager.spatioTemporal["Filenames"] = trialTools.buildTrials(self.m_data_path,self.m_files)
+            c3dManager.spatioTemporal["Trials"],c3dManager.spatioTemporal["Filenames"] = self.m_trialCache.buildTrials(self.m_data_path,self.m_files)
 
 
         # ----kinematic trials---
         if kinematicFlag:
-            c3dManager.kinematic["Trials"],c3dManager.kinematic["Filenames"], = trialTools.buildTrials(self.m_data_path,self.m_files)
+            c3dManager.kinematic["Trials"],c3dManager.kinematic["Filenames"], = self.m_trialCache.buildTrials(self.m_data_path,self.m_files)
 
         #---kinetic Trials--- ( check if kinetic events)
         if kineticFlag:
-            c3dManager.kinetic["Trials"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  trialTools.automaticKineticDetection(self.m_data_path,self.m_files)
+            c3dManager.kinetic["Trials"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  self.m_trialCache.automaticKineticDetection(self.m_data_path,self.m_files)
 
 
         #----emgTrials
         if emgFlag:
-            c3dManager.emg["Trials"],c3dManager.emg["Filenames"], = trialTools.buildTrials(self.m_data_path,self.m_files)
+            c3dManager.emg["Trials"],c3dManager.emg["Filenames"], = self.m_trialCache.buildTrials(self.m_data_path,self.m_files)
 
 
 class DistinctC3dSetProcedure(object):
 
 
-    def __init__(self, data_path, stp_fileLst, kinematic_fileLst, kinetic_fileLst, emg_fileLst):
+    def __init__(self, data_path, stp_fileLst, kinematic_fileLst, kinetic_fileLst, emg_fileLst, trialCache=None):
 
         self.m_data_path = data_path
+        self.m_trialCache = TrialCache() if trialCache is None else trialCache
 
         self.m_files_stp = stp_fileLst
         self.m_files_kinematic = kinematic_fileLst
@@ -99,21 +151,21 @@ class DistinctC3dSetProcedure(object):
 
         #---spatioTemporalTrials
         if spatioTempFlag:
-            c3dManager.spatioTemporal["Trials"],c3dManager.spatioTemporal["Filenames"] = trialTools.buildTrials(self.m_data_path,self.m_files_stp)
+            c3dManager.spatioTemporal["Trials"],c3dManager.spatioTemporal["Filenames"] = self.m_trialCache.buildTrials(self.m_data_path,self.m_files_stp)
 
 
         # ----kinematic trials---
         if kinematicFlag:
-            c3dManager.kinematic["Trials"],c3dManager.kinematic["Filenames"], = trialTools.buildTrials(self.m_data_path,self.m_files_kinematic)
+            c3dManager.kinematic["Trials"],c3dManager.kinematic["Filenames"], = self.m_trialCache.buildTrials(self.m_data_path,self.m_files_kinematic)
 
         #---kinetic Trials--- ( check if kinetic events)
         if kineticFlag:
-            c3dManager.kinetic["Trials"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  trialTools.automaticKineticDetection(self.m_data_path,self.m_files_kinetic)
+            c3dManager.kinetic["Trials"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  self.m_trialCache.automaticKineticDetection(self.m_data_path,self.m_files_kinetic)
 
 
         #----emgTrials
         if emgFlag:
-            c3dManager.emg["Trials"],c3dManager.emg["Filenames"], = trialTools.buildTrials(self.m_data_path,self.m_files_emg)
+            c3dManager.emg["Trials"],c3dManager.emg["Filenames"], = self.m_trialCache.buildTrials(self.m_data_path,self.m_files_emg)
 
 
 
@@ -7,7 +7,6 @@ from pyCGM2.Tools import trialTools
 import pyCGM2.Math.normalisation  as MathNormalisation
 
 from pyCGM2 import ma
-from pyCGM2.Utils import utils
 
 #----module methods ------
 
@@ -42,81 +41,133 @@ def spatioTemporelParameter_descriptiveStats(cycles,label,context):
     return outDict
 
 
-def point_descriptiveStats(cycles,label,context):
+def _enabledCycles(cycles,context):
+    return [cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]
+
+
+def point_normalizedTensors(cycles,labels,context):
     """
-        Compute descriptive statistics of point parameters from a `cycles` instance
+        Stack time-normalized point values of the enabled cycles
 
         :Parameters:
              - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
-             - `label` (str) - point label
+             - `labels` (list of str) - point labels
              - `context` (str) - cycle side context ( Left, Right)
 
         :Return:
-            - `outDict` (dict)  - dictionnary with descriptive statistics ( mean, std, median).  Addictional Item *values* collects cycle values
+            - `tensors` (dict)  - normalized values (numpy.array(n cycles,101,3)) of each label
+
+        .. note:: all cycles and labels are normalized together in a single interpolation
 
     """
+    enabledCycles = _enabledCycles(cycles,context)
 
-    outDict=dict()
+    dataList = [cycle.getPointTimeSequenceDataBlock(labels) for cycle in enabledCycles]
+    block = MathNormalisation.timeSequencesNormalisation(101,dataList).reshape((len(enabledCycles),101,len(labels),3))
 
-    n=len([cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]) # list comprehension , get number of enabled cycle
+    tensors=dict()
+    j=0
+    for label in labels:
+        tensors[label] = block[:,:,j,:].copy()
+        j+=1
 
-    x=np.empty((101,n))
-    y=np.empty((101,n))
-    z=np.empty((101,n))
+    return tensors
 
-    listOfPointValues=list()
 
-    i=0
-    for cycle in cycles:
-        if cycle.enableFlag and cycle.context==context:
-            tmp = cycle.getPointTimeSequenceDataNormalized(label)
-            x[:,i]=tmp[:,0]
-            y[:,i]=tmp[:,1]
-            z[:,i]=tmp[:,2]
+def analog_normalizedTensors(cycles,labels,context):
+    """
+        Stack time-normalized analog values of the enabled cycles
 
-            listOfPointValues.append(tmp)
+        :Parameters:
+             - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
+             - `labels` (list of str) - analog labels
+             - `context` (str) - cycle side context ( Left, Right)
 
-            i+=1
+        :Return:
+            - `tensors` (dict)  - normalized values (numpy.array(n cycles,101,1)) of each label
 
-    meanData=np.array(np.zeros((101,3)))
-    stdData=np.array(np.zeros((101,3)))
-    medianData=np.array(np.zeros((101,3)))
+    """
+    enabledCycles = _enabledCycles(cycles,context)
 
-    if not np.all(x==0):
-        x[x == 0] = np.nan
-        meanData[:,0] = np.nanmean(x, axis=1)
-        stdData[:,0]=np.nanstd(x,axis=1)
-        medianData[:,0]=np.nanmedian(x,axis=1)
+    dataList = [cycle.getAnalogTimeSequenceDataBlock(labels) for cycle in enabledCycles]
+    block = MathNormalisation.timeSequencesNormalisation(101,dataList).reshape((len(enabledCycles),101,len(labels)))
 
-    if not np.all(y==0):
-        y[y == 0] = np.nan
-        meanData[:,1] = np.nanmean(y, axis=1)
-        stdData[:,1]=np.nanstd(y,axis=1)
-        medianData[:,1]=np.nanmedian(y,axis=1)
+    tensors=dict()
+    j=0
+    for label in labels:
+        tensors[label] = block[:,:,j:j+1].copy()
+        j+=1
 
+    return tensors
 
-    if not np.all(z==0):
-        z[z == 0] = np.nan
-        meanData[:,2] = np.nanmean(z, axis=1)
-        stdData[:,2]=np.nanstd(z,axis=1)
-        medianData[:,2]=np.nanmedian(z,axis=1)
 
+def tensor_descriptiveStats(tensor, zeroAsMissing=True):
+    """
+        Compute descriptive statistics along the cycle axis of a stacked tensor
 
-    outDict = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': listOfPointValues }
+        :Parameters:
+             - `tensor` (numpy.array(n cycles,101,n components)) - normalized values
+             - `zeroAsMissing` (bool) - zero values are considered as missing values
 
+        :Return:
+            - `meanData` (numpy.array(101,n components)) - mean
+            - `stdData` (numpy.array(101,n components)) - standard deviation
+            - `medianData` (numpy.array(101,n components)) - median
 
+        .. note:: a component with only zero values gets zero statistics
 
-    return outDict
+    """
 
+    ncomp = tensor.shape[2]
+    meanData=np.zeros((101,ncomp))
+    stdData=np.zeros((101,ncomp))
+    medianData=np.zeros((101,ncomp))
 
+    # components with non-zero values
+    enabled = np.logical_not(np.all(np.all(tensor==0,axis=0),axis=0))
 
-def analog_descriptiveStats(cycles,label,context):
+    if np.any(enabled):
+        values = tensor[:,:,enabled]
+        if zeroAsMissing:
+            values[values == 0] = np.nan
+        meanData[:,enabled] = np.nanmean(values, axis=0)
+        stdData[:,enabled] = np.nanstd(values, axis=0)
+        medianData[:,enabled] = np.nanmedian(values, axis=0)
+
+    return meanData,stdData,medianData
+
+
+def points_descriptiveStats(cycles,labels,context):
     """
-        Compute descriptive statistics of analog parameters from a `cycles` instance
+        Compute descriptive statistics of a group of point parameters from a `cycles` instance
 
         :Parameters:
              - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
-             - `label` (str) - analog label
+             - `labels` (list of str) - point labels
+             - `context` (str) - cycle side context ( Left, Right)
+
+        :Return:
+            - `out` (dict)  - dictionnary of descriptive statistics of each label ( see point_descriptiveStats)
+
+    """
+
+    tensors = point_normalizedTensors(cycles,labels,context)
+
+    out=dict()
+    for label in labels:
+        meanData,stdData,medianData = tensor_descriptiveStats(tensors[label])
+        out[label] = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': list(tensors[label]) }
+
+    return out
+
+
+def point_descriptiveStats(cycles,label,context):
+    """
+        Compute descriptive statistics of point parameters from a `cycles` instance
+
+        :Parameters:
+             - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
+             - `label` (str) - point label
              - `context` (str) - cycle side context ( Left, Right)
 
         :Return:
@@ -124,70 +175,172 @@ def analog_descriptiveStats(cycles,label,context):
 
     """
 
+    return points_descriptiveStats(cycles,[label],context)[label]
 
 
-    outDict=dict()
+def analogs_descriptiveStats(cycles,labels,context):
+    """
+        Compute descriptive statistics of a group of analog parameters from a `cycles` instance
 
+        :Parameters:
+             - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
+             - `labels` (list of str) - analog labels
+             - `context` (str) - cycle side context ( Left, Right)
 
+        :Return:
+            - `out` (dict)  - dictionnary of descriptive statistics of each label ( see analog_descriptiveStats)
 
-    n=len([cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]) # list comprehension , get number of enabled cycle
+    """
 
-    listOfPointValues=list()
-    x=np.empty((101,n))
+    tensors = analog_normalizedTensors(cycles,labels,context)
 
-    i=0
-    for cycle in cycles:
-        if cycle.enableFlag and cycle.context==context:
-            tmp = cycle.getAnalogTimeSequenceDataNormalized(label)
-            x[:,i]=tmp[:,0]
-            listOfPointValues.append(tmp)
-            i+=1
+    out=dict()
+    for label in labels:
+        meanData,stdData,medianData = tensor_descriptiveStats(tensors[label],zeroAsMissing=False)
+        maximalValues = np.max(tensors[label][:,:,0],axis=1)
+        out[label] = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': list(tensors[label]), 'maxs': maximalValues}
 
+    return out
 
-    meanData=np.array(np.zeros((101,1)))
-    if not np.all(x==0):
-        meanData[:,0]=np.nanmean(x,axis=1)
 
-    stdData=np.array(np.zeros((101,1)))
-    if not np.all(x==0):
-        stdData[:,0]=np.nanstd(x,axis=1)
+def analog_descriptiveStats(cycles,label,context):
+    """
+        Compute descriptive statistics of analog parameters from a `cycles` instance
 
-    medianData=np.array(np.zeros((101,1)))
-    if not np.all(x==0):
-        medianData[:,0]=np.nanmedian(x,axis=1)
+        :Parameters:
+             - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
+             - `label` (str) - analog label
+             - `context` (str) - cycle side context ( Left, Right)
 
-    maximalValues = np.max(x,axis=0)
+        :Return:
+            - `outDict` (dict)  - dictionnary with descriptive statistics ( mean, std, median).  Addictional Item *values* collects cycle values
 
-    outDict = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': listOfPointValues, 'maxs': maximalValues}
+    """
 
-    return outDict
+    return analogs_descriptiveStats(cycles,[label],context)[label]
 
 
 def construcGaitCycle(trial):
     gaitCycles=list()
 
+    trialContext = TrialContext(trial)
+
     context = "Left"
-    left_fs_times=list()
-    for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Left"]]):
-        left_fs_times.append(ev.time())
+    left_fs_times=trialContext.getFootStrikeTimes(context)
 
     for i in range(0, len(left_fs_times)-1):
         gaitCycles.append (GaitCycle(trial, left_fs_times[i],left_fs_times[i+1],
-                                       context))
+                                       context, trialContext=trialContext))
 
     context = "Right"
-    right_fs_times=list()
-    for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Right"]]):
-        right_fs_times.append(ev.time())
+    right_fs_times=trialContext.getFootStrikeTimes(context)
 
     for i in range(0, len(right_fs_times)-1):
         gaitCycles.append (GaitCycle(trial, right_fs_times[i],right_fs_times[i+1],
-                                       context))
+                                       context, trialContext=trialContext))
 
     return gaitCycles
 
 #----module classes ------
 
+class TrialContext(object):
+    """
+        Data of a trial shared by all its cycles ( progression, sorted events).
+        Each value is extracted from the trial once, at the first request. Time sequence arrays are read through the time sequence index of the trial.
+    """
+
+    def __init__(self,trial):
+        """
+        :Parameters:
+             - `trial` (openma-trial) - openma from a c3d
+        """
+        self.m_trial = trial
+        self.m_timeSequences = trialTools.getTimeSequenceIndex(trial)
+
+        self.m_firstFrame = None
+        self.m_progression = dict()
+        self.m_events = None
+
+    def getFirstFrame(self):
+        """
+            Get the first frame of the trial
+        """
+        if self.m_firstFrame is None:
+            pointfrequency = self.m_trial.property("POINT:RATE").cast()
+            analogfrequency = self.m_trial.property("ANALOG:RATE").cast()
+            try:
+                ts = self.m_trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Marker]])
+                self.m_firstFrame = int(round(ts.startTime() * pointfrequency))
+
+            except ValueError:
+                logging.warning("[pyCGM2] : there are no time sequence of type marker in the openmaTrial")
+                appf =  analogfrequency / pointfrequency
+                self.m_firstFrame = int(round(self.m_trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Analog]]).startTime() * analogfrequency))/appf
+
+        return self.m_firstFrame
+
+    def getPointData(self,pointLabel):
+        """
+            Get values of a point over the whole trial
+
+            :Parameters:
+                - `pointLabel` (str) - point Label
+
+            :Return:
+                - `values` (numpy.array(n,3)) - point values. None if the point doesn t exist
+        """
+        data = self.m_timeSequences.getData(pointLabel)
+        return data[:,0:3] if data is not None else None # 0.3 because openma::Ts includes a forth column (i.e residual)
+
+    def getAnalogData(self,analogLabel):
+        """
+            Get values of an analog over the whole trial
+
+            :Parameters:
+                - `analogLabel` (str) - analog Label
+
+            :Return:
+                - `values` (numpy.array(n,1)) - analog values. None if the analog doesn t exist
+        """
+        return self.m_timeSequences.getData(analogLabel)
+
+    def getProgression(self,pointLabel):
+        """
+            Get the progression of the trial from a point ( see trialTools.findProgression)
+        """
+        if pointLabel not in self.m_progression:
+            self.m_progression[pointLabel] = trialTools.findProgression(self.m_trial,pointLabel)
+
+        return self.m_progression[pointLabel]
+
+    def getSortedEvents(self):
+        """
+            Get the events of the node *SortedEvents* and their frames
+
+            :Return:
+                - `events` (list of openma events) - events, in the order of the node
+                - `frames` (numpy.array(n,)) - event frames
+        """
+        if self.m_events is None:
+            pointfrequency = self.m_trial.property("POINT:RATE").cast()
+            events = list(self.m_trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event))
+            frames = np.array([round(ev.time() * pointfrequency) + 1 for ev in events])
+            self.m_events = (events,frames)
+
+        return self.m_events
+
+    def getFootStrikeTimes(self,context):
+        """
+            Get foot strike times of a context
+
+            :Parameters:
+                - `context` (str) - event context ( Left or Right)
+        """
+        events,frames = self.getSortedEvents()
+
+        return [ev.time() for ev in events if ev.name() == "Foot Strike" and ev.context() == context]
+
+
 class Cycle(ma.Node):
     """
         Cut out a trial and create a generic Cycle from specific times
@@ -196,13 +349,14 @@ class Cycle(ma.Node):
 
 
 
-    def __init__(self,trial,startTime,endTime,context, enableFlag = True):
+    def __init__(self,trial,startTime,endTime,context, enableFlag = True, trialContext=None):
         """
         :Parameters:
              - `trial` (openma-trial) - openma from a c3d
              - `startTime` (double) -  start time of the cycle
              - `endTime` (double) - end time of the cycle
              - `enableFlag` (bool) - flag the Cycle in order to indicate if we can use it in a analysis process.
+             - `trialContext` (TrialContext) - data of the trial shared with the other cycles of the trial. Created if None
 
         .. note:
 
@@ -212,18 +366,13 @@ class Cycle(ma.Node):
         nodeLabel = "Cycle"
         super(Cycle,self).__init__(nodeLabel)
         self.trial=trial
+        self.m_trialContext = trialContext if trialContext is not None else TrialContext(trial)
 
         self.pointfrequency = trial.property("POINT:RATE").cast() #trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Marker]]).sampleRate()
         self.analogfrequency = trial.property("ANALOG:RATE").cast() #trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Analog]]).sampleRate()
         self.appf =  self.analogfrequency / self.pointfrequency
 
-        try:
-            trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Marker]]).sampleRate()
-            self.firstFrame = int(round(trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Marker]]).startTime() * self.pointfrequency))
-
-        except ValueError:
-            logging.warning("[pyCGM2] : there are no time sequence of type marker in the openmaTrial")
-            self.firstFrame = int(round(trial.findChild(ma.T_TimeSequence,"",[["type",ma.TimeSequence.Type_Analog]]).startTime() * self.analogfrequency))/self.appf
+        self.firstFrame = self.m_trialContext.getFirstFrame()
 
         self.begin =  int(round(startTime * self.pointfrequency) + 1)
         self.end = int(round(endTime * self.pointfrequency) + 1)
@@ -258,8 +407,9 @@ class Cycle(ma.Node):
 
         """
 
-        if trialTools.isTimeSequenceExist(self.trial,pointLabel):
-            return self.trial.findChild(ma.T_TimeSequence, utils.str(pointLabel)).data()[self.begin-self.firstFrame:self.end-self.firstFrame+1,0:3] # 0.3 because openma::Ts includes a forth column (i.e residual)
+        data = self.m_trialContext.getPointData(pointLabel)
+        if data is not None:
+            return data[self.begin-self.firstFrame:self.end-self.firstFrame+1,:]
         else:
             logging.debug("[pyCGM2] the point Label %s doesn t exist in %s" % (pointLabel,self.trial.name()))
             return None
@@ -283,6 +433,51 @@ class Cycle(ma.Node):
 
         return out
 
+    def getPointTimeSequenceDataBlock(self,pointLabels):
+        """
+            Get temporal data of a set of point labels
+
+            :Parameters:
+                - `pointLabels` (list of str) - point Labels
+
+            :Return:
+                - `out` (numpy.array(n frames,n labels*3)) - values, zeros for a missing label
+
+        """
+
+        dataList=list()
+        nFrames = self.end-self.begin+1
+        for pointLabel in pointLabels:
+            data = self.getPointTimeSequenceData(pointLabel)
+            if data is not None:
+                nFrames = data.shape[0]
+            dataList.append(data)
+
+        out=np.zeros((nFrames,len(pointLabels)*3))
+        i=0
+        for data in dataList:
+            if data is not None:
+                out[:,3*i:3*i+3] = data
+            i+=1
+
+        return out
+
+    def getPointTimeSequenceDataNormalizedBlock(self,pointLabels):
+        """
+            Normalisation of a set of point labels in a single interpolation
+
+            :Parameters:
+                - `pointLabels` (list of str) - point Labels
+
+            :Return:
+                - `out` (numpy.array(101,n labels,3)) - normalized values, zeros for a missing label
+
+        """
+
+        out = MathNormalisation.timeSequenceNormalisation(101,self.getPointTimeSequenceDataBlock(pointLabels))
+
+        return out.reshape((101,len(pointLabels),3))
+
     def getAnalogTimeSequenceData(self,analogLabel):
         """
             Get analog data of the cycle
@@ -291,8 +486,9 @@ class Cycle(ma.Node):
                 - `analogLabel` (str) - analog Label
 
         """
-        if trialTools.isTimeSequenceExist(self.trial,analogLabel):
-            return  self.trial.findChild(ma.T_TimeSequence, utils.str(analogLabel)).data()[int((self.begin-self.firstFrame) * self.appf) : int((self.end-self.firstFrame+1) * self.appf),:]
+        data = self.m_trialContext.getAnalogData(analogLabel)
+        if data is not None:
+            return  data[int((self.begin-self.firstFrame) * self.appf) : int((self.end-self.firstFrame+1) * self.appf),:]
         else:
             logging.debug("[pyCGM2] the Analog Label %s doesn t exist in %s" % (analogLabel,self.trial.name()))
             return None
@@ -314,6 +510,49 @@ class Cycle(ma.Node):
 
         return  out
 
+    def getAnalogTimeSequenceDataBlock(self,analogLabels):
+        """
+            Get data of a set of analog labels
+
+            :Parameters:
+                - `analogLabels` (list of str) - analog Labels
+
+            :Return:
+                - `out` (numpy.array(n samples,n labels)) - values, zeros for a missing label
+
+        """
+
+        dataList=list()
+        nSamples = int((self.end-self.firstFrame+1) * self.appf) - int((self.begin-self.firstFrame) * self.appf)
+        for analogLabel in analogLabels:
+            data = self.getAnalogTimeSequenceData(analogLabel)
+            if data is not None:
+                nSamples = data.shape[0]
+            dataList.append(data)
+
+        out=np.zeros((nSamples,len(analogLabels)))
+        i=0
+        for data in dataList:
+            if data is not None:
+                out[:,i] = data[:,0]
+            i+=1
+
+        return out
+
+    def getAnalogTimeSequenceDataNormalizedBlock(self,analogLabels):
+        """
+            Normalisation of a set of analog labels in a single interpolation
+
+            :Parameters:
+                - `analogLabels` (list of str) - analog Labels
+
+            :Return:
+                - `out` (numpy.array(101,n labels)) - normalized values, zeros for a missing label
+
+        """
+
+        return MathNormalisation.timeSequenceNormalisation(101,self.getAnalogTimeSequenceDataBlock(analogLabels))
+
     def getEvents(self,context="All"):
         """
             Get all events of the cycle
@@ -324,14 +563,14 @@ class Cycle(ma.Node):
         """
 
         events = ma.Node("Events")
-        evsn = self.trial.findChild(ma.T_Node,"SortedEvents")
-        for ev in evsn.findChildren(ma.T_Event):
+        sortedEvents,frames = self.m_trialContext.getSortedEvents()
+        for ev,frame in zip(sortedEvents,frames):
             if context==("Left" or "Right") :
                 if ev.context() ==context:
-                    if round(ev.time() * self.pointfrequency) + 1  >self.begin and  round(ev.time() * self.pointfrequency) + 1<self.end:
+                    if frame >self.begin and frame <self.end:
                         ev.addParent(events)
             else:
-                if round(ev.time() * self.pointfrequency) + 1 > self.begin and  round(ev.time() * self.pointfrequency) + 1 < self.end:
+                if frame > self.begin and frame < self.end:
                     ev.addParent(events)
         return events
 
@@ -363,19 +602,20 @@ class GaitCycle(Cycle):
                 "strideWidth", "speed"]
 
 
-    def __init__(self,gaitTrial,startTime,endTime,context, enableFlag = True):
+    def __init__(self,gaitTrial,startTime,endTime,context, enableFlag = True, trialContext=None):
         """
         :Parameters:
              - `trial` (openma-trial) - openma from a c3d
              - `startTime` (double) -  start time of the cycle
              - `endTime` (double) - end time of the cycle
              - `enableFlag` (bool) - flag the Cycle in order to indicate if we can use it in a analysis process.
+             - `trialContext` (TrialContext) - data of the trial shared with the other cycles of the trial. Created if None
 
         """
 
 
 
-        super(GaitCycle, self).__init__(gaitTrial,startTime,endTime,context, enableFlag = enableFlag)
+        super(GaitCycle, self).__init__(gaitTrial,startTime,endTime,context, enableFlag = enableFlag, trialContext=trialContext)
 
         #ajout des oppositeFO, contraFO,oopositeFS
         evs=self.getEvents()
@@ -432,10 +672,10 @@ class GaitCycle(Cycle):
         #pst.setProperty("simpleStance3 ",15.0 )
         if self.context == "Left":
 
-            if trialTools.isTimeSequenceExist(self.trial,"LHEE") and trialTools.isTimeSequenceExist(self.trial,"RHEE") and trialTools.isTimeSequenceExist(self.trial,"LTOE"):
+            if self.m_trialContext.getPointData("LHEE") is not None and self.m_trialContext.getPointData("RHEE") is not None and self.m_trialContext.getPointData("LTOE") is not None:
 
 
-                progressionAxis,forwardProgression,globalFrame = trialTools.findProgression(self.trial,"LHEE")
+                progressionAxis,forwardProgression,globalFrame = self.m_trialContext.getProgression("LHEE")
                 longitudinal_axis=0  if progressionAxis =="X" else 1
                 lateral_axis=1  if progressionAxis =="X" else 0
 
@@ -457,9 +697,9 @@ class GaitCycle(Cycle):
 
         if self.context == "Right":
 
-            if trialTools.isTimeSequenceExist(self.trial,"RHEE") and trialTools.isTimeSequenceExist(self.trial,"LHEE") and trialTools.isTimeSequenceExist(self.trial,"RTOE"):
+            if self.m_trialContext.getPointData("RHEE") is not None and self.m_trialContext.getPointData("LHEE") is not None and self.m_trialContext.getPointData("RTOE") is not None:
 
-                progressionAxis,forwardProgression,globalFrame = trialTools.findProgression(self.trial,"RHEE")
+                progressionAxis,forwardProgression,globalFrame = self.m_trialContext.getProgression("RHEE")
 
                 longitudinal_axis=0  if progressionAxis =="X" else 1
                 lateral_axis=1  if progressionAxis =="X" else 0
@@ -817,6 +1057,20 @@ class GaitCyclesBuilder(CyclesBuilder):
             emgTrials = emgTrials,
             )
 
+        self.m_trialContexts = list()
+
+    def _getTrialContext(self,trial):
+        """
+            Get the context of a trial, shared by all cycles extracted from the trial
+        """
+        for it,trialContext in self.m_trialContexts:
+            if it is trial:
+                return trialContext
+
+        trialContext = TrialContext(trial)
+        self.m_trialContexts.append((trial,trialContext))
+        return trialContext
+
 
     def getSpatioTemporal(self):
         """
@@ -829,24 +1083,21 @@ class GaitCyclesBuilder(CyclesBuilder):
         if self.spatioTemporalTrials is not None:
             spatioTemporalCycles=list()
             for trial in  self.spatioTemporalTrials:
+                trialContext = self._getTrialContext(trial)
 
                 context = "Left"
-                left_fs_times=list()
-                for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Left"]]):
-                    left_fs_times.append(ev.time())
+                left_fs_times=trialContext.getFootStrikeTimes("Left")
 
                 for i in range(0, len(left_fs_times)-1):
                     spatioTemporalCycles.append (GaitCycle(trial, left_fs_times[i],left_fs_times[i+1],
-                                                   context))
+                                                   context, trialContext=trialContext))
 
                 context = "Right"
-                right_fs_times=list()
-                for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Right"]]):
-                    right_fs_times.append(ev.time())
+                right_fs_times=trialContext.getFootStrikeTimes("Right")
 
                 for i in range(0, len(right_fs_times)-1):
                     spatioTemporalCycles.append (GaitCycle(trial, right_fs_times[i],right_fs_times[i+1],
-                                                   context))
+                                                   context, trialContext=trialContext))
 
             return spatioTemporalCycles
         else:
@@ -863,24 +1114,21 @@ class GaitCyclesBuilder(CyclesBuilder):
         if self.kinematicTrials is not None:
             kinematicCycles=list()
             for trial in  self.kinematicTrials:
+                trialContext = self._getTrialContext(trial)
 
                 context = "Left"
-                left_fs_times=list()
-                for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Left"]]):
-                    left_fs_times.append(ev.time())
+                left_fs_times=trialContext.getFootStrikeTimes("Left")
 
                 for i in range(0, len(left_fs_times)-1):
                     kinematicCycles.append (GaitCycle(trial, left_fs_times[i],left_fs_times[i+1],
-                                                   context))
+                                                   context, trialContext=trialContext))
 
                 context = "Right"
-                right_fs_times=list()
-                for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Right"]]):
-                    right_fs_times.append(ev.time())
+                right_fs_times=trialContext.getFootStrikeTimes("Right")
 
                 for i in range(0, len(right_fs_times)-1):
                     kinematicCycles.append (GaitCycle(trial, right_fs_times[i],right_fs_times[i+1],
-                                                   context))
+                                                   context, trialContext=trialContext))
 
             return kinematicCycles
         else:
@@ -893,15 +1141,14 @@ class GaitCyclesBuilder(CyclesBuilder):
 
             kineticCycles=list()
             for trial in  self.kineticTrials:
+                trialContext = self._getTrialContext(trial)
 
                 flag_kinetics,times,times_left,times_right = trialTools.isKineticFlag(trial)
 
                 if flag_kinetics:
                     context = "Left"
                     count_L=0
-                    left_fs_times=list()
-                    for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Left"]]):
-                        left_fs_times.append(ev.time())
+                    left_fs_times=trialContext.getFootStrikeTimes("Left")
 
                     for i in range(0, len(left_fs_times)-1):
                         init =  left_fs_times[i]
@@ -912,7 +1159,7 @@ class GaitCyclesBuilder(CyclesBuilder):
                             if timeKinetic<=end and timeKinetic>=init:
                                 logging.debug("Left kinetic cycle found from %.2f to %.2f" %(left_fs_times[i], left_fs_times[i+1]))
                                 kineticCycles.append (GaitCycle(trial, left_fs_times[i],left_fs_times[i+1],
-                                                           context))
+                                                           context, trialContext=trialContext))
 
                                 count_L+=1
                     logging.debug("%i Left Kinetic cycles available" %(count_L))
@@ -921,9 +1168,7 @@ class GaitCyclesBuilder(CyclesBuilder):
 
                     context = "Right"
                     count_R=0
-                    right_fs_times=list()
-                    for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Right"]]):
-                        right_fs_times.append(ev.time())
+                    right_fs_times=trialContext.getFootStrikeTimes("Right")
 
                     for i in range(0, len(right_fs_times)-1):
                         init =  right_fs_times[i]
@@ -933,7 +1178,7 @@ class GaitCyclesBuilder(CyclesBuilder):
                             if timeKinetic<=end and timeKinetic>=init:
                                 logging.debug("Right kinetic cycle found from %.2f to %.2f" %(right_fs_times[i], right_fs_times[i+1]))
                                 kineticCycles.append (GaitCycle(trial, right_fs_times[i],right_fs_times[i+1],
-                                                           context))
+                                                           context, trialContext=trialContext))
                                 count_R+=1
                     logging.debug("%i Right Kinetic cycles available" %(count_R))
 
@@ -952,24 +1197,21 @@ class GaitCyclesBuilder(CyclesBuilder):
         if self.emgTrials is not None:
             emgCycles=list()
             for trial in  self.emgTrials:
+                trialContext = self._getTrialContext(trial)
 
                 context = "Left"
-                left_fs_times=list()
-                for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Left"]]):
-                    left_fs_times.append(ev.time())
+                left_fs_times=trialContext.getFootStrikeTimes("Left")
 
                 for i in range(0, len(left_fs_times)-1):
                     emgCycles.append (GaitCycle(trial, left_fs_times[i],left_fs_times[i+1],
-                                                   context))
+                                                   context, trialContext=trialContext))
 
                 context = "Right"
-                right_fs_times=list()
-                for ev in  trial.findChild(ma.T_Node,"SortedEvents").findChildren(ma.T_Event,"Foot Strike",[["context","Right"]]):
-                    right_fs_times.append(ev.time())
+                right_fs_times=trialContext.getFootStrikeTimes("Right")
 
                 for i in range(0, len(right_fs_times)-1):
                     emgCycles.append (GaitCycle(trial, right_fs_times[i],right_fs_times[i+1],
-                                                   context))
+                                                   context, trialContext=trialContext))
 
             return emgCycles
         else:
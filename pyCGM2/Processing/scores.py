@@ -25,6 +25,35 @@ class ScoreFilter(object):
         self.m_analysis.setGvs(descriptiveGvsStats)
 
 
+class MultipleScoreFilter(object):
+    """
+        Score several analyses against the same normative data in a single computation
+    """
+
+    def __init__(self, scoreProcedure, analyses, normativeProcedure):
+        """
+            :Parameters:
+                - `scoreProcedure` (CGM1_GPS) - score procedure
+                - `analyses` (list of pyCGM2.Processing.analysis.Analysis) - analysis instances
+                - `normativeProcedure` (pyCGM2.Report.normativeDatasets) - normative dataset procedure
+        """
+
+        self.m_score = scoreProcedure
+
+        # construct normative data
+        normativeProcedure.constructNormativeData()
+        self.m_normativeData =  normativeProcedure.data
+
+        self.m_analyses=analyses
+
+
+    def compute(self):
+        outputs = self.m_score.computeMultiple(self.m_analyses,self.m_normativeData)
+        for analysis,(descriptiveGvsStats,descriptiveGpsStats_context,descriptiveGpsStats) in zip(self.m_analyses,outputs):
+            analysis.setGps(descriptiveGpsStats,descriptiveGpsStats_context)
+            analysis.setGvs(descriptiveGvsStats)
+
+
 class CGM1_GPS(object):
 
 
@@ -52,109 +81,107 @@ class CGM1_GPS(object):
         self.axes = axes
 
     def compute(self,analysis,normativeData):
+        """
+            Compute GVS and GPS of an analysis
 
-        gvs = dict()
+            :Parameters:
+                - `analysis` (pyCGM2.Processing.analysis.Analysis) - analysis instance
+                - `normativeData` (dict) - normative data
 
-        nLeftCycles,nRightCycles = analysis.getKinematicCycleNumbers()
+            :Return:
+                - `outDict_gvs` (dict) - descriptive statistics of the gvs of each (label,context)
+                - `outDict_gps_context` (dict) - descriptive statistics of the gps of each context
+                - `outDict_gps` (dict) - descriptive statistics of the overall gps
+        """
+        return self.computeMultiple([analysis],normativeData)[0]
 
-        # --- MAP ---
-        # left cycles
-        for label,context in self.matchingNormativeDataLabel.keys():
-            matchingNormativeDataLabel = self.matchingNormativeDataLabel[label,context]
-            if context == "Left":
-                left_rms_local = np.zeros((nLeftCycles,3))
-                for i in range(0,nLeftCycles):
-                    values = analysis.kinematicStats.data[label, context]["values"][i]
-                    valuesNorm = normativeData[matchingNormativeDataLabel]["mean"]
+    def computeMultiple(self,analyses,normativeData):
+        """
+            Compute GVS and GPS of several analyses against the same normative data.
+            Cycles of all analyses are stacked, so each label is scored in a single array operation
 
-                    if valuesNorm.shape[0] == 51:
-                        rms = numeric.rms(values[0:101:2]-valuesNorm,axis=0)
-                    else:
-                        rms = numeric.rms(values-valuesNorm,axis=0)
+            :Parameters:
+                - `analyses` (list of pyCGM2.Processing.analysis.Analysis) - analysis instances
+                - `normativeData` (dict) - normative data
 
-                    left_rms_local[i,:] = rms
+            :Return:
+                - `outputs` (list) - (outDict_gvs, outDict_gps_context,outDict_gps) of each analysis ( see compute)
+        """
 
-                gvs[label,context]=left_rms_local
+        cycleNumbers = dict()
+        cycleNumbers["Left"],cycleNumbers["Right"] = [np.array(numbers) for numbers in zip(*[analysis.getKinematicCycleNumbers() for analysis in analyses])]
 
-
-        # right cycles
+        # --- MAP ---
+        # rms of each cycle of all analyses. array(cycles,3) per (label,context)
+        gvs = dict()
         for label,context in self.matchingNormativeDataLabel.keys():
-            matchingNormativeDataLabel = self.matchingNormativeDataLabel[label,context]
-            if context == "Right":
-                right_rms_local = np.zeros((nRightCycles,3))
-                for i in range(0,nRightCycles):
-                    values = analysis.kinematicStats.data[label, context]["values"][i]
-                    valuesNorm = normativeData[matchingNormativeDataLabel]["mean"]
-
-                    if valuesNorm.shape[0] == 51:
-                        rms = numeric.rms(values[0:101:2]-valuesNorm,axis=0)
-                    else:
-                        rms = numeric.rms(values-valuesNorm,axis=0)
-
-                    right_rms_local[i,:] = rms
-
-                gvs[label,context]=right_rms_local
+            valuesNorm = normativeData[self.matchingNormativeDataLabel[label,context]]["mean"]
 
+            tensor = np.concatenate([np.array(analysis.kinematicStats.data[label, context]["values"][0:n],dtype=float).reshape((n,101,3))
+                                     for analysis,n in zip(analyses,cycleNumbers[context])])
+            if valuesNorm.shape[0] == 51:
+                tensor = tensor[:,0:101:2,:]
 
+            gvs[label,context] = numeric.rms(tensor-valuesNorm,axis=1)
 
         # --- GPS ---
-
         # number of axis. 15 according articles ( left )
-        n_axis =0
-        for axis in self.axes:
-            n_axis = n_axis + len(self.axes[axis])
+        n_axis = sum([len(self.axes[axis]) for axis in self.axes])
 
-        # computation of rms for left cycles
-        left_rms_global = np.zeros((nLeftCycles,n_axis))
-        for i in range(0,nLeftCycles):
+        # global rms matrix(cycles,n_axis). unused columns stay at zero ( ex: no pelvis axes on the right side)
+        rms_global = dict()
+        for context in ["Left","Right"]:
+            rms_global[context] = np.zeros((cycleNumbers[context].sum(),n_axis))
             cumAxis =0
-            for label,context in  gvs.keys():
-                if context == "Left":
+            for label,context2 in gvs.keys():
+                if context2 == context:
                     axisIndex = self.axes[self.matchingNormativeDataLabel[label,context]] # use of the tip here
-                    for axis in axisIndex:
-                        left_rms_global[i,cumAxis] = gvs[label,context][i,axis]
-                        cumAxis+=1
+                    rms_global[context][:,cumAxis:cumAxis+len(axisIndex)] = gvs[label,context][:,axisIndex]
+                    cumAxis+=len(axisIndex)
 
-        # computation of rms for right cycles
-        right_rms_global = np.zeros((nRightCycles,n_axis))
-        for i in range(0,nRightCycles):
-            cumAxis =0
-            for label,context in  gvs.keys():
-                if context == "Right":
-                    axisIndex = self.axes[self.matchingNormativeDataLabel[label,context]]
-                    for axis in axisIndex:
-                        right_rms_global[i,cumAxis] = gvs[label,context][i,axis]
-                        cumAxis+=1
-
-
-        # output dictionnary
-        outDict_gvs = dict()
-        outDict_gps_context = dict()
-        outDict_gps = dict()
-
-        for label,context in self.matchingNormativeDataLabel.keys():
-            outDict_gvs[label,context]={'mean':np.mean(gvs[label, context],axis=0),
-                                          'std':np.std(gvs[label, context],axis=0),
-                                          'median': np.median(gvs[label, context],axis=0),
-                                          'values':gvs[label,context]}
+        gpsValues = dict()
         for context in ["Left","Right"]:
-            gpsValues = left_rms_global if context == "Left" else right_rms_global
-            # construction of the global dictionnary outputs
-            outDict_gps_context[context]={'mean':np.array([np.mean(gpsValues.mean(axis=1))]),
-                                      'std':np.array([np.std(gpsValues.mean(axis=1))]),
-                                       'median': np.array([np.median(gpsValues.mean(axis=1))]),
-                                       'values': gpsValues.mean(axis=1)}
+            gpsValues[context] = rms_global[context].mean(axis=1)
 
+        # output dictionnaries of each analysis
+        outputs = list()
+        splits = dict([(context,np.cumsum(cycleNumbers[context])[:-1]) for context in ["Left","Right"]])
 
-        overall_gps_values = np.concatenate((outDict_gps_context["Right"]["values"],outDict_gps_context["Left"]["values"]))
-
-
-        outDict_gps={'mean':np.array([np.mean(overall_gps_values)]),
-                          'std':np.array([np.std(overall_gps_values)]),
-                           'median': np.array([np.median(overall_gps_values)]),
-                           'values': overall_gps_values}
-
-        return outDict_gvs, outDict_gps_context,outDict_gps
+        analysisGvs = [dict() for analysis in analyses]
+        for label,context in self.matchingNormativeDataLabel.keys():
+            for i,values in enumerate(np.split(gvs[label,context],splits[context])):
+                analysisGvs[i][label,context] = values
+
+        analysisGps = dict([(context,np.split(gpsValues[context],splits[context])) for context in ["Left","Right"]])
+
+        for i in range(0,len(analyses)):
+            outDict_gvs = dict()
+            outDict_gps_context = dict()
+
+            for label,context in self.matchingNormativeDataLabel.keys():
+                values = analysisGvs[i][label,context]
+                outDict_gvs[label,context]={'mean':np.mean(values,axis=0),
+                                              'std':np.std(values,axis=0),
+                                              'median': np.median(values,axis=0),
+                                              'values':values}
+            for context in ["Left","Right"]:
+                values = analysisGps[context][i]
+                # construction of the global dictionnary outputs
+                outDict_gps_context[context]={'mean':np.array([np.mean(values)]),
+                                          'std':np.array([np.std(values)]),
+                                           'median': np.array([np.median(values)]),
+                                           'values': values}
+
+            overall_gps_values = np.concatenate((outDict_gps_context["Right"]["values"],outDict_gps_context["Left"]["values"]))
+
+            outDict_gps={'mean':np.array([np.mean(overall_gps_values)]),
+                              'std':np.array([np.std(overall_gps_values)]),
+                               'median': np.array([np.median(overall_gps_values)]),
+                               'values': overall_gps_values}
+
+            outputs.append((outDict_gvs, outDict_gps_context,outDict_gps))
+
+        return outputs
 
 
 class GDI(object):
@@ -65,69 +65,103 @@ def enveloppe(array, fc,fa):
 
 
 # ---- btkAcq -----
-def markerFiltering(btkAcq,markers,order=2, fc=6,zerosFiltering=True):
-
+def validSegments(validity):
     """
-        Low-pass filtering of all points in an acquisition
+        Get the boundaries of the consecutive valid samples
 
         :Parameters:
-            - `btkAcq` (btkAcquisition) - btk acquisition instance
-            - `fc` (double) - cut-off frequency
-            - `order` (double) - order of the low-pass filter
+            - `validity` (numpy.array(n,) of bool) - flag of valid samples
+
+        :Return:
+            - `segments` (list) - (begin,end) of each segment, end excluded
     """
+    padded = np.concatenate(([0],np.asarray(validity,dtype=int),[0]))
+    steps = np.diff(padded)
 
-    def filterZeros(array,b,a):
+    return zip(np.where(steps==1)[0],np.where(steps==-1)[0])
 
 
-        N = len(array)
-        indexes = range(0,N)
+def _zeroPhaseLowPass(data,coefficients,sos=False):
+    """
+        filtfilt of a block along axis 0. The padding is reduced for short blocks.
+    """
+    if sos:
+        ntaps = 2*coefficients.shape[0]+1 - min((coefficients[:,2]==0).sum(),(coefficients[:,5]==0).sum())
+        padlen = 3*ntaps # default as defined in https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.sosfiltfilt.html
+    else:
+        b, a = coefficients
+        padlen = 3 * max(len(a), len(b)) # default as defined in https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.filtfilt.html
 
-        for i in range(0,N):
-            if array[i] == 0:
-                indexes[i] = -1
+    if data.shape[0] <= padlen:
+        padlen = data.shape[0] - 1
 
+    if sos:
+        return signal.sosfiltfilt(coefficients, data ,padlen=padlen,axis=0)
+    else:
+        return signal.filtfilt(b, a, data ,padlen=padlen,axis=0)
 
-        splitdata = [x[x!=0] for x in np.split(array, np.where(array==0)[0]) if len(x[x!=0])]
-        splitIndexes = [x[x!=-1] for x in np.split(indexes, np.where(indexes==-1)[0]) if len(x[x!=-1])]
 
+def markerFiltering(btkAcq,markers,order=2, fc=6,zerosFiltering=True, sos=False):
 
-        filtValues_section=list()
-        for data in splitdata:
-            padlen = 3 * max(len(a), len(b)) # default as defined in https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.filtfilt.html
-            if len(data) <= padlen:
-                padlen = len(data) - 1
-            filtValues_section.append(signal.filtfilt(b, a, data ,padlen=padlen,axis=0))
+    """
+        Low-pass filtering of all points in an acquisition
 
-        indexes = np.concatenate(splitIndexes)
-        values = np.concatenate(filtValues_section)
+        :Parameters:
+            - `btkAcq` (btkAcquisition) - btk acquisition instance
+            - `markers` (list of str) - marker labels
+            - `fc` (double) - cut-off frequency
+            - `order` (double) - order of the low-pass filter
+            - `zerosFiltering` (bool) - filter each coordinate over its segments of non-zero values only
+            - `sos` (bool) - use second-order sections, numerically more stable with high orders
 
-        out = np.zeros((N))
-        j = 0
-        for i in indexes:
-            out[i] = values[j]
-            j+=1
-        return out
+        .. note:: with zerosFiltering, each coordinate is split at its zero values, which keep zero.
+            Coordinates sharing the same zero frames are filtered together
 
+    """
 
     fp=btkAcq.GetPointFrequency()
-    bPoint, aPoint = signal.butter(order, fc / (fp*0.5) , btype='lowpass')
+    if sos:
+        coefficients = signal.butter(order, fc / (fp*0.5) , btype='lowpass', output='sos')
+    else:
+        coefficients = signal.butter(order, fc / (fp*0.5) , btype='lowpass')
 
+    labels=list()
     for pointIt in btk.Iterate(btkAcq.GetPoints()):
         if pointIt.GetType() == btk.btkPoint.Marker and pointIt.GetLabel() in markers:
-            label = pointIt.GetLabel()
-            if zerosFiltering:
-                x = filterZeros(pointIt.GetValues()[:,0],bPoint,aPoint)
-                y = filterZeros(pointIt.GetValues()[:,1],bPoint,aPoint)
-                z = filterZeros(pointIt.GetValues()[:,2],bPoint,aPoint)
-            else:
-                x=signal.filtfilt(bPoint, aPoint, pointIt.GetValues()[:,0],axis=0  )
-                y=signal.filtfilt(bPoint, aPoint, pointIt.GetValues()[:,1],axis=0  )
-                z=signal.filtfilt(bPoint, aPoint, pointIt.GetValues()[:,2],axis=0  )
-
-            btkAcq.GetPoint(label).SetValues(np.array( [x,y,z] ).transpose())
-
-
-            # pointIt.SetValues(np.array( [x,y,z] ).transpose())
+            labels.append(pointIt.GetLabel())
+
+    if labels == []:
+        return
+
+    # all markers in a (frames , markers*3) array
+    values = np.zeros((btkAcq.GetPointFrameNumber(),3*len(labels)))
+    i=0
+    for label in labels:
+        values[:,3*i:3*i+3] = btkAcq.GetPoint(label).GetValues()
+        i+=1
+
+    if zerosFiltering:
+        filtValues = np.zeros(values.shape)
+        validity = values != 0
+
+        # group coordinates with identical zero frames
+        groups = dict()
+        for column in range(0,values.shape[1]):
+            key = validity[:,column].tostring()
+            if key not in groups:
+                groups[key] = list()
+            groups[key].append(column)
+
+        for columns in groups.values():
+            for begin,end in validSegments(validity[:,columns[0]]):
+                filtValues[begin:end,columns] = _zeroPhaseLowPass(values[begin:end][:,columns],coefficients,sos=sos)
+    else:
+        filtValues = _zeroPhaseLowPass(values,coefficients,sos=sos)
+
+    i=0
+    for label in labels:
+        btkAcq.GetPoint(label).SetValues(filtValues[:,3*i:3*i+3])
+        i+=1
 
 
 def forcePlateFiltering(btkAcq,order=4, fc =5):
@@ -125,23 +125,10 @@ def isPointExist(acq,label):
         :Parameters:
             - `acq` (btkAcquisition) - a btk acquisition inctance
             - `label` (str) - point label
+
+        .. note:: the label index of the acquisition is used ( see AcquisitionIndex)
     """
-    if acq.GetPointNumber()==0:
-        return False
-    else:
-        i = acq.GetPoints().Begin()
-        while i != acq.GetPoints().End():
-            if i.value().GetLabel()== utils.str(label):
-                flagPoint= True
-                break
-            else:
-                i.incr()
-                flagPoint= False
-
-        if flagPoint:
-            return True
-        else:
-            return False
+    return AcquisitionIndex(acq).isPointExist(label)
 
 def isPointsExist(acq,labels):
     """
@@ -168,34 +155,37 @@ def smartAppendPoint(acq,label,values, PointType=btk.btkPoint.Marker,desc="",res
             - `PointType` (enums of btk.btkPoint) - type of Point
     """
 
-    logging.debug("new point (%s) added to the c3d" % label)
+    AcquisitionIndex(acq).appendPoint(label,values, PointType=PointType,desc=desc,residuals = residuals)
 
-    # TODO : si value = 1 lignes alors il faudrait dupliquer la lignes pour les n franes
-    # valueProj *np.ones((aquiStatic.GetPointFrameNumber(),3))
 
-    values = np.nan_to_num(values)
+def smartAppendPoints(acq,outputs):
+    """
+        Append/Update several points inside an acquisition in a single pass
 
-    if residuals is None:
-        residuals = np.zeros((values.shape[0]))
-        for i in range(0, values.shape[0]):
-            if np.all(values[i,:] == np.zeros((3))):
-                residuals[i] = -1
-            else:
-                residuals[i] = 0
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `outputs` (dict) - (values, PointType, desc) or (values, PointType, desc, residuals) by point label
 
-    if isPointExist(acq,label):
-        acq.GetPoint(utils.str(label)).SetValues(values)
-        acq.GetPoint(utils.str(label)).SetDescription(utils.str(desc))
-        acq.GetPoint(utils.str(label)).SetType(PointType)
-        acq.GetPoint(utils.str(label)).SetResiduals(residuals)
+        .. note:: labels are looked up in an index built once ( see AcquisitionIndex). Missing residuals are -1 for zero values
 
-    else:
-        new_btkPoint = btk.btkPoint(utils.str(label),acq.GetPointFrameNumber())
-        new_btkPoint.SetValues(values)
-        new_btkPoint.SetDescription(utils.str(desc))
-        new_btkPoint.SetType(PointType)
-        new_btkPoint.SetResiduals(residuals)
-        acq.AppendPoint(new_btkPoint)
+    """
+    points = list()
+    for label,item in outputs.items():
+        points.append((label,)+tuple(item))
+
+    AcquisitionIndex(acq).appendPoints(points)
+
+
+def _defaultResiduals(values):
+    """ residual -1 for frames with zero values, 0 otherwise """
+    return np.where(np.all(values == 0,axis=1),-1.0,0.0)
+
+
+def _setPoint(point,values,PointType,desc,residuals):
+    point.SetValues(values)
+    point.SetDescription(utils.str(desc))
+    point.SetType(PointType)
+    point.SetResiduals(residuals)
 
 def clearPoints(acq, pointlabelList):
     """
@@ -217,10 +207,233 @@ def clearPoints(acq, pointlabelList):
             i.incr()
             logging.debug( label + " found")
 
-
+    AcquisitionIndex(acq).invalidate()
 
     return acq
 
+class _LabelIndex(object):
+    """
+        Labels of the points and analogs of an acquisition, stored on the acquisition proxy.
+
+        It holds no reference to the acquisition: btk proxies define __del__, so a reference cycle would never be collected.
+    """
+    def __init__(self):
+        self.m_points = None
+        self.m_pointNumber = None
+        self.m_analogs = None
+        self.m_analogNumber = None
+
+
+def _getLabelIndex(acq):
+    index = getattr(acq,"m_pyCGM2LabelIndex",None)
+    if index is None:
+        index = _LabelIndex()
+        acq.m_pyCGM2LabelIndex = index
+    return index
+
+
+class AcquisitionIndex(object):
+    """
+        Label index of the points and analogs of a btk acquisition.
+
+        Looking up a label with the btk iterators is a linear search. The index
+        walks the points and the analogs once, then existence checks and accesses
+        are dictionary lookups. One index is kept per acquisition, all AcquisitionIndex
+        instances of the same acquisition share it.
+
+        The index is updated by its own append methods and rebuilt after a removal.
+        It is also rebuilt if the number of points or analogs of the acquisition changed, or
+        if an indexed point was renamed. Call `invalidate` after any other direct modification
+        of the acquisition ( ex: a removal and an append of points with btk methods)
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition instance
+    """
+
+    def __init__(self,acq):
+        self.m_acq = acq
+        self.m_labels = _getLabelIndex(acq)
+
+    def invalidate(self):
+        """
+            Force the index to be rebuilt at next access
+        """
+        self.m_labels.m_points = None
+        self.m_labels.m_analogs = None
+
+    def _pointIndex(self):
+        labels = self.m_labels
+        if labels.m_points is None or labels.m_pointNumber != self.m_acq.GetPointNumber():
+            labels.m_points = dict()
+            for it in btk.Iterate(self.m_acq.GetPoints()):
+                if it.GetLabel() not in labels.m_points:
+                    labels.m_points[it.GetLabel()] = it
+            labels.m_pointNumber = self.m_acq.GetPointNumber()
+        return labels.m_points
+
+    def _analogIndex(self):
+        labels = self.m_labels
+        if labels.m_analogs is None or labels.m_analogNumber != self.m_acq.GetAnalogNumber():
+            labels.m_analogs = dict()
+            for it in btk.Iterate(self.m_acq.GetAnalogs()):
+                if it.GetLabel() not in labels.m_analogs:
+                    labels.m_analogs[it.GetLabel()] = it
+            labels.m_analogNumber = self.m_acq.GetAnalogNumber()
+        return labels.m_analogs
+
+    def _findPoint(self,label):
+        label = utils.str(label)
+        point = self._pointIndex().get(label)
+        if point is not None and point.GetLabel() != label: # renamed
+            self.m_labels.m_points = None
+            point = self._pointIndex().get(label)
+        return point
+
+    def _findAnalog(self,label):
+        label = utils.str(label)
+        analog = self._analogIndex().get(label)
+        if analog is not None and analog.GetLabel() != label: # renamed
+            self.m_labels.m_analogs = None
+            analog = self._analogIndex().get(label)
+        return analog
+
+    def isPointExist(self,label):
+        """
+            Check if a point label exists
+
+            :Parameters:
+                - `label` (str) - point label
+        """
+        return self._findPoint(label) is not None
+
+    def isPointsExist(self,labels):
+        """
+            Check if point labels exist
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+        """
+        for label in labels:
+            if not self.isPointExist(label):
+                logging.warning("[pyCGM2] markers (%s) doesn't exist"% label )
+                return False
+        return True
+
+    def getPoint(self,label):
+        """
+            Return a point
+
+            :Parameters:
+                - `label` (str) - point label
+        """
+        point = self._findPoint(label)
+        if point is None:
+            raise Exception("[pyCGM2] point (%s) doesn t exist in the acquisition"%(label))
+        return point
+
+    def isAnalogExist(self,label):
+        """
+            Check if an analog label exists
+
+            :Parameters:
+                - `label` (str) - analog label
+        """
+        return self._findAnalog(label) is not None
+
+    def getAnalog(self,label):
+        """
+            Return an analog
+
+            :Parameters:
+                - `label` (str) - analog label
+        """
+        analog = self._findAnalog(label)
+        if analog is None:
+            raise Exception("[pyCGM2] analog (%s) doesn t exist in the acquisition"%(label))
+        return analog
+
+    def appendPoint(self,label,values, PointType=btk.btkPoint.Marker,desc="",residuals = None):
+        """
+            Append/Update a point ( see smartAppendPoint)
+
+            :Parameters:
+                - `label` (str) - point label
+                - `values` (numpy.array(n,3)) - point values
+                - `PointType` (enums of btk.btkPoint) - type of Point
+                - `desc` (str) - description
+                - `residuals` (numpy.array(n,)) - residuals. if None, residuals are -1 for zero values
+        """
+
+        logging.debug("new point (%s) added to the c3d" % label)
+
+        values = np.nan_to_num(values)
+
+        if residuals is None:
+            residuals = _defaultResiduals(values)
+
+        point = self._findPoint(label)
+        if point is not None:
+            _setPoint(point,values,PointType,desc,residuals)
+        else:
+            new_btkPoint = btk.btkPoint(utils.str(label),self.m_acq.GetPointFrameNumber())
+            _setPoint(new_btkPoint,values,PointType,desc,residuals)
+            self.m_acq.AppendPoint(new_btkPoint)
+            self.m_labels.m_points[utils.str(label)] = new_btkPoint
+            self.m_labels.m_pointNumber+=1
+
+    def appendPoints(self,points):
+        """
+            Append/Update several points
+
+            :Parameters:
+                - `points` (list) - tuples (label, values, PointType, desc) or (label, values, PointType, desc, residuals)
+        """
+        for item in points:
+            residuals = item[4] if len(item) == 5 else None
+            self.appendPoint(item[0],item[1],PointType=item[2],desc=item[3],residuals=residuals)
+
+    def removePoint(self,label):
+        """
+            Remove a point
+
+            :Parameters:
+                - `label` (str) - point label
+        """
+        self.m_acq.RemovePoint(utils.str(label))
+        self.m_labels.m_points = None
+
+    def appendAnalog(self,label,values,desc=""):
+        """
+            Append/Update an analog ( see smartAppendAnalog)
+
+            :Parameters:
+                - `label` (str) - analog label
+                - `values` (numpy.array(n,1)) - analog values
+                - `desc` (str) - description
+        """
+        analog = self._findAnalog(label)
+        if analog is not None:
+            analog.SetValues(values)
+            analog.SetDescription(utils.str(desc))
+        else:
+            newAnalog=btk.btkAnalog(self.m_acq.GetAnalogFrameNumber())
+            newAnalog.SetValues(values)
+            newAnalog.SetLabel(utils.str(label))
+            self.m_acq.AppendAnalog(newAnalog)
+            self.m_labels.m_analogs[utils.str(label)] = newAnalog
+            self.m_labels.m_analogNumber+=1
+
+    def removeAnalog(self,label):
+        """
+            Remove an analog
+
+            :Parameters:
+                - `label` (str) - analog label
+        """
+        self.m_acq.RemoveAnalog(utils.str(label))
+        self.m_labels.m_analogs = None
+
+
 def checkFirstAndLastFrame (acq, markerLabel):
     """
         Check if extremity frames are correct
@@ -249,26 +462,30 @@ def isGap_inAcq(acq, markerList):
          if any(residualValues== -1.0):
              raise Exception("[pyCGM2] gap founded for markers %s " % m )
 
-def findValidFrames(acq,markerLabels):
+def getValidityMask(acq,markerLabels):
+    """
+        Build the visibility matrix of markers
 
-    flag = list()
-    for i in range(0,acq.GetPointFrameNumber()):
-        pointFlag=list()
-        for marker in markerLabels:
-            if acq.GetPoint(utils.str(marker)).GetResidual(i) >= 0 :
-                pointFlag.append(1)
-            else:
-                pointFlag.append(0)
-
-        if all(pointFlag)==1:
-            flag.append(1)
-        else:
-            flag.append(0)
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition instance
+            - `markerLabels` (list of str) - marker labels
+
+        :Return:
+            - `mask` (pyCGM2.Tools.btkTools.ValidityMask) - visibility matrix
+    """
 
-    firstValidFrame = flag.index(1)
-    lastValidFrame = len(flag) - flag[::-1].index(1) - 1
+    mask = np.zeros((acq.GetPointFrameNumber(),len(markerLabels)),dtype=bool)
+    j=0
+    for marker in markerLabels:
+        mask[:,j] = acq.GetPoint(utils.str(marker)).GetResiduals()[:,0] >= 0
+        j+=1
 
-    return flag,firstValidFrame,lastValidFrame
+    return ValidityMask(markerLabels,mask)
+
+
+def findValidFrames(acq,markerLabels):
+
+    return getValidityMask(acq,markerLabels).findValidFrames()
 
 
 def applyValidFramesOnOutput(acq,validFrames):
@@ -278,8 +495,7 @@ def applyValidFramesOnOutput(acq,validFrames):
     for it in btk.Iterate(acq.GetPoints()):
         if it.GetType() in [btk.btkPoint.Angle, btk.btkPoint.Force, btk.btkPoint.Moment,btk.btkPoint.Power]:
             values = it.GetValues()
-            for i in range(0,3):
-                values[:,i] =  values[:,i] * validFrames
+            values[:,0:3] =  values[:,0:3] * validFrames[:,np.newaxis]
             it.SetValues(values)
 
 def checkMultipleSubject(acq):
@@ -338,6 +554,7 @@ def applyTranslators(acq, translators):
                             acqClone.GetPoint(utils.str("TMP")).SetLabel(initialLabel)
                             acqClone.RemovePoint(utils.str(wantedLabel+"_origin"))
                             acqClone.RemovePoint(utils.str(initialLabel+"_origin"))
+                            AcquisitionIndex(acqClone).invalidate()
                     else:
                         logging.warning("Initial point (%s) renamed (%s)  added into the c3d" %((initialLabel), (wantedLabel)))
                         smartAppendPoint(acqClone,(wantedLabel),acq.GetPoint(utils.str(initialLabel)).GetValues(),PointType=btk.btkPoint.Marker)
@@ -462,47 +679,326 @@ def getVisibleMarkersAtFrame(acq,markers,index):
     return visibleMarkers
 
 
+class ValidityMask(object):
+    """
+        Visibility of markers, as a (frames , markers) boolean matrix.
 
+        A marker is visible at a frame if its residual is non-negative.
+        Residuals are read once, then valid frames and visible markers are deduced from the matrix.
 
-def isAnalogExist(acq,label):
+        :Parameters:
+            - `markerLabels` (list of str) - marker labels, i.e. the matrix columns
+            - `mask` (numpy.array(n,m) of bool) - visibility matrix
     """
-        Check if a point label exists inside an acquisition
+
+    def __init__(self,markerLabels,mask):
+        self.m_labels = list(markerLabels)
+        self.m_mask = np.asarray(mask,dtype=bool)
+
+        self.m_index = dict()
+        j=0
+        for label in self.m_labels:
+            self.m_index[label] = j
+            j+=1
+
+    def _getColumns(self,labels):
+        if labels is None:
+            return range(0,len(self.m_labels))
+        columns = list()
+        for label in labels:
+            if label not in self.m_index:
+                raise Exception("[pyCGM2] marker (%s) not in the validity mask"%(label))
+            columns.append(self.m_index[label])
+        return columns
+
+    def getMask(self,labels=None):
+        """
+            Return the visibility matrix
+
+            :Parameters:
+                - `labels` (list of str) - marker labels ( all markers if None)
+        """
+        return self.m_mask[:,self._getColumns(labels)]
+
+    def getFrameFlags(self,labels=None):
+        """
+            Return flags of frames where all markers are visible
+
+            :Parameters:
+                - `labels` (list of str) - marker labels ( all markers if None)
+        """
+        return np.all(self.getMask(labels),axis=1)
+
+    def findValidFrames(self,labels=None):
+        """
+            Find frames where all markers are visible
+
+            :Parameters:
+                - `labels` (list of str) - marker labels ( all markers if None)
+
+            :Return:
+                - `flag` (list of int) - 1 if all markers are visible
+                - `firstValidFrame` (int) - first valid frame
+                - `lastValidFrame` (int) - last valid frame
+        """
+        flags = self.getFrameFlags(labels)
+        validIndexes = np.where(flags)[0]
+        if validIndexes.shape[0] == 0:
+            raise ValueError("[pyCGM2] no frame with all markers visible")
+
+        flag = flags.astype(int).tolist()
+
+        return flag,int(validIndexes[0]),int(validIndexes[-1])
+
+    def getVisibleMarkersAtFrame(self,index,labels=None):
+        """
+            Return the visible markers at a given frame
+
+            :Parameters:
+                - `index` (int) - frame index
+                - `labels` (list of str) - marker labels ( all markers if None)
+        """
+        columns = self._getColumns(labels)
+        return [self.m_labels[j] for j in columns if self.m_mask[index,j]]
+
+    def applyValidFramesOnOutput(self,acq,labels=None):
+        """
+            Zero model outputs ( angle, force, moment, power) at frames with a missing marker
+
+            :Parameters:
+                - `acq` (btkAcquisition) - a btk acquisition instance
+                - `labels` (list of str) - marker labels ( all markers if None)
+        """
+        applyValidFramesOnOutput(acq,self.getFrameFlags(labels).astype(int))
+
+
+class MarkerBlock(object):
+    """
+        Snapshot of point trajectories of a btk acquisition.
+
+        `GetPoint(label).GetValues()` copies the whole trajectory out of btk.
+        A MarkerBlock copies each trajectory once, then serves rows or whole
+        arrays from memory. Points are loaded on first access.
+        Modified or new points are flagged as dirty and pushed back to the
+        acquisition with `writeBack`.
 
         :Parameters:
-            - `acq` (btkAcquisition) - a btk acquisition inctance
-            - `label` (str) - point label
+            - `acq` (btkAcquisition) - a btk acquisition instance
+            - `labels` (list of str) - point labels to load at construction. If None, points are loaded on demand
     """
-    #TODO : replace by btkIterate
-    i = acq.GetAnalogs().Begin()
-    while i != acq.GetAnalogs().End():
-        if i.value().GetLabel()==utils.str(label):
-            flag= True
-            break
+
+    def __init__(self,acq,labels=None):
+        self.m_acq = acq
+        self.m_frameNumber = acq.GetPointFrameNumber()
+
+        self.m_index = dict()
+        self._values = list()
+        self._residuals = list()
+        self._descriptions = list()
+        self._types = list()
+        self.m_dirty = set()
+
+        if labels is not None:
+            for label in labels:
+                self._load(label)
+
+    def _load(self,label):
+        label = utils.str(label)
+        point = AcquisitionIndex(self.m_acq).getPoint(label)
+
+        self.m_index[label] = len(self._values)
+        self._values.append(point.GetValues())
+        self._residuals.append(point.GetResiduals()[:,0])
+        self._descriptions.append(point.GetDescription())
+        self._types.append(point.GetType())
+
+        return self.m_index[label]
+
+    def _getIndex(self,label):
+        label = utils.str(label)
+        if label in self.m_index:
+            return self.m_index[label]
+        if isPointExist(self.m_acq,label):
+            return self._load(label)
+        raise Exception("[pyCGM2] point (%s) doesn t exist in the acquisition"%(label))
+
+    def isPointExist(self,label):
+        """
+            Check if a point is available from the block or its acquisition
+
+            :Parameters:
+                - `label` (str) - point label
+        """
+        return utils.str(label) in self.m_index or isPointExist(self.m_acq,label)
+
+    def getLabels(self):
+        """ return labels of loaded points """
+        return sorted(self.m_index, key=self.m_index.get)
+
+    def getValues(self,label):
+        """
+            Return the trajectory of a point
+
+            :Parameters:
+                - `label` (str) - point label
+
+            :Return:
+                - `values` (numpy.array(n,3)) - trajectory. Don t modify it in place, use setValues instead
+        """
+        return self._values[self._getIndex(label)]
+
+    def getResiduals(self,label):
+        """
+            Return residuals of a point
+
+            :Parameters:
+                - `label` (str) - point label
+
+            :Return:
+                - `residuals` (numpy.array(n)) - residuals
+        """
+        return self._residuals[self._getIndex(label)]
+
+    def getFrame(self,labels,index):
+        """
+            Return positions of several points at a given frame
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+                - `index` (int) - frame index
+
+            :Return:
+                - `positions` (numpy.array(len(labels),3)) - point positions
+        """
+        out = np.zeros((len(labels),3))
+        for j,label in enumerate(labels):
+            out[j,:] = self._values[self._getIndex(label)][index,:]
+        return out
+
+    def getArray(self,labels):
+        """
+            Stack trajectories of several points
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+
+            :Return:
+                - `values` (numpy.array(n,len(labels),3)) - stacked trajectories
+        """
+        out = np.zeros((self.m_frameNumber,len(labels),3))
+        for j,label in enumerate(labels):
+            out[:,j,:] = self._values[self._getIndex(label)]
+        return out
+
+    def getVisibility(self,labels):
+        """
+            Return visibility of several points, ie a non-negative residual
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+
+            :Return:
+                - `visibility` (numpy.array(n,len(labels)) of bool) - visibility flags
+        """
+        out = np.zeros((self.m_frameNumber,len(labels)),dtype=bool)
+        for j,label in enumerate(labels):
+            out[:,j] = self._residuals[self._getIndex(label)] != -1
+        return out
+
+    def getValidityMask(self,labels):
+        """
+            Return the validity mask of several points
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+        """
+        return ValidityMask(labels,self.getVisibility(labels))
+
+    def getVisibleMarkersAtFrame(self,labels,index):
+        """
+            Return the visible points, ie with a non-negative residual, at a given frame
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+                - `index` (int) - frame index
+        """
+        return [label for label in labels if self._residuals[self._getIndex(label)][index] != -1]
+
+    def setValues(self,label,values,residuals=None,desc=None,PointType=None):
+        """
+            Set the trajectory of a point. The acquisition is updated only when `writeBack` is called
+
+            :Parameters:
+                - `label` (str) - point label
+                - `values` (numpy.array(n,3)) - trajectory
+                - `residuals` (numpy.array(n)) - residuals. If None, zero rows are flagged with -1
+                - `desc` (str) - description. If None, the former one is kept
+                - `PointType` (enums of btk.btkPoint) - type of Point. If None, the former one is kept
+        """
+        label = utils.str(label)
+        values = np.nan_to_num(np.asarray(values,dtype=float))
+
+        if values.shape != (self.m_frameNumber,3):
+            raise Exception("[pyCGM2] values of point (%s) must be a (%i,3) array"%(label,self.m_frameNumber))
+
+        if residuals is None:
+            residuals = np.where(np.all(values==0,axis=1),-1.0,0.0)
         else:
-            i.incr()
-            flag= False
+            residuals = np.asarray(residuals,dtype=float).reshape(self.m_frameNumber)
 
-    if flag:
-        return True
-    else:
-        return False
+        if label not in self.m_index and isPointExist(self.m_acq,label):
+            self._load(label)
 
+        if label in self.m_index:
+            index = self.m_index[label]
+            self._values[index] = values
+            self._residuals[index] = residuals
+            if desc is not None: self._descriptions[index] = desc
+            if PointType is not None: self._types[index] = PointType
+        else:
+            self.m_index[label] = len(self._values)
+            self._values.append(values)
+            self._residuals.append(residuals)
+            self._descriptions.append(desc if desc is not None else "")
+            self._types.append(PointType if PointType is not None else btk.btkPoint.Marker)
 
+        self.m_dirty.add(label)
 
-def smartAppendAnalog(acq,label,values,desc="" ):
+    def writeBack(self):
+        """
+            Push dirty points to the acquisition
+        """
+        points = list()
+        for label in self.getLabels():
+            if label in self.m_dirty:
+                index = self.m_index[label]
+                points.append((label,self._values[index],self._types[index],self._descriptions[index],self._residuals[index]))
 
-    if isAnalogExist(acq,label):
-        acq.GetAnalog(utils.str(label)).SetValues(values)
-        acq.GetAnalog(utils.str(label)).SetDescription(utils.str(desc))
-        #acq.GetAnalog(label).SetType(PointType)
+        if points != []:
+            AcquisitionIndex(self.m_acq).appendPoints(points)
+        self.m_dirty.clear()
 
-    else:
-        newAnalog=btk.btkAnalog(acq.GetAnalogFrameNumber())
-        newAnalog.SetValues(values)
-        newAnalog.SetLabel(utils.str(label))
-        acq.AppendAnalog(newAnalog)
 
 
+
+def isAnalogExist(acq,label):
+    """
+        Check if an analog label exists inside an acquisition
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `label` (str) - analog label
+
+        .. note:: the label index of the acquisition is used ( see AcquisitionIndex)
+    """
+    return AcquisitionIndex(acq).isAnalogExist(label)
+
+
+
+def smartAppendAnalog(acq,label,values,desc="" ):
+
+    AcquisitionIndex(acq).appendAnalog(label,values,desc=desc)
+
 def markerUnitConverter(acq,unitOffset):
     for it in btk.Iterate(acq.GetPoints()):
         if it.GetType() == btk.btkPoint.Marker:
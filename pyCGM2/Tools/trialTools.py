@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 import numpy as np
+import weakref
 import matplotlib.pyplot as plt
 import logging
 
@@ -12,10 +13,147 @@ from pyCGM2.ma import io
 from pyCGM2.ma import body
 from pyCGM2 import btk
 from pyCGM2.Utils import utils
+from pyCGM2.Tools import btkTools
 
 
 
 
+# time sequence indexes by address of the openma trial. An index is shared by all proxies of a trial
+_TIME_SEQUENCE_INDEXES = weakref.WeakValueDictionary()
+
+
+class TimeSequenceIndex(object):
+    """
+        Label -> time sequence dictionary of a trial.
+
+        The index avoids a tree search of the trial for each access to a time sequence.
+        Data arrays are extracted once and shared, read-only, by all readers.
+        The index is rebuilt when the timestamp of the trial changes ( openma propagates modifications of a node to its parents).
+    """
+
+    def __init__(self,trial):
+        """
+            :Parameters:
+                - `trial` (openma.trial) - an openma trial instance
+        """
+        # weak references. the index is attached to the trial proxies, strong ones would make uncollectable cycles
+        self.m_trials = [weakref.ref(trial)]
+        self.m_timestamp = None
+        self.m_timeSequences = dict()
+        self.m_data = dict()
+
+        self.invalidate()
+
+    def _addTrial(self,trial):
+        self.m_trials.append(weakref.ref(trial))
+
+    def _getTrial(self):
+        for ref in self.m_trials:
+            trial = ref()
+            if trial is not None:
+                return trial
+        raise Exception("[pyCGM2] the trial of the time sequence index doesn t exist anymore")
+
+    def _update(self):
+        trial = self._getTrial()
+        if trial.timestamp() != self.m_timestamp:
+            self.invalidate()
+
+    def invalidate(self):
+        """
+            Rebuild the index from the trial. Arrays previously returned by `getData` are not updated
+        """
+        trial = self._getTrial()
+
+        self.m_timeSequences = dict()
+        self.m_data = dict()
+        for ts in trial.findChildren(ma.T_TimeSequence):
+            # keep the first one, as findChild does
+            if ts.name() not in self.m_timeSequences:
+                self.m_timeSequences[ts.name()] = ts
+
+        self.m_timestamp = trial.timestamp()
+
+    def getTimeSequence(self,label):
+        """
+            Get a time sequence. None if the time sequence doesn t exist
+
+            :Parameters:
+                - `label` (str) - label of the time sequence
+        """
+        self._update()
+
+        key = utils.str(label)
+        if key not in self.m_timeSequences:
+            # time sequence added without a modification of the trial timestamp
+            try:
+                self.m_timeSequences[key] = self._getTrial().findChild(ma.T_TimeSequence,key)
+            except ValueError:
+                return None
+
+        return self.m_timeSequences[key]
+
+    def isTimeSequenceExist(self,label):
+        return self.getTimeSequence(label) is not None
+
+    def getData(self,label):
+        """
+            Get data of a time sequence. The array is extracted once, readers get read-only views of the same array
+
+            :Parameters:
+                - `label` (str) - label of the time sequence
+
+            :Return:
+                - `data` (numpy.array) - read-only data. None if the time sequence doesn t exist
+        """
+        ts = self.getTimeSequence(label)
+        if ts is None:
+            return None
+
+        key = utils.str(label)
+        if key not in self.m_data:
+            data = ts.data()
+            data.flags.writeable = False
+            self.m_data[key] = data
+
+        return self.m_data[key]
+
+
+def getTimeSequenceIndex(trial):
+    """
+        Get the time sequence index of a trial. The index is built and attached if needed
+
+        :Parameters:
+            - `trial` (openma.trial) - an openma trial instance
+
+        :Return:
+            - `index` (TimeSequenceIndex) - time sequence index
+
+        .. note:: different proxies of the same trial ( ex: two calls of findChild) share the same index
+    """
+    index = _findTimeSequenceIndex(trial)
+    if index is None:
+        index = TimeSequenceIndex(trial)
+        _TIME_SEQUENCE_INDEXES[int(trial.this)] = index
+        trial.m_timeSequenceIndex = index
+
+    return index
+
+
+def _findTimeSequenceIndex(trial):
+    """
+        Get the time sequence index of a trial, None if no proxy of the trial has one
+    """
+    index = getattr(trial,"m_timeSequenceIndex",None)
+    if index is None:
+        index = _TIME_SEQUENCE_INDEXES.get(int(trial.this))
+        if index is not None:
+            index._addTrial(trial)
+            trial.m_timeSequenceIndex = index
+
+    return index
+
+
 def isTimeSequenceExist(trial,label):
     """
         Check if a Time sequence exists inside a trial
@@ -23,7 +161,13 @@ def isTimeSequenceExist(trial,label):
         :Parameters:
             - `trial` (openma.trial) - an openma trial instance
             - `label` (str) - label of the time sequence
+
+        .. note:: the time sequence index of the trial is used if the trial has one
     """
+    index = _findTimeSequenceIndex(trial)
+    if index is not None:
+        return index.isTimeSequenceExist(label)
+
     try:
         ts = trial.findChild(ma.T_TimeSequence,utils.str(label))
         return True
@@ -128,6 +272,7 @@ def automaticKineticDetection(dataPath,filenames,trials=None):
         :Parameters:
             - `dataPath` (str) - folder path
             - `filenames` (list of str) - filename of the different acquisitions
+            - `trials` (list of openma.trial) - trials with sorted events, matching filenames. Files are read if None
     """
     kineticTrials=[]
     kineticFilenames=[]
@@ -140,17 +285,17 @@ def automaticKineticDetection(dataPath,filenames,trials=None):
             if trials is None:
                 fileNode = ma.io.read(utils.str((dataPath + filename)))
                 trial = fileNode.findChild(ma.T_Trial)
-
+                sortedEvents(trial)
             else:
+                # input trials have already got their sorted events
                 trial = trials[i]
 
-            sortedEvents(trial)
             flag_kinetics,times, times_l, times_r = isKineticFlag(trial)
 
             if flag_kinetics:
                 kineticFilenames.append(filename)
                 kineticTrials.append(trial)
-    i+=1
+        i+=1
 
     kineticTrials = None if kineticTrials ==[] else kineticTrials
     flag_kinetics = False if kineticTrials ==[] else True
@@ -208,6 +353,7 @@ def buildTrials(dataPath,trialfilenames):
         fileNode = ma.io.read(utils.str((dataPath + filename)))
         trial = fileNode.findChild(ma.T_Trial)
         sortedEvents(trial)
+        getTimeSequenceIndex(trial)
 
         trials.append(trial)
         filenames.append(filename)
@@ -225,34 +371,36 @@ def smartTrialReader(dataPath,trialfilename):
 
     trial = fileNode.findChild(ma.T_Trial)
     sortedEvents(trial)
+    getTimeSequenceIndex(trial)
     return trial
 
 def smartTrialWriter(root,dataPath,filename):
     ma.io.write(root,utils.str(dataPath+filename))
 
-def findValidFrames(trial,markerLabels):
+def getValidityMask(trial,markerLabels):
+    """
+        Build the visibility matrix of markers
 
-    flag = list()
+        :Parameters:
+            - `trial` (openma.trial) - an openma trial instance
+            - `markerLabels` (list of str) - marker labels
+
+        :Return:
+            - `mask` (pyCGM2.Tools.btkTools.ValidityMask) - visibility matrix
+    """
     pfn = trial.findChild(ma.T_TimeSequence,utils.str(""),[[utils.str("type"),ma.TimeSequence.Type_Marker]]).samples()
-    for i in range(0,pfn):
-        pointFlag=list()
-        for marker in markerLabels:
-            residue = trial.findChild(ma.T_TimeSequence,utils.str(marker)).data()[i,3]
-            if residue >= 0 :
-                pointFlag.append(1)
-            else:
-                pointFlag.append(0)
 
-        if all(pointFlag)==1:
-            flag.append(1)
-        else:
-            flag.append(0)
+    mask = np.zeros((pfn,len(markerLabels)),dtype=bool)
+    j=0
+    for marker in markerLabels:
+        mask[:,j] = trial.findChild(ma.T_TimeSequence,utils.str(marker)).data()[:,3] >= 0
+        j+=1
 
+    return btkTools.ValidityMask(markerLabels,mask)
 
-    firstValidFrame = flag.index(1)
-    lastValidFrame = len(flag) - flag[::-1].index(1) - 1
+def findValidFrames(trial,markerLabels):
 
-    return flag,firstValidFrame,lastValidFrame
+    return getValidityMask(trial,markerLabels).findValidFrames()
 
 
 def convertBtkAcquisition(acq, returnType = "Trial"):
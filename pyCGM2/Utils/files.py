@@ -3,6 +3,7 @@ import cPickle
 import logging
 import json
 import os
+import struct
 from shutil import copyfile
 from collections import OrderedDict
 import shutil
@@ -56,7 +57,21 @@ def readContent(stringContent):
 
 
 
+# model file : header, schema version, binary pickle of the model calibration state
+MODEL_FILE_HEADER = b"pyCGM2.model"
+MODEL_FILE_VERSION = 1
+
+
 def loadModel(path,FilenameNoExt):
+    """
+        Load a calibrated model
+
+        :Parameters:
+            - `path` (str) - folder path
+            - `FilenameNoExt` (str) - filename without extension. If None, *pyCGM2.model* is loaded
+
+        .. note:: text-pickled model files of previous pyCGM2 versions are still supported.
+    """
     if FilenameNoExt is not None:
         filename = FilenameNoExt + "-pyCGM2.model"
     else:
@@ -66,13 +81,30 @@ def loadModel(path,FilenameNoExt):
     if not os.path.isfile((path + filename)):
         raise Exception ("%s-pyCGM2.model file doesn't exist. Run CGM Calibration operation"%filename)
     else:
-        f = open((path+filename), 'r')
-        model = cPickle.load(f)
+        f = open((path+filename), 'rb')
+        if f.read(len(MODEL_FILE_HEADER)) == MODEL_FILE_HEADER:
+            version = struct.unpack("<I",f.read(4))[0]
+            if version > MODEL_FILE_VERSION:
+                f.close()
+                raise Exception ("[pyCGM2] model file version (%i) not supported. Update pyCGM2"%(version))
+            model = cPickle.load(f)
+        else:
+            f.close()
+            f = open((path+filename), 'r')
+            model = cPickle.load(f)
         f.close()
 
         return model
 
 def saveModel(model,path,FilenameNoExt):
+    """
+        Save the calibration state of a model. Motion data of the model are not saved
+
+        :Parameters:
+            - `model` (pyCGM2.Model.model.Model) - model instance
+            - `path` (str) - folder path
+            - `FilenameNoExt` (str) - filename without extension. If None, *pyCGM2.model* is written
+    """
 
     if FilenameNoExt is not None:
         filename = FilenameNoExt + "-pyCGM2.model"
@@ -84,12 +116,27 @@ def saveModel(model,path,FilenameNoExt):
         logging.warning("previous model removed")
         os.remove((path + filename))
 
-    modelFile = open((path+filename), "w")
-    cPickle.dump(model, modelFile)
+    modelFile = open((path+filename), "wb")
+    modelFile.write(MODEL_FILE_HEADER)
+    modelFile.write(struct.pack("<I",MODEL_FILE_VERSION))
+    cPickle.dump(model.getCalibrationCopy(), modelFile, cPickle.HIGHEST_PROTOCOL)
     modelFile.close()
 
 
-def loadAnalysis(path,FilenameNoExt):
+def loadAnalysis(path,FilenameNoExt,mmap=True):
+    """
+        Load an analysis instance
+
+        :Parameters:
+            - `path` (str) - folder path
+            - `FilenameNoExt` (str) - filename without extension. If None, *pyCGM2.analysis* is loaded
+            - `mmap` (bool) - memory-map statistics instead of reading them
+
+        .. note:: statistics of a columnar analysis file are only read on access.
+                  Pickled analysis files of previous pyCGM2 versions are still supported.
+    """
+    from pyCGM2.Processing import analysisStorage # avoid importing openma with the files module
+
     if FilenameNoExt is not None:
         filename = FilenameNoExt + "-pyCGM2.analysis"
     else:
@@ -98,6 +145,8 @@ def loadAnalysis(path,FilenameNoExt):
     # --------------------pyCGM2 MODEL ------------------------------
     if not os.path.isfile((path + filename)):
         raise Exception ("%s-pyCGM2.analysis file doesn't exist"%filename)
+    elif analysisStorage.isAnalysisFile(path + filename):
+        return analysisStorage.readAnalysis(path + filename,mmap=mmap)
     else:
         f = open((path+filename), 'r')
         analysis = cPickle.load(f)
@@ -106,20 +155,33 @@ def loadAnalysis(path,FilenameNoExt):
         return analysis
 
 def saveAnalysis(analysisInstance,path,FilenameNoExt):
+    """
+        Save an analysis instance as a columnar analysis file
+
+        :Parameters:
+            - `analysisInstance` (pyCGM2.Processing.analysis.Analysis) - analysis instance
+            - `path` (str) - folder path
+            - `FilenameNoExt` (str) - filename without extension. If None, *pyCGM2.analysis* is written
+    """
+    from pyCGM2.Processing import analysisStorage # avoid importing openma with the files module
 
     if FilenameNoExt is not None:
         filename = FilenameNoExt + "-pyCGM2.analysis"
     else:
         filename = "pyCGM2.analysis"
 
+    # write first. a lazily-loaded analysis may still read the previous file
+    analysisStorage.writeAnalysis(analysisInstance,path+filename+".tmp")
+
+    # analyses loaded from the previous file are loaded in memory. a mapped file can not be removed on windows
+    analysisStorage.releaseFile(path+filename)
+
     #pyCGM2.model
     if os.path.isfile((path + filename)):
         logging.warning("previous analysis removed")
         os.remove((path + filename))
 
-    analysisFile = open((path+filename), "w")
-    cPickle.dump(analysisInstance, analysisFile)
-    analysisFile.close()
+    os.rename(path+filename+".tmp",path+filename)
 
 
 def openJson(path,filename):
@@ -5,6 +5,7 @@ import scipy as sp
 import matplotlib.pyplot as plt
 from pyCGM2.Math import numeric
 import logging
+from pyCGM2 import btk
 from pyCGM2.Utils import utils
 
 
@@ -25,6 +26,39 @@ def test_point_rms(acq,RefLabel,LabelToTest,threshold):
 
 
 
+#---------DATA----------
+def syntheticAcquisition(values,pointFrequency=100,labels=None,gaps=None):
+    """
+        Build an acquisition from marker trajectories
+
+        :Parameters:
+            - `values` (numpy.array(n,3*m)) - trajectories of m markers
+            - `pointFrequency` (double) - point frequency
+            - `labels` (list of str) - [optional] marker labels. *M0*, *M1*... by default
+            - `gaps` (list of tuple) - [optional] gaps as (marker index, first frame, end frame excluded). Values are set to zero and residuals to -1
+    """
+    frameNumber = values.shape[0]
+    markerNumber = values.shape[1]//3
+    if labels is None:
+        labels = ["M%i"%(i) for i in range(0,markerNumber)]
+
+    acq = btk.btkAcquisition()
+    acq.Init(markerNumber,frameNumber)
+    acq.SetPointFrequency(pointFrequency)
+    for i in range(0,markerNumber):
+        markerValues = np.array(values[:,3*i:3*i+3],copy=True)
+        residuals = np.zeros((frameNumber,1))
+        if gaps is not None:
+            for index,begin,end in gaps:
+                if index == i:
+                    markerValues[begin:end,:] = 0
+                    residuals[begin:end,:] = -1
+        acq.GetPoint(i).SetLabel(utils.str(labels[i]))
+        acq.GetPoint(i).SetValues(markerValues)
+        acq.GetPoint(i).SetResiduals(residuals)
+    return acq
+
+
 #---------DISPLAY----------
 def print_offset(value,acq,viconLabel, decimal=3):
     logging.info(" offset [%s] => %f ( my value) = %f ( reference)"%(viconLabel,